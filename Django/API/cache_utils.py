@@ -0,0 +1,22 @@
+# API/cache_utils.py
+from django.core.cache import cache
+from django.db import transaction
+
+
+def incr(key, timeout=None, delta=1):
+    """
+    Incremento atómico que crea la clave si falta: add + incr es atómico en
+    memcached/redis y no necesita bloqueo. Devuelve el valor nuevo.
+    """
+    cache.add(key, 0, timeout=timeout)
+    try:
+        return cache.incr(key, delta)
+    except ValueError:
+        # La clave expiró (o fue desalojada) entre add e incr
+        cache.set(key, delta, timeout=timeout)
+        return delta
+
+
+def bump_version(key):
+    """Sube el contador de versión `key` cuando la transacción actual confirma."""
+    transaction.on_commit(lambda: incr(key))
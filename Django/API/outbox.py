@@ -0,0 +1,93 @@
+# API/outbox.py
+"""
+Piezas comunes de las colas salientes (WhatsApp, correo). Los modelos tienen
+status ('pending' | 'sent' | 'dead'), attempts, next_attempt_at, last_error
+y sent_at.
+"""
+import time
+from collections import Counter
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+LEASE = timedelta(minutes=5)
+
+
+def backoff(attempts):
+    """30 s, 1 min, 2 min, ... hasta 1 hora."""
+    return timedelta(seconds=min(30 * 2 ** (attempts - 1), 3600))
+
+
+@transaction.atomic
+def claim(queryset, batch_size, expired=None):
+    """
+    Reclama hasta `batch_size` filas vencidas: adelanta su próximo intento
+    (lease) y cuenta el intento. skip_locked permite varios despachadores; si
+    uno muere, sus filas vuelven a vencer al terminar el lease.
+
+    `expired(row, now)` descarta sin enviar las filas cuyo contenido ya no sirve.
+    """
+    now = timezone.now()
+    rows = list(
+        queryset.select_for_update(skip_locked=True)
+        .filter(status='pending', next_attempt_at__lte=now)
+        .order_by('next_attempt_at', 'id')[:batch_size]
+    )
+    claimed = []
+    for row in rows:
+        if expired and expired(row, now):
+            row.status, row.last_error = 'dead', row.last_error or 'Caducado antes de enviarse.'
+            continue
+        row.attempts += 1
+        row.next_attempt_at = now + LEASE
+        claimed.append(row)
+    queryset.model.objects.bulk_update(rows, ['status', 'last_error', 'attempts', 'next_attempt_at'])
+    return claimed
+
+
+def settle(rows, errors, max_attempts, give_up=None):
+    """
+    Guarda el resultado de cada fila (error o None) con un solo bulk_update:
+    enviada, reintento con backoff, o descartada al agotar los intentos o si
+    `give_up(row, next_attempt_at)` lo indica.
+    """
+    now, counts = timezone.now(), Counter()
+    for row, error in zip(rows, errors):
+        retry_at = now + backoff(row.attempts)
+        if error is None:
+            row.status, row.sent_at, row.last_error = 'sent', now, ''
+            counts['sent'] += 1
+        elif row.attempts >= max_attempts or (give_up and give_up(row, retry_at)):
+            row.status, row.last_error = 'dead', error
+            counts['dead'] += 1
+        else:
+            row.next_attempt_at, row.last_error = retry_at, error
+            counts['retry'] += 1
+    if rows:
+        type(rows[0]).objects.bulk_update(rows, ['status', 'sent_at', 'last_error', 'next_attempt_at'])
+    return counts
+
+
+class DispatchCommand(BaseCommand):
+    """Bucle de despacho: repite mientras haya trabajo; con --forever espera y sigue."""
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=100)
+        parser.add_argument('--forever', action='store_true', help="No terminar al vaciar la cola.")
+        parser.add_argument('--interval', type=float, default=5.0, help="Espera en segundos con la cola vacía.")
+
+    def dispatch(self, options):
+        """Despacha un lote y devuelve un Counter de resultados."""
+        raise NotImplementedError
+
+    def handle(self, *args, **options):
+        while True:
+            counts = self.dispatch(options)
+            if counts:
+                self.stdout.write(', '.join(f"{status}: {n}" for status, n in sorted(counts.items())))
+                continue
+            if not options['forever']:
+                break
+            time.sleep(options['interval'])
@@ -0,0 +1,23 @@
+# API/pagination.py
+from rest_framework.pagination import CursorPagination
+
+
+class KeysetCursorPagination(CursorPagination):
+    """
+    Paginación por cursor opaco (keyset): cada página es un
+    `WHERE clave > cursor ORDER BY clave LIMIT n`, sin COUNT(*) ni OFFSET,
+    por lo que una página profunda cuesta lo mismo que la primera.
+    """
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+
+
+class ProductCursorPagination(KeysetCursorPagination):
+    ordering = ('id',)
+
+
+class SaleCursorPagination(KeysetCursorPagination):
+    # DRF arma el cursor solo con el primer campo de ordering: debe ser único y
+    # monótono. id crece con sale_date (auto_now_add); sale_date puede repetirse
+    ordering = ('-id',)
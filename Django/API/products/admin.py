@@ -13,3 +13,6 @@ admin.site.register(ProductVariant)
 admin.site.register(VariantAttribute)
 admin.site.register(InventoryVariant)
 
+# libro de stock
+admin.site.register(StockMovement)
+admin.site.register(StockSnapshot)
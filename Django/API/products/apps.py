@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class ProductsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'API.products'
+
+    def ready(self):
+        # Conecta las señales de las cachés (nombres de atributo, detalle) y de los índices
+        from . import registry, cache, search, facets, images, context  # noqa: F401
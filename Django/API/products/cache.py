@@ -0,0 +1,157 @@
+# products/cache.py
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, pre_delete, m2m_changed
+from django.dispatch import receiver
+
+from API.cache_utils import incr
+from .models import (
+    Product, Attribute, Inventory, AttributeName, ProductVariant,
+    VariantAttribute, InventoryVariant, Category, ProductImage,
+)
+
+GENERATION_KEY = 'catalog:generation'
+# Contadores en la caché (compartidos entre workers si el backend lo es)
+STATS = ('hits', 'misses', 'not_modified', 'invalidations')
+
+
+def _stats_key(name):
+    return f'catalog:stats:{name}'
+
+
+def record(name, count=1):
+    incr(_stats_key(name), delta=count)
+
+
+def cache_stats():
+    """{'hits': n, 'misses': n, 'not_modified': n, 'invalidations': n}."""
+    values = cache.get_many([_stats_key(name) for name in STATS])
+    return {name: values.get(_stats_key(name), 0) for name in STATS}
+
+
+def _version_key(product_id):
+    return f'product:{product_id}:version'
+
+
+def product_version(product_id):
+    """
+    Versión actual del producto: (generación global, versión del producto).
+    La generación cambia con AttributeName, que afecta a todos los payloads.
+    """
+    key = _version_key(product_id)
+    values = cache.get_many([GENERATION_KEY, key])
+    return f"{values.get(GENERATION_KEY, 0)}.{values.get(key, 0)}"
+
+
+def invalidate_product(product_id):
+    """Sube la versión del producto cuando la transacción confirma."""
+    def bump():
+        incr(_version_key(product_id))
+        record('invalidations')
+    transaction.on_commit(bump)
+
+
+def invalidate_products(product_ids):
+    """Como invalidate_product, con un solo callback para muchos productos."""
+    product_ids = set(product_ids)
+    if not product_ids:
+        return
+
+    def bump():
+        for product_id in product_ids:
+            incr(_version_key(product_id))
+        record('invalidations', len(product_ids))
+    transaction.on_commit(bump)
+
+
+def invalidate_catalog():
+    def bump():
+        incr(GENERATION_KEY)
+        record('invalidations')
+    transaction.on_commit(bump)
+
+
+def detail_ttl():
+    # TTL finito: con una caché por proceso, las versiones de otros workers no
+    # se ven y las entradas superadas nunca se leerían de nuevo
+    return getattr(settings, 'PRODUCT_DETAIL_CACHE_TTL', 300)
+
+
+def detail_cache_key(product_id, version, host):
+    # El payload contiene URLs absolutas de imágenes: depende del host
+    return f'product:{product_id}:detail:{version}:{host}'
+
+
+def get_cached_detail(product_id, version, host):
+    """Devuelve (etag, data) o None."""
+    entry = cache.get(detail_cache_key(product_id, version, host))
+    record('hits' if entry is not None else 'misses')
+    return entry
+
+
+def set_cached_detail(product_id, version, host, data):
+    body = json.dumps(data, cls=DjangoJSONEncoder, sort_keys=True).encode('utf-8')
+    etag = f'"{hashlib.sha1(body).hexdigest()}"'
+    cache.set(detail_cache_key(product_id, version, host), (etag, data), timeout=detail_ttl())
+    return etag
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def _product_changed(sender, instance, **kwargs):
+    invalidate_product(instance.pk)
+
+
+@receiver(post_save, sender=Attribute)
+@receiver(post_delete, sender=Attribute)
+@receiver(post_save, sender=Inventory)
+@receiver(post_delete, sender=Inventory)
+@receiver(post_save, sender=ProductVariant)
+@receiver(post_delete, sender=ProductVariant)
+@receiver(post_save, sender=ProductImage)
+@receiver(post_delete, sender=ProductImage)
+def _product_child_changed(sender, instance, **kwargs):
+    invalidate_product(instance.product_id)
+
+
+@receiver(post_save, sender=VariantAttribute)
+@receiver(post_delete, sender=VariantAttribute)
+@receiver(post_save, sender=InventoryVariant)
+@receiver(post_delete, sender=InventoryVariant)
+def _variant_child_changed(sender, instance, **kwargs):
+    product_id = (
+        ProductVariant.objects.filter(pk=instance.variant_id).values_list('product_id', flat=True).first()
+    )
+    if product_id is not None:
+        invalidate_product(product_id)
+
+
+@receiver(post_save, sender=Category)
+@receiver(pre_delete, sender=Category)
+def _category_changed(sender, instance, **kwargs):
+    for product_id in instance.productos.values_list('id', flat=True):
+        invalidate_product(product_id)
+
+
+@receiver(m2m_changed, sender=Category.productos.through)
+def _category_products_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if reverse:
+        # instance es el producto
+        if action in ('post_add', 'post_remove', 'pre_clear'):
+            invalidate_product(instance.pk)
+    elif action in ('post_add', 'post_remove'):
+        for product_id in pk_set:
+            invalidate_product(product_id)
+    elif action == 'pre_clear':
+        _category_changed(sender, instance)
+
+
+@receiver(post_save, sender=AttributeName)
+@receiver(post_delete, sender=AttributeName)
+def _attribute_name_changed(sender, instance, **kwargs):
+    invalidate_catalog()
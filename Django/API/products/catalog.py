@@ -0,0 +1,57 @@
+# products/catalog.py
+from django.db.models import Prefetch
+from rest_framework import serializers
+
+
+def build_catalog_queryset(serializer_class, queryset=None):
+    """
+    Construye un queryset con select_related/Prefetch a partir del árbol de
+    un serializer, de modo que serializar N objetos cueste un número fijo de
+    consultas (una por relación "many" del árbol).
+
+    Los serializers pueden declarar relaciones que usan fuera de sus campos
+    anidados (p.ej. en to_representation o en un SerializerMethodField) con
+    `Meta.catalog_select_related` y `Meta.catalog_prefetch_related`.
+    """
+    model = serializer_class.Meta.model
+    if queryset is None:
+        queryset = model._default_manager.all()
+
+    select, prefetch = _plan(serializer_class)
+    if select:
+        queryset = queryset.select_related(*select)
+    if prefetch:
+        queryset = queryset.prefetch_related(*prefetch)
+    return queryset
+
+
+def _plan(serializer_class, prefix=''):
+    """Devuelve (select_related, prefetch_related) para un serializer."""
+    meta = serializer_class.Meta
+    select = [prefix + path for path in getattr(meta, 'catalog_select_related', ())]
+    prefetch = [prefix + path for path in getattr(meta, 'catalog_prefetch_related', ())]
+
+    for field in serializer_class().fields.values():
+        if field.write_only or field.source == '*':
+            continue
+
+        if isinstance(field, serializers.ListSerializer):
+            # Relación "many": una consulta propia, planificada recursivamente.
+            # Orden explícito: sin ORDER BY la base puede devolver las filas en
+            # el orden de cualquier índice que use (p.ej. la firma de variante)
+            child_qs = build_catalog_queryset(type(field.child)).order_by('pk')
+            prefetch.append(Prefetch(prefix + _lookup(field), queryset=child_qs))
+
+        elif isinstance(field, serializers.BaseSerializer):
+            # FK / OneToOne: se resuelve con JOIN en la misma consulta
+            path = prefix + _lookup(field)
+            select.append(path)
+            nested_select, nested_prefetch = _plan(type(field), prefix=path + '__')
+            select.extend(nested_select)
+            prefetch.extend(nested_prefetch)
+
+    return select, prefetch
+
+
+def _lookup(field):
+    return field.source.replace('.', '__')
@@ -0,0 +1,71 @@
+# products/context.py
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from .models import Business
+
+def business_cache_ttl():
+    # Decide la autorización: con caché por proceso, otros workers no ven la
+    # invalidación, así que el TTL acota cuánto dura un dueño anterior
+    return getattr(settings, 'BUSINESS_CACHE_TTL', 30)
+
+
+def _cache_key(user_id):
+    return f'business:user:{user_id}'
+
+
+def user_businesses(user):
+    """Negocios del usuario (por id), cacheados por usuario hasta que cambie alguno."""
+    key = _cache_key(user.pk)
+    businesses = cache.get(key)
+    if businesses is None:
+        businesses = list(Business.objects.filter(user_id=user.pk).order_by('id'))
+        cache.set(key, businesses, timeout=business_cache_ttl())
+    return businesses
+
+
+def invalidate_user_businesses(user_id):
+    transaction.on_commit(lambda: cache.delete(_cache_key(user_id)))
+
+
+class BusinessContextMixin:
+    """
+    Resuelve una sola vez por petición los negocios del usuario autenticado:
+
+    - request.business: su negocio (el primero si tiene varios) o None.
+    - request.business_ids: ids de todos sus negocios, para validar propiedad.
+
+    Se ejecuta en initial(), después de la autenticación de DRF.
+    """
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        businesses = user_businesses(request.user) if request.user.is_authenticated else []
+        request.business = businesses[0] if businesses else None
+        request.business_ids = {business.id for business in businesses}
+
+    def get_owned_business(self, business_id):
+        """El negocio `business_id` si pertenece al usuario, o None."""
+        return next((b for b in user_businesses(self.request.user) if b.id == business_id), None)
+
+
+@receiver(pre_save, sender=Business)
+def _remember_previous_owner(sender, instance, raw=False, **kwargs):
+    # Si el negocio cambia de dueño (p. ej. desde el admin), el anterior también debe perderlo
+    instance._previous_user_id = None
+    if instance.pk and not raw:
+        instance._previous_user_id = (
+            Business.objects.filter(pk=instance.pk).values_list('user_id', flat=True).first()
+        )
+
+
+@receiver(post_save, sender=Business)
+@receiver(post_delete, sender=Business)
+def _business_changed(sender, instance, **kwargs):
+    invalidate_user_businesses(instance.user_id)
+    previous = getattr(instance, '_previous_user_id', None)
+    if previous not in (None, instance.user_id):
+        invalidate_user_businesses(previous)
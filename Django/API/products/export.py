@@ -0,0 +1,102 @@
+# products/export.py
+from django.db.models import Prefetch
+
+from API.streaming import csv_lines, ndjson_lines
+from .models import Product, ProductVariant, Attribute, VariantAttribute
+
+EXPORT_CHUNK_SIZE = 500
+
+CSV_COLUMNS = [
+    'product_id', 'name', 'price_base', 'descripcion', 'attributes',
+    'unidad_medida', 'cantidad', 'stock_minimo',
+    'variant_id', 'variant_attributes', 'variant_cantidad', 'variant_stock_minimo',
+]
+
+
+def export_queryset(business_id):
+    """
+    Productos del negocio con inventario, atributos y variantes precargados
+    por bloques: iterator(chunk_size) + prefetch mantiene la memoria constante.
+    """
+    variants = ProductVariant.objects.select_related('inventario_variante').order_by('id').prefetch_related(
+        Prefetch('variant_attributes', queryset=VariantAttribute.objects.select_related('name').order_by('id'))
+    )
+    return (
+        Product.objects.filter(business_id=business_id)
+        .select_related('inventario')
+        .prefetch_related(
+            Prefetch('attributes', queryset=Attribute.objects.select_related('name').order_by('id')),
+            Prefetch('variants', queryset=variants),
+        )
+        .order_by('id')
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+
+
+def _related(obj, name):
+    """OneToOne inverso o None si no existe (inventario, inventario_variante)."""
+    return getattr(obj, name) if hasattr(obj, name) else None
+
+
+def product_record(product):
+    inventory = _related(product, 'inventario')
+    return {
+        'id': product.id,
+        'name': product.name,
+        'price_base': product.price_base,
+        'descripcion': product.descripcion,
+        'attributes': {attr.name.name: attr.value for attr in product.attributes.all()},
+        'inventario': {
+            'unidad_medida': inventory.unidad_medida,
+            'cantidad': inventory.cantidad,
+            'stock_minimo': inventory.stock_minimo,
+        } if inventory else None,
+        'variants': [variant_record(variant) for variant in product.variants.all()],
+    }
+
+
+def variant_record(variant):
+    inventory = _related(variant, 'inventario_variante')
+    return {
+        'id': variant.id,
+        'attributes': {attr.name.name: attr.value for attr in variant.variant_attributes.all()},
+        'cantidad': inventory.cantidad if inventory else None,
+        'stock_minimo': inventory.stock_minimo if inventory else None,
+    }
+
+
+def iter_ndjson(business_id):
+    """Una línea JSON por producto, con sus variantes anidadas."""
+    return ndjson_lines(product_record(product) for product in export_queryset(business_id))
+
+
+def _pairs(attributes):
+    return ';'.join(f'{name}={value}' for name, value in attributes.items())
+
+
+def _csv_rows(business_id):
+    for product in export_queryset(business_id):
+        record = product_record(product)
+        inventory = record['inventario'] or {}
+        base = [
+            record['id'], record['name'], record['price_base'], record['descripcion'],
+            _pairs(record['attributes']),
+            inventory.get('unidad_medida', ''), inventory.get('cantidad', ''), inventory.get('stock_minimo', ''),
+        ]
+        if not record['variants']:
+            yield base + ['', '', '', '']
+        for variant in record['variants']:
+            yield base + [
+                variant['id'], _pairs(variant['attributes']), variant['cantidad'], variant['stock_minimo'],
+            ]
+
+
+def iter_csv(business_id):
+    """Una fila por variante (o por producto si no tiene variantes)."""
+    return csv_lines(CSV_COLUMNS, _csv_rows(business_id))
+
+
+EXPORTERS = {
+    'ndjson': (iter_ndjson, 'application/x-ndjson'),
+    'csv': (iter_csv, 'text/csv; charset=utf-8'),
+}
@@ -0,0 +1,137 @@
+# products/facets.py
+from collections import defaultdict
+
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+
+from .models import Product, Attribute, VariantAttribute, ProductFacet
+
+
+class FacetIndex:
+    """
+    Mantiene ProductFacet de forma incremental: solo se leen y reescriben las
+    facetas (nombre, valor) que un cambio añade o quita.
+
+    Un producto pertenece a "Color=Rojo" si el producto o alguna de sus
+    variantes tiene ese atributo.
+    """
+
+    @staticmethod
+    def pairs_for(product_ids):
+        """{product_id: {(name_id, value), ...}} según los atributos actuales."""
+        product_ids = list(product_ids)
+        pairs = defaultdict(set)
+        if not product_ids:
+            return pairs
+        for product_id, name_id, value in (
+            Attribute.objects.filter(product_id__in=product_ids).values_list('product_id', 'name_id', 'value')
+        ):
+            pairs[product_id].add((name_id, value))
+        for product_id, name_id, value in (
+            VariantAttribute.objects.filter(variant__product_id__in=product_ids)
+            .values_list('variant__product_id', 'name_id', 'value')
+        ):
+            pairs[product_id].add((name_id, value))
+        return pairs
+
+    @staticmethod
+    def apply(business_id, before, after):
+        """Aplica la diferencia entre dos resultados de pairs_for. Llamar dentro de una transacción."""
+        added, removed = defaultdict(set), defaultdict(set)
+        for product_id in set(before) | set(after):
+            old, new = before.get(product_id, set()), after.get(product_id, set())
+            for pair in new - old:
+                added[pair].add(product_id)
+            for pair in old - new:
+                removed[pair].add(product_id)
+
+        touched = set(added) | set(removed)
+        if not touched:
+            return
+
+        ProductFacet.objects.bulk_create(
+            [ProductFacet(business_id=business_id, name_id=name_id, value=value) for name_id, value in added],
+            ignore_conflicts=True,
+        )
+        # Superconjunto por nombre/valor; se filtra el par exacto en Python
+        rows = ProductFacet.objects.select_for_update().filter(
+            business_id=business_id,
+            name_id__in={name_id for name_id, _ in touched},
+            value__in={value for _, value in touched},
+        )
+        to_update, to_delete = [], []
+        for row in rows:
+            pair = (row.name_id, row.value)
+            if pair not in touched:
+                continue
+            ids = (set(row.product_ids) - removed.get(pair, set())) | added.get(pair, set())
+            if ids:
+                row.product_ids = sorted(ids)
+                to_update.append(row)
+            else:
+                to_delete.append(row.id)
+
+        ProductFacet.objects.bulk_update(to_update, ['product_ids'])
+        if to_delete:
+            ProductFacet.objects.filter(id__in=to_delete).delete()
+
+    @staticmethod
+    def rebuild(business_id):
+        ProductFacet.objects.filter(business_id=business_id).delete()
+        product_ids = Product.objects.filter(business_id=business_id).values_list('id', flat=True)
+        FacetIndex.apply(business_id, {}, FacetIndex.pairs_for(product_ids))
+
+    @staticmethod
+    def filter_ids(business_id, filters):
+        """
+        Ids de producto que cumplen todos los filtros [(nombre, valor)],
+        por intersección de las listas del índice. None si no hay filtros.
+        """
+        if not filters:
+            return None
+        rows = {
+            (name, value): ids
+            for name, value, ids in ProductFacet.objects.filter(
+                business_id=business_id,
+                name__name__in={name for name, _ in filters},
+                value__in={value for _, value in filters},
+            ).values_list('name__name', 'value', 'product_ids')
+        }
+        result = None
+        for pair in filters:
+            ids = set(rows.get(pair, ()))
+            result = ids if result is None else result & ids
+            if not result:
+                return set()
+        return result
+
+    @staticmethod
+    def counts(business_id, product_ids=None):
+        """
+        [{name, value, count}] para todas las facetas del negocio, contando
+        solo los productos de `product_ids` si se indica.
+        """
+        facets = []
+        for name, value, ids in (
+            ProductFacet.objects.filter(business_id=business_id)
+            .order_by('name__name', 'value').values_list('name__name', 'value', 'product_ids')
+        ):
+            count = len(ids) if product_ids is None else len(product_ids.intersection(ids))
+            if count:
+                facets.append({'name': name, 'value': value, 'count': count})
+        return facets
+
+
+def parse_facet_filters(values):
+    """["Color:Rojo", "Talla:M"] -> [("Color", "Rojo"), ("Talla", "M")]"""
+    filters = []
+    for raw in values:
+        name, sep, value = raw.partition(':')
+        if sep and name and value:
+            filters.append((name.strip(), value.strip()))
+    return filters
+
+
+@receiver(pre_delete, sender=Product)
+def _remove_deleted_product(sender, instance, **kwargs):
+    FacetIndex.apply(instance.business_id, FacetIndex.pairs_for([instance.pk]), {})
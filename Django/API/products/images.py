@@ -0,0 +1,114 @@
+# products/images.py
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import connection, transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_product
+from .imaging import render_derivatives, FORMATS
+from .models import ProductImage
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WIDTHS = (320, 640, 1024)
+EXTENSIONS = {'webp': 'webp', 'jpeg': 'jpg'}
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def image_widths():
+    return getattr(settings, 'PRODUCT_IMAGE_WIDTHS', DEFAULT_WIDTHS)
+
+
+def _workers():
+    return getattr(settings, 'PRODUCT_IMAGE_WORKERS', 2)
+
+
+def get_executor(workers=None):
+    """Pool de procesos compartido; spawn evita heredar conexiones o hilos del worker web."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=workers or _workers(),
+                mp_context=multiprocessing.get_context('spawn'),
+            )
+        return _executor
+
+
+def derivative_name(name, fmt, width):
+    """productos/foto.png -> productos/foto_w320.webp (junto al original)."""
+    root, _ = os.path.splitext(name)
+    return f"{root}_w{width}.{EXTENSIONS[fmt]}"
+
+
+def read_original(image):
+    with image.imagen.open('rb') as f:
+        return f.read()
+
+
+def store_derivatives(image, rendered):
+    """Guarda los bytes generados en el storage y registra las rutas en la imagen."""
+    storage = image.imagen.storage
+    derivatives = {fmt: {} for fmt in FORMATS}
+    for (fmt, width), content in rendered.items():
+        name = derivative_name(image.imagen.name, fmt, width)
+        if storage.exists(name):
+            storage.delete(name)
+        derivatives[fmt][str(width)] = storage.save(name, ContentFile(content))
+
+    # update() no emite post_save: no vuelve a encolar la imagen
+    ProductImage.objects.filter(pk=image.pk).update(derivatives=derivatives)
+    image.derivatives = derivatives
+    invalidate_product(image.product_id)
+    return derivatives
+
+
+def generate_derivatives(image):
+    """Versión síncrona (tests, backfill de una sola imagen)."""
+    return store_derivatives(image, render_derivatives(read_original(image), image_widths()))
+
+
+def schedule_derivatives(image):
+    """Encola la generación en el pool de procesos, fuera del ciclo de la petición."""
+    if not _workers():
+        return generate_derivatives(image)
+
+    future = get_executor().submit(render_derivatives, read_original(image), image_widths())
+    caller = threading.current_thread()
+
+    def done(future):
+        try:
+            store_derivatives(image, future.result())
+        except Exception:
+            logger.exception("No se pudieron generar las versiones de la imagen %s", image.pk)
+        finally:
+            # Normalmente el callback corre en un hilo del pool: no dejar su conexión abierta
+            if threading.current_thread() is not caller:
+                connection.close()
+
+    future.add_done_callback(done)
+    return future
+
+
+def srcset(image, url_for, fmt='webp'):
+    """'url 320w, url 640w' a partir de las versiones registradas."""
+    storage = image.imagen.storage
+    return ', '.join(
+        f"{url_for(storage.url(name))} {width}w"
+        for width, name in sorted(image.derivatives.get(fmt, {}).items(), key=lambda item: int(item[0]))
+    )
+
+
+@receiver(post_save, sender=ProductImage)
+def _queue_new_image(sender, instance, created, raw=False, **kwargs):
+    if created and not raw and instance.imagen:
+        transaction.on_commit(lambda: schedule_derivatives(instance))
@@ -0,0 +1,32 @@
+# products/imaging.py
+# Sin dependencias de Django: se ejecuta en procesos hijos (spawn) del pipeline de imágenes.
+import io
+
+from PIL import Image, ImageOps
+
+FORMATS = {
+    'webp': {'format': 'WEBP', 'quality': 80, 'method': 4},
+    'jpeg': {'format': 'JPEG', 'quality': 82, 'optimize': True, 'progressive': True},
+}
+
+
+def render_derivatives(data, widths):
+    """
+    Genera versiones de ancho fijo (WebP y JPEG) de una imagen.
+    Nunca amplía: solo se generan anchos menores que el original.
+    Devuelve {(formato, ancho): bytes}.
+    """
+    with Image.open(io.BytesIO(data)) as original:
+        image = ImageOps.exif_transpose(original).convert('RGB')
+
+    results = {}
+    for width in sorted(widths):
+        if width >= image.width:
+            continue
+        height = round(image.height * width / image.width)
+        resized = image.resize((width, height), Image.LANCZOS)
+        for fmt, options in FORMATS.items():
+            buffer = io.BytesIO()
+            resized.save(buffer, **options)
+            results[(fmt, width)] = buffer.getvalue()
+    return results
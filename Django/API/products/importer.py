@@ -0,0 +1,193 @@
+# products/importer.py
+import csv
+import json
+from itertools import islice
+
+from django.db import transaction
+
+from .models import (
+    Product, Attribute, Inventory, ProductVariant,
+    VariantAttribute, InventoryVariant, Category,
+)
+from .registry import attribute_names
+from .search import index_products
+from .facets import FacetIndex
+from .ledger import StockLedger
+from .services import variant_signature_hash
+from .products.serializers.serializers_create import ProductCreateSerializer
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def iter_ndjson(stream):
+    """Una fila por línea JSON; las líneas vacías se ignoran."""
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError as e:
+            yield e
+
+
+def iter_csv(stream):
+    """
+    Columnas: name, price_base, descripcion, unidad_medida, cantidad, stock_minimo,
+    attributes ("Color=Rojo;Talla=M"), category_ids ("1;2") y variants (JSON).
+    """
+    for row in csv.DictReader(stream):
+        try:
+            yield _csv_row(row)
+        except ValueError as e:
+            yield e
+
+
+def _csv_row(row):
+    data = {
+        'name': row.get('name', ''),
+        'price_base': row.get('price_base', ''),
+        'descripcion': row.get('descripcion', ''),
+        'attributes': [
+            {'name': name.strip(), 'value': value.strip()}
+            for name, _, value in (
+                pair.partition('=') for pair in (row.get('attributes') or '').split(';') if pair
+            )
+        ],
+        'category_ids': [int(c) for c in (row.get('category_ids') or '').split(';') if c],
+    }
+    if row.get('unidad_medida'):
+        data['inventario'] = {
+            'unidad_medida': row['unidad_medida'],
+            'cantidad': row.get('cantidad') or 0,
+            'stock_minimo': row.get('stock_minimo') or 5,
+        }
+    if row.get('variants'):
+        data['variants'] = json.loads(row['variants'])
+    return data
+
+
+READERS = {
+    'ndjson': iter_ndjson,
+    'csv': iter_csv,
+}
+
+
+class ProductImporter:
+    """
+    Importa productos en bloques: valida cada bloque con ProductCreateSerializer
+    y escribe las filas válidas con un bulk_create por modelo dentro de una
+    transacción por bloque. Las filas inválidas se reportan y no abortan el archivo.
+    """
+
+    def __init__(self, business, chunk_size=DEFAULT_CHUNK_SIZE):
+        self.business = business
+        self.chunk_size = chunk_size
+        self.created = 0
+        self.errors = []
+        self._category_ids = set(
+            Category.objects.filter(business=business).values_list('id', flat=True)
+        )
+
+    def run(self, stream, fmt='ndjson'):
+        """`stream` es un archivo de texto; se lee de forma incremental."""
+        rows = enumerate(READERS[fmt](stream), start=1)
+        while True:
+            chunk = list(islice(rows, self.chunk_size))
+            if not chunk:
+                break
+            valid = self._validate(chunk)
+            if valid:
+                self._write(valid)
+        return self.report()
+
+    def report(self):
+        return {'created': self.created, 'errors': self.errors}
+
+    def _validate(self, chunk):
+        valid = []
+        for line, row in chunk:
+            # Una fila malformada (JSON inválido, columnas rotas) no detiene la lectura
+            if isinstance(row, Exception):
+                self.errors.append({'row': line, 'errors': str(row)})
+                continue
+            serializer = ProductCreateSerializer(data=row)
+            if serializer.is_valid():
+                valid.append(serializer.validated_data)
+            else:
+                self.errors.append({'row': line, 'errors': serializer.errors})
+        return valid
+
+    @transaction.atomic
+    def _write(self, rows):
+        names = self._resolve_attribute_names(rows)
+
+        products = Product.objects.bulk_create([
+            Product(
+                business=self.business,
+                name=row['name'],
+                price_base=row['price_base'],
+                descripcion=row.get('descripcion', ''),
+            )
+            for row in rows
+        ])
+
+        attributes, inventories, memberships, variants, variant_rows = [], [], [], [], []
+        for product, row in zip(products, rows):
+            attributes.extend(
+                Attribute(product=product, name_id=names[attr['name']], value=attr['value'])
+                for attr in row.get('attributes', [])
+            )
+            if row.get('inventario'):
+                inventories.append(Inventory(product=product, **row['inventario']))
+            memberships.extend(
+                Category.productos.through(category_id=category_id, product_id=product.id)
+                for category_id in set(row.get('category_ids', [])) & self._category_ids
+            )
+            for var_data in row.get('variants', []):
+                variants.append(ProductVariant(product=product, signature=variant_signature_hash(
+                    (names[attr['name']], attr['value']) for attr in var_data.get('attributes', [])
+                )))
+                variant_rows.append(var_data)
+
+        Attribute.objects.bulk_create(attributes)
+        Inventory.objects.bulk_create(inventories)
+        Category.productos.through.objects.bulk_create(memberships)
+
+        variants = ProductVariant.objects.bulk_create(variants)
+        VariantAttribute.objects.bulk_create([
+            VariantAttribute(variant=variant, name_id=names[attr['name']], value=attr['value'])
+            for variant, var_data in zip(variants, variant_rows)
+            for attr in var_data.get('attributes', [])
+        ])
+        InventoryVariant.objects.bulk_create([
+            InventoryVariant(
+                variant=variant,
+                cantidad=var_data.get('cantidad', 0),
+                stock_minimo=var_data.get('stock_minimo', 5),
+            )
+            for variant, var_data in zip(variants, variant_rows)
+        ])
+
+        product_ids = [product.id for product in products]
+        index_products(product_ids)
+        FacetIndex.apply(self.business.id, {}, FacetIndex.pairs_for(product_ids))
+        # Existencias iniciales al libro de stock, en un solo bulk_create
+        StockLedger.append(
+            [StockLedger.movement(i.product_id, i.cantidad, kind='import') for i in inventories]
+            + [
+                StockLedger.movement(variant.product_id, var_data.get('cantidad', 0), variant.id, kind='import')
+                for variant, var_data in zip(variants, variant_rows)
+            ]
+        )
+        self.created += len(products)
+
+    @staticmethod
+    def _resolve_attribute_names(rows):
+        wanted = {attr['name'] for row in rows for attr in row.get('attributes', [])}
+        wanted |= {
+            attr['name']
+            for row in rows for var_data in row.get('variants', [])
+            for attr in var_data.get('attributes', [])
+        }
+        return attribute_names.resolve(wanted)
@@ -0,0 +1,196 @@
+# products/ledger.py
+from datetime import timedelta
+from itertools import chain, islice
+
+from django.db import transaction
+from django.db.models import F, Max, Q, Sum
+from django.utils import timezone
+
+from .cache import invalidate_products
+from .models import Product, Inventory, InventoryVariant, StockMovement, StockSnapshot
+
+SNAPSHOT_LAG = timedelta(minutes=1)
+# Historial de variantes eliminadas: se conserva, pero ya no genera snapshots
+ORPHANED = Q(variant_ref__isnull=False, variant__isnull=True)
+
+
+class StockAdjustmentError(Exception):
+    """Ajuste masivo inválido (ítems inexistentes o de otro negocio)."""
+
+    def __init__(self, message, missing=()):
+        super().__init__(message)
+        self.missing = list(missing)
+
+
+class StockLedger:
+    """
+    Libro de movimientos de stock con snapshots periódicos.
+
+    Las escrituras se agrupan (un bulk_create por operación) y los ajustes
+    solo tocan la fila de inventario con un UPDATE ... F(): nunca bloquean
+    la fila del producto.
+    """
+
+    @staticmethod
+    def movement(product_id, delta, variant_id=None, kind='adjustment', reference=''):
+        return StockMovement(
+            product_id=product_id, variant_id=variant_id, variant_ref=variant_id, kind=kind,
+            cantidad=float(delta), reference=reference,
+        )
+
+    @staticmethod
+    def append(movements):
+        """
+        Inserta los movimientos en lote; los deltas nulos se descartan.
+        Los UPDATE ... F() no emiten señales: aquí se invalida la caché de detalle.
+        """
+        movements = StockMovement.objects.bulk_create([movement for movement in movements if movement.cantidad])
+        invalidate_products(movement.product_id for movement in movements)
+        return movements
+
+    @staticmethod
+    @transaction.atomic
+    def adjust(product_id, delta, variant_id=None, kind='adjustment', reference=''):
+        if variant_id:
+            queryset = InventoryVariant.objects.filter(variant_id=variant_id, variant__product_id=product_id)
+        else:
+            queryset = Inventory.objects.filter(product_id=product_id)
+        updated = queryset.update(cantidad=F('cantidad') + float(delta))
+        if updated:
+            StockLedger.append([StockLedger.movement(product_id, delta, variant_id, kind, reference)])
+        return bool(updated)
+
+    @staticmethod
+    @transaction.atomic
+    def bulk_adjust(business_id, adjustments, reference='', batch_size=1000):
+        """
+        Aplica un conteo físico: [{'product', 'variant' | None, 'cantidad' | 'delta'}].
+        `cantidad` fija la existencia; `delta` la suma a la actual.
+
+        La propiedad se valida en la misma consulta que bloquea las filas de
+        inventario (una por modelo); si falta alguna, no se aplica nada.
+        of=('self',): los JOIN con producto y variante no bloquean esas filas.
+        """
+        product_items = {a['product']: a for a in adjustments if not a.get('variant')}
+        variant_items = {a['variant']: a for a in adjustments if a.get('variant')}
+
+        inventories = list(
+            Inventory.objects.select_for_update(of=('self',))
+            .filter(product_id__in=product_items, product__business_id=business_id).order_by('id')
+        ) if product_items else []
+        variant_inventories = list(
+            InventoryVariant.objects.select_for_update(of=('self',))
+            .filter(variant_id__in=variant_items, variant__product__business_id=business_id)
+            .select_related('variant').order_by('id')
+        ) if variant_items else []
+
+        missing = [('product', pid) for pid in product_items.keys() - {i.product_id for i in inventories}]
+        missing += [
+            ('variant', vid) for vid in variant_items.keys() - {
+                i.variant_id for i in variant_inventories
+                if i.variant.product_id == variant_items[i.variant_id]['product']
+            }
+        ]
+        if missing:
+            raise StockAdjustmentError("Ítems sin inventario o ajenos al negocio.", missing)
+
+        movements = []
+        for inventory, item, variant_id, product_id in chain(
+            ((i, product_items[i.product_id], None, i.product_id) for i in inventories),
+            ((i, variant_items[i.variant_id], i.variant_id, i.variant.product_id) for i in variant_inventories),
+        ):
+            previous = inventory.cantidad
+            if item.get('cantidad') is not None:
+                inventory.cantidad = float(item['cantidad'])
+            else:
+                inventory.cantidad = previous + float(item['delta'])
+            movements.append(
+                StockLedger.movement(product_id, inventory.cantidad - previous, variant_id, reference=reference)
+            )
+
+        Inventory.objects.bulk_update(inventories, ['cantidad'], batch_size=batch_size)
+        InventoryVariant.objects.bulk_update(variant_inventories, ['cantidad'], batch_size=batch_size)
+        StockLedger.append(movements)
+        return len(movements)
+
+    @staticmethod
+    def stock_at(product_id, at, variant_id=None):
+        """Existencia en el instante `at`: snapshot más cercano + delta corto posterior."""
+        snapshot = (
+            StockSnapshot.objects.filter(product_id=product_id, variant_ref=variant_id, taken_at__lte=at)
+            .order_by('-taken_at').values_list('cantidad', 'last_movement_id').first()
+        )
+        base, after_id = snapshot or (0, 0)
+        delta = StockMovement.objects.filter(
+            product_id=product_id, variant_ref=variant_id, id__gt=after_id, created_at__lte=at,
+        ).aggregate(total=Sum('cantidad'))['total']
+        return base + (delta or 0)
+
+    @staticmethod
+    def open_balances(batch_size=1000):
+        """Saldos de apertura para ítems con inventario pero sin movimientos (previos al libro)."""
+        products_with_ledger = StockMovement.objects.filter(variant_ref__isnull=True).values('product_id')
+        variants_with_ledger = StockMovement.objects.filter(variant_ref__isnull=False).values('variant_ref')
+        rows = chain(
+            (
+                (product_id, None, cantidad)
+                for product_id, cantidad in Inventory.objects.exclude(product_id__in=products_with_ledger)
+                .values_list('product_id', 'cantidad').iterator()
+            ),
+            InventoryVariant.objects.exclude(variant_id__in=variants_with_ledger)
+            .values_list('variant__product_id', 'variant_id', 'cantidad').iterator(),
+        )
+        created = 0
+        while batch := list(islice(rows, batch_size)):
+            created += len(StockLedger.append(
+                StockLedger.movement(product_id, cantidad, variant_id, reference='apertura')
+                for product_id, variant_id, cantidad in batch
+            ))
+        return created
+
+    @staticmethod
+    def take_snapshots(batch_size=1000):
+        """
+        Nueva corrida de snapshots derivada del libro: snapshot anterior + suma
+        de los movimientos entre el corte anterior y el actual. Se procesa por
+        bloques de productos para acotar memoria.
+        """
+        previous_cutoff = StockSnapshot.objects.aggregate(cutoff=Max('last_movement_id'))['cutoff']
+        if previous_cutoff is None:
+            StockLedger.open_balances(batch_size)
+            previous_cutoff = 0
+
+        # El corte se toma con un margen: un movimiento con id menor que el corte
+        # pero aún sin confirmar quedaría fuera de esta corrida y de la siguiente
+        taken_at = timezone.now() - SNAPSHOT_LAG
+        cutoff = StockMovement.objects.filter(created_at__lte=taken_at).aggregate(cutoff=Max('id'))['cutoff']
+        cutoff = max(cutoff or 0, previous_cutoff)
+        written, last_id = 0, 0
+        while True:
+            product_ids = list(
+                Product.objects.filter(id__gt=last_id).order_by('id').values_list('id', flat=True)[:batch_size]
+            )
+            if not product_ids:
+                break
+            last_id = product_ids[-1]
+
+            balances = {
+                (pid, vid): qty
+                for pid, vid, qty in StockSnapshot.objects.filter(
+                    product_id__in=product_ids, last_movement_id=previous_cutoff,
+                ).exclude(ORPHANED).values_list('product_id', 'variant_ref', 'cantidad')
+            }
+            deltas = (
+                StockMovement.objects.filter(product_id__in=product_ids, id__gt=previous_cutoff, id__lte=cutoff)
+                .exclude(ORPHANED).values_list('product_id', 'variant_ref').annotate(total=Sum('cantidad'))
+            )
+            for pid, vid, total in deltas:
+                balances[(pid, vid)] = balances.get((pid, vid), 0) + total
+
+            StockSnapshot.objects.bulk_create([
+                StockSnapshot(product_id=pid, variant_id=vid, variant_ref=vid, cantidad=qty,
+                              last_movement_id=cutoff, taken_at=taken_at)
+                for (pid, vid), qty in balances.items()
+            ])
+            written += len(balances)
+        return written
@@ -0,0 +1,50 @@
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+
+from django.core.management.base import BaseCommand
+
+from API.products.images import image_widths, read_original, store_derivatives
+from API.products.imaging import render_derivatives
+from API.products.models import ProductImage
+
+
+class Command(BaseCommand):
+    help = "Genera en paralelo las versiones reducidas (WebP/JPEG) de las imágenes de producto existentes."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=multiprocessing.cpu_count())
+        parser.add_argument('--batch-size', type=int, default=50)
+        parser.add_argument('--force', action='store_true', help="Regenera también las que ya tienen versiones.")
+
+    def handle(self, *args, **options):
+        queryset = ProductImage.objects.order_by('id')
+        if not options['force']:
+            queryset = queryset.filter(derivatives={})
+
+        widths = image_widths()
+        done, failed, last_id = 0, 0, 0
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=options['workers'], mp_context=context) as executor:
+            while True:
+                batch = list(queryset.filter(id__gt=last_id)[:options['batch_size']])
+                if not batch:
+                    break
+                last_id = batch[-1].id
+
+                futures = []
+                for image in batch:
+                    try:
+                        futures.append((image, executor.submit(render_derivatives, read_original(image), widths)))
+                    except (OSError, ValueError) as e:
+                        failed += 1
+                        self.stderr.write(f"Imagen {image.pk}: {e}")
+
+                for image, future in futures:
+                    try:
+                        store_derivatives(image, future.result())
+                        done += 1
+                    except Exception as e:
+                        failed += 1
+                        self.stderr.write(f"Imagen {image.pk}: {e}")
+
+        self.stdout.write(self.style.SUCCESS(f"{done} imágenes procesadas, {failed} con errores."))
@@ -0,0 +1,36 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from API.products.importer import ProductImporter, READERS, DEFAULT_CHUNK_SIZE
+from API.products.models import Business
+
+
+class Command(BaseCommand):
+    help = "Importa productos de un archivo CSV o NDJSON a un negocio usando inserciones por lotes."
+
+    def add_arguments(self, parser):
+        parser.add_argument('business_id', type=int)
+        parser.add_argument('path')
+        parser.add_argument('--format', choices=sorted(READERS), default=None,
+                            help="Formato del archivo. Por defecto se deduce de la extensión.")
+        parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        try:
+            business = Business.objects.get(pk=options['business_id'])
+        except Business.DoesNotExist:
+            raise CommandError(f"No existe el negocio {options['business_id']}.")
+
+        path = options['path']
+        fmt = options['format'] or ('csv' if path.endswith('.csv') else 'ndjson')
+
+        importer = ProductImporter(business, chunk_size=options['chunk_size'])
+        with open(path, encoding='utf-8', newline='') as stream:
+            report = importer.run(stream, fmt=fmt)
+
+        for error in report['errors']:
+            self.stderr.write(f"Fila {error['row']}: {json.dumps(error['errors'], ensure_ascii=False)}")
+        self.stdout.write(self.style.SUCCESS(
+            f"{report['created']} productos importados, {len(report['errors'])} filas con errores."
+        ))
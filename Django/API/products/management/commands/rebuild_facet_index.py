@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from API.products.facets import FacetIndex
+from API.products.models import Business
+
+
+class Command(BaseCommand):
+    help = "Reconstruye el índice de facetas de atributos por negocio."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--business', type=int, default=None, help="Solo este negocio.")
+
+    def handle(self, *args, **options):
+        businesses = Business.objects.order_by('id').values_list('id', flat=True)
+        if options['business']:
+            businesses = businesses.filter(id=options['business'])
+
+        for business_id in businesses:
+            with transaction.atomic():
+                FacetIndex.rebuild(business_id)
+            self.stdout.write(f"Negocio {business_id}: índice de facetas reconstruido.")
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from API.products.models import Product
+from API.products.search import index_products
+
+
+class Command(BaseCommand):
+    help = "Reconstruye por lotes el índice de búsqueda de productos (lo crea la migración products 0003)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--business', type=int, default=None, help="Solo productos de este negocio.")
+
+    def handle(self, *args, **options):
+        queryset = Product.objects.order_by('id')
+        if options['business']:
+            queryset = queryset.filter(business_id=options['business'])
+
+        total, last_id = 0, 0
+        while True:
+            ids = list(queryset.filter(id__gt=last_id).values_list('id', flat=True)[:options['batch_size']])
+            if not ids:
+                break
+            index_products(ids)
+            total += len(ids)
+            last_id = ids[-1]
+
+        self.stdout.write(self.style.SUCCESS(f"{total} productos indexados."))
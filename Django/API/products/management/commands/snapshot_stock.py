@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from API.products.ledger import StockLedger
+
+
+class Command(BaseCommand):
+    help = "Toma una nueva corrida de snapshots de stock a partir del libro de movimientos."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help="Productos por bloque.")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            written = StockLedger.take_snapshots(options['batch_size'])
+        self.stdout.write(f"{written} snapshots de stock registrados.")
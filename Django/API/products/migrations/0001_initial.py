@@ -0,0 +1,173 @@
+# Generated by Django 5.1.4 on 2026-10-18 17:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AttributeName',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+            ],
+            options={
+                'verbose_name': 'Nombre de Atributo',
+                'verbose_name_plural': 'Nombres de Atributos',
+            },
+        ),
+        migrations.CreateModel(
+            name='Business',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+            ],
+            options={
+                'verbose_name': 'Negocio',
+                'verbose_name_plural': 'Negocios',
+            },
+        ),
+        migrations.CreateModel(
+            name='Category',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('nombre', models.CharField(max_length=50)),
+            ],
+            options={
+                'verbose_name': 'Categoría',
+                'verbose_name_plural': 'Categorías',
+            },
+        ),
+        migrations.CreateModel(
+            name='Inventory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('unidad_medida', models.CharField(choices=[('unidad', 'Unidad'), ('kg', 'Kilogramo'), ('litro', 'Litro'), ('docena', 'Docena')], max_length=10)),
+                ('cantidad', models.FloatField(default=0)),
+                ('stock_minimo', models.FloatField(default=5)),
+            ],
+            options={
+                'verbose_name': 'Inventario',
+                'verbose_name_plural': 'Inventarios',
+            },
+        ),
+        migrations.CreateModel(
+            name='InventoryVariant',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('cantidad', models.FloatField(default=0)),
+                ('stock_minimo', models.FloatField(default=5)),
+            ],
+            options={
+                'verbose_name': 'Inventario de Variante',
+                'verbose_name_plural': 'Inventarios de Variante',
+            },
+        ),
+        migrations.CreateModel(
+            name='Product',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('price_base', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('descripcion', models.TextField(blank=True)),
+            ],
+            options={
+                'verbose_name': 'Producto',
+                'verbose_name_plural': 'Productos',
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductFacet',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('value', models.CharField(max_length=100)),
+                ('product_ids', models.JSONField(default=list)),
+            ],
+            options={
+                'verbose_name': 'Faceta de Producto',
+                'verbose_name_plural': 'Facetas de Producto',
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductImage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('imagen', models.ImageField(upload_to='productos/')),
+                ('derivatives', models.JSONField(blank=True, default=dict)),
+            ],
+            options={
+                'verbose_name': 'Imagen de Producto',
+                'verbose_name_plural': 'Imágenes de Productos',
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductVariant',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('signature', models.CharField(blank=True, editable=False, max_length=64, null=True)),
+            ],
+            options={
+                'verbose_name': 'Variante de Producto',
+                'verbose_name_plural': 'Variantes de Producto',
+            },
+        ),
+        migrations.CreateModel(
+            name='StockMovement',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('variant_ref', models.BigIntegerField(blank=True, editable=False, null=True)),
+                ('kind', models.CharField(choices=[('sale', 'Venta'), ('adjustment', 'Ajuste'), ('import', 'Importación'), ('return', 'Devolución')], max_length=20)),
+                ('cantidad', models.FloatField()),
+                ('reference', models.CharField(blank=True, max_length=50)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Movimiento de Stock',
+                'verbose_name_plural': 'Movimientos de Stock',
+            },
+        ),
+        migrations.CreateModel(
+            name='StockSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('variant_ref', models.BigIntegerField(blank=True, editable=False, null=True)),
+                ('cantidad', models.FloatField()),
+                ('last_movement_id', models.BigIntegerField()),
+                ('taken_at', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'Snapshot de Stock',
+                'verbose_name_plural': 'Snapshots de Stock',
+            },
+        ),
+        migrations.CreateModel(
+            name='VariantAttribute',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('value', models.CharField(max_length=100)),
+            ],
+            options={
+                'verbose_name': 'Atributo de Variante',
+                'verbose_name_plural': 'Atributos de Variante',
+            },
+        ),
+        migrations.CreateModel(
+            name='Attribute',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('value', models.CharField(max_length=100)),
+                ('name', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='attributes', to='products.attributename')),
+            ],
+            options={
+                'verbose_name': 'Atributo',
+                'verbose_name_plural': 'Atributos',
+            },
+        ),
+    ]
@@ -0,0 +1,127 @@
+# Generated by Django 5.1.4 on 2026-10-18 17:41
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('products', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='business',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='businesses', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='category',
+            name='business',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='products.business'),
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='business',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='products', to='products.business'),
+        ),
+        migrations.AddField(
+            model_name='inventory',
+            name='product',
+            field=models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='inventario', to='products.product'),
+        ),
+        migrations.AddField(
+            model_name='category',
+            name='productos',
+            field=models.ManyToManyField(to='products.product'),
+        ),
+        migrations.AddField(
+            model_name='attribute',
+            name='product',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='attributes', to='products.product'),
+        ),
+        migrations.AddField(
+            model_name='productfacet',
+            name='business',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='facets', to='products.business'),
+        ),
+        migrations.AddField(
+            model_name='productfacet',
+            name='name',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='facets', to='products.attributename'),
+        ),
+        migrations.AddField(
+            model_name='productimage',
+            name='product',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='products.product'),
+        ),
+        migrations.AddField(
+            model_name='productvariant',
+            name='product',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='variants', to='products.product'),
+        ),
+        migrations.AddField(
+            model_name='inventoryvariant',
+            name='variant',
+            field=models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='inventario_variante', to='products.productvariant'),
+        ),
+        migrations.AddField(
+            model_name='stockmovement',
+            name='product',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='stock_movements', to='products.product'),
+        ),
+        migrations.AddField(
+            model_name='stockmovement',
+            name='variant',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='stock_movements', to='products.productvariant'),
+        ),
+        migrations.AddField(
+            model_name='stocksnapshot',
+            name='product',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='stock_snapshots', to='products.product'),
+        ),
+        migrations.AddField(
+            model_name='stocksnapshot',
+            name='variant',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='stock_snapshots', to='products.productvariant'),
+        ),
+        migrations.AddField(
+            model_name='variantattribute',
+            name='name',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='products.attributename'),
+        ),
+        migrations.AddField(
+            model_name='variantattribute',
+            name='variant',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='variant_attributes', to='products.productvariant'),
+        ),
+        migrations.AddIndex(
+            model_name='inventory',
+            index=models.Index(condition=models.Q(('cantidad__lt', models.F('stock_minimo'))), fields=['product'], name='inventory_low_stock'),
+        ),
+        migrations.AddConstraint(
+            model_name='productfacet',
+            constraint=models.UniqueConstraint(fields=('business', 'name', 'value'), name='unique_business_facet'),
+        ),
+        migrations.AddConstraint(
+            model_name='productvariant',
+            constraint=models.UniqueConstraint(fields=('product', 'signature'), name='unique_variant_signature'),
+        ),
+        migrations.AddIndex(
+            model_name='inventoryvariant',
+            index=models.Index(condition=models.Q(('cantidad__lt', models.F('stock_minimo'))), fields=['variant'], name='inventory_variant_low_stock'),
+        ),
+        migrations.AddIndex(
+            model_name='stockmovement',
+            index=models.Index(fields=['product', 'variant_ref', 'created_at'], name='stock_movement_item_time'),
+        ),
+        migrations.AddIndex(
+            model_name='stocksnapshot',
+            index=models.Index(fields=['product', 'variant_ref', 'taken_at'], name='stock_snapshot_item_time'),
+        ),
+    ]
@@ -0,0 +1,65 @@
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class ForVendor(migrations.SeparateDatabaseAndState):
+    """Aplica las operaciones en la base de datos solo con el motor indicado; el estado siempre."""
+
+    def __init__(self, vendor, operations):
+        self.vendor = vendor
+        super().__init__(database_operations=operations, state_operations=operations)
+
+    def deconstruct(self):
+        return self.__class__.__qualname__, [self.vendor, self.database_operations], {}
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == self.vendor:
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == self.vendor:
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+    def describe(self):
+        return f"Operaciones solo para {self.vendor}"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0002_initial'),
+    ]
+
+    operations = [
+        # Postgres: tsvector con índice GIN (API.products.search.PostgresSearchBackend)
+        ForVendor('postgresql', [
+            migrations.CreateModel(
+                name='ProductSearch',
+                fields=[
+                    ('product', models.OneToOneField(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='+', serialize=False, to='products.product')),
+                    ('document', django.contrib.postgres.search.SearchVectorField()),
+                    ('business', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='products.business')),
+                ],
+                options={
+                    'verbose_name': 'Documento de Búsqueda',
+                    'verbose_name_plural': 'Documentos de Búsqueda',
+                    'db_table': 'products_search',
+                    'indexes': [django.contrib.postgres.indexes.GinIndex(fields=['document'], name='products_search_document_gin')],
+                },
+            ),
+        ]),
+        # SQLite: tabla virtual FTS5 (API.products.search.SQLiteSearchBackend); no es un modelo
+        ForVendor('sqlite', [
+            migrations.RunSQL(
+                sql="""
+                    CREATE VIRTUAL TABLE products_search_fts USING fts5(
+                        business_id UNINDEXED, name, descripcion, attributes,
+                        tokenize = 'unicode61 remove_diacritics 2'
+                    )
+                """,
+                reverse_sql="DROP TABLE products_search_fts",
+            ),
+        ]),
+    ]
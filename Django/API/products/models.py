@@ -1,8 +1,14 @@
 from django.db import models
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 User = get_user_model()
 # Create your models here.
 
+# Condición de "bajo stock": la comparten los índices parciales y las consultas,
+# para que el planificador reconozca el predicado y use el índice
+LOW_STOCK = models.Q(cantidad__lt=models.F('stock_minimo'))
+
 class Business(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='businesses')
     name = models.CharField(max_length=100)
@@ -63,9 +69,15 @@ class Inventory(models.Model):
     class Meta:
         verbose_name = "Inventario"
         verbose_name_plural = "Inventarios"
+        indexes = [
+            # Parcial: solo contiene las filas bajo el mínimo
+            models.Index(fields=['product'], condition=LOW_STOCK, name='inventory_low_stock'),
+        ]
 
 class ProductVariant(models.Model):
     product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='variants')
+    # sha256 de los pares (AttributeName id, valor) ordenados; lo mantiene ProductService
+    signature = models.CharField(max_length=64, null=True, blank=True, editable=False)
 
     def __str__(self):
         return f"Variante de {self.product.name}"
@@ -73,6 +85,9 @@ class ProductVariant(models.Model):
     class Meta:
         verbose_name = "Variante de Producto"
         verbose_name_plural = "Variantes de Producto"
+        constraints = [
+            models.UniqueConstraint(fields=['product', 'signature'], name='unique_variant_signature'),
+        ]
 
 class VariantAttribute(models.Model):
     variant = models.ForeignKey(ProductVariant, on_delete=models.CASCADE, related_name='variant_attributes')
@@ -97,6 +112,60 @@ class InventoryVariant(models.Model):
     class Meta:
         verbose_name = "Inventario de Variante"
         verbose_name_plural = "Inventarios de Variante"
+        indexes = [
+            models.Index(fields=['variant'], condition=LOW_STOCK, name='inventory_variant_low_stock'),
+        ]
+
+class StockMovement(models.Model):
+    """
+    Libro de movimientos de stock (solo inserciones). `cantidad` es el delta
+    con signo; la existencia de un ítem (product, variant_ref) es la suma de
+    sus movimientos.
+    """
+    KIND_CHOICES = [
+        ('sale', 'Venta'),
+        ('adjustment', 'Ajuste'),
+        ('import', 'Importación'),
+        ('return', 'Devolución'),
+    ]
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='stock_movements')
+    # SET_NULL: el historial sobrevive a la eliminación de la variante
+    variant = models.ForeignKey(ProductVariant, on_delete=models.SET_NULL, null=True, blank=True, related_name='stock_movements')
+    # Id original de la variante; distingue un ítem de variante eliminada de uno a nivel de producto
+    variant_ref = models.BigIntegerField(null=True, blank=True, editable=False)
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    cantidad = models.FloatField()
+    reference = models.CharField(max_length=50, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.get_kind_display()} {self.cantidad:+g} ({self.product_id}/{self.variant_id})"
+
+    class Meta:
+        verbose_name = "Movimiento de Stock"
+        verbose_name_plural = "Movimientos de Stock"
+        indexes = [
+            models.Index(fields=['product', 'variant_ref', 'created_at'], name='stock_movement_item_time'),
+        ]
+
+class StockSnapshot(models.Model):
+    """
+    Existencia de un ítem al cierre de una corrida de snapshot: incluye todos
+    los movimientos con id <= last_movement_id.
+    """
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='stock_snapshots')
+    variant = models.ForeignKey(ProductVariant, on_delete=models.SET_NULL, null=True, blank=True, related_name='stock_snapshots')
+    variant_ref = models.BigIntegerField(null=True, blank=True, editable=False)
+    cantidad = models.FloatField()
+    last_movement_id = models.BigIntegerField()
+    taken_at = models.DateTimeField()
+
+    class Meta:
+        verbose_name = "Snapshot de Stock"
+        verbose_name_plural = "Snapshots de Stock"
+        indexes = [
+            models.Index(fields=['product', 'variant_ref', 'taken_at'], name='stock_snapshot_item_time'),
+        ]
 
 class Category(models.Model):
     business = models.ForeignKey(Business, on_delete=models.CASCADE)
@@ -110,8 +179,51 @@ class Category(models.Model):
 class ProductImage(models.Model):
     product = models.ForeignKey(Product, on_delete=models.CASCADE)
     imagen = models.ImageField(upload_to='productos/')
+    # Versiones reducidas generadas en segundo plano: {"webp": {"320": "productos/..."}, "jpeg": {...}}
+    derivatives = models.JSONField(default=dict, blank=True)
 
     class Meta:
         verbose_name = "Imagen de Producto"
         verbose_name_plural = "Imágenes de Productos"
 
+class ProductFacet(models.Model):
+    """
+    Índice de facetas por negocio: (nombre de atributo, valor) -> ids de producto
+    ordenados. Incluye atributos de producto y de variante. Lo mantiene
+    API.products.facets; no se edita a mano.
+    """
+    business = models.ForeignKey(Business, on_delete=models.CASCADE, related_name='facets')
+    name = models.ForeignKey(AttributeName, on_delete=models.CASCADE, related_name='facets')
+    value = models.CharField(max_length=100)
+    product_ids = models.JSONField(default=list)
+
+    def __str__(self):
+        return f"{self.name.name}={self.value} ({len(self.product_ids)})"
+
+    class Meta:
+        verbose_name = "Faceta de Producto"
+        verbose_name_plural = "Facetas de Producto"
+        constraints = [
+            models.UniqueConstraint(fields=['business', 'name', 'value'], name='unique_business_facet'),
+        ]
+
+class ProductSearch(models.Model):
+    """
+    Documento de búsqueda de texto completo (Postgres). Lo mantiene
+    API.products.search; en SQLite se usa la tabla FTS5 products_search_fts.
+    """
+    # Sin FK en la base de datos ni CASCADE del ORM: en SQLite la tabla no existe.
+    # Al borrar un producto su documento lo quita la señal post_delete de API.products.search
+    product = models.OneToOneField(
+        Product, on_delete=models.DO_NOTHING, db_constraint=False, primary_key=True, related_name='+',
+    )
+    business = models.ForeignKey(Business, on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    document = SearchVectorField()
+
+    class Meta:
+        db_table = 'products_search'
+        verbose_name = "Documento de Búsqueda"
+        verbose_name_plural = "Documentos de Búsqueda"
+        indexes = [
+            GinIndex(fields=['document'], name='products_search_document_gin'),
+        ]
@@ -1,10 +1,12 @@
 from rest_framework import serializers
 from ...models import Product, Attribute, Inventory, Category, ProductImage, ProductVariant, VariantAttribute, InventoryVariant, AttributeName
+from ...images import srcset
 
 class AttributeDetailSerializer(serializers.ModelSerializer):
 	class Meta:
 		model = Attribute
 		fields = ['name', 'value']
+		catalog_select_related = ['name']
 
 	def to_representation(self, instance):
 		data = super().to_representation(instance)
@@ -25,21 +27,33 @@ class CategoryDetailSerializer(serializers.ModelSerializer):
 class ProductImageDetailSerializer(serializers.ModelSerializer):
 
 	imagen = serializers.SerializerMethodField()
+	srcset = serializers.SerializerMethodField()
+	srcset_jpeg = serializers.SerializerMethodField()
 
 	class Meta:
 		model = ProductImage
-		fields = ['imagen']
+		fields = ['imagen', 'srcset', 'srcset_jpeg']
 
-	def get_imagen(self, obj):
+	def _absolute(self, url):
 		request = self.context.get('request')
 		if request:
-			return request.build_absolute_uri(obj.imagen.url)
-		return obj.imagen.url
+			return request.build_absolute_uri(url)
+		return url
+
+	def get_imagen(self, obj):
+		return self._absolute(obj.imagen.url)
+
+	def get_srcset(self, obj):
+		return srcset(obj, self._absolute, 'webp')
+
+	def get_srcset_jpeg(self, obj):
+		return srcset(obj, self._absolute, 'jpeg')
 
 class VariantAttributeDetailSerializer(serializers.ModelSerializer):
 	class Meta:
 		model = VariantAttribute
 		fields = ['name', 'value']
+		catalog_select_related = ['name']
 
 	def to_representation(self, instance):
 		data = super().to_representation(instance)
@@ -72,6 +86,8 @@ class ProductDetailSerializer(serializers.ModelSerializer):
 			'name', 'price_base', 'descripcion',
 			'attributes', 'inventario', 'categories', 'images', 'variants'
 		]
+		# get_images recorre productimage_set
+		catalog_prefetch_related = ['productimage_set']
 
 	def get_images(self, obj):
 		images = obj.productimage_set.all()
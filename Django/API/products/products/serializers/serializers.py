@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from ...models import Product, ProductImage, Attribute, Inventory, ProductVariant, VariantAttribute, InventoryVariant
+from ...images import srcset
 
 class AttributeSerializer(serializers.ModelSerializer):
     class Meta:
@@ -7,9 +8,15 @@ class AttributeSerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'value']
 
 class ProductImageSerializer(serializers.ModelSerializer):
+    srcset = serializers.SerializerMethodField()
+
     class Meta:
         model = ProductImage
-        fields = ['id', 'imagen']
+        fields = ['id', 'imagen', 'srcset']
+
+    def get_srcset(self, obj):
+        request = self.context.get('request')
+        return srcset(obj, request.build_absolute_uri if request else str)
 
 class InventorySerializer(serializers.ModelSerializer):
     class Meta:
@@ -39,4 +39,15 @@ class ProductCreateSerializer(serializers.ModelSerializer):
         fields = [
             'name', 'price_base', 'descripcion',
             'attributes', 'inventario', 'category_ids', 'variants'
-        ]
\ No newline at end of file
+        ]
+
+    def validate_variants(self, value):
+        # Dos variantes con la misma combinación de atributos violarían unique_variant_signature
+        seen = set()
+        for variant in value:
+            combination = tuple(sorted((attr['name'], attr['value']) for attr in variant['attributes']))
+            if combination in seen:
+                pairs = ', '.join(f"{name}={val}" for name, val in combination)
+                raise serializers.ValidationError(f"Combinación de atributos repetida: {pairs}.")
+            seen.add(combination)
+        return value
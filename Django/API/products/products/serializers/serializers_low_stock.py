@@ -0,0 +1,19 @@
+from rest_framework import serializers
+from ...models import Inventory, InventoryVariant
+
+
+class LowStockInventorySerializer(serializers.ModelSerializer):
+    product_name = serializers.CharField(source='product.name', read_only=True)
+
+    class Meta:
+        model = Inventory
+        fields = ['id', 'product', 'product_name', 'unidad_medida', 'cantidad', 'stock_minimo']
+
+
+class LowStockVariantSerializer(serializers.ModelSerializer):
+    product = serializers.IntegerField(source='variant.product_id', read_only=True)
+    product_name = serializers.CharField(source='variant.product.name', read_only=True)
+
+    class Meta:
+        model = InventoryVariant
+        fields = ['id', 'variant', 'product', 'product_name', 'cantidad', 'stock_minimo']
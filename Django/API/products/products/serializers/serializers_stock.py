@@ -0,0 +1,26 @@
+from rest_framework import serializers
+
+MAX_ADJUSTMENTS = 10000
+
+
+class StockAdjustmentItemSerializer(serializers.Serializer):
+    product = serializers.IntegerField()
+    variant = serializers.IntegerField(required=False, allow_null=True)
+    cantidad = serializers.FloatField(required=False, allow_null=True, min_value=0)
+    delta = serializers.FloatField(required=False, allow_null=True)
+
+    def validate(self, attrs):
+        if (attrs.get('cantidad') is None) == (attrs.get('delta') is None):
+            raise serializers.ValidationError("Indique cantidad (absoluta) o delta, no ambos.")
+        return attrs
+
+
+class StockAdjustmentSerializer(serializers.Serializer):
+    reference = serializers.CharField(max_length=50, required=False, allow_blank=True, default='')
+    items = StockAdjustmentItemSerializer(many=True, allow_empty=False, max_length=MAX_ADJUSTMENTS)
+
+    def validate_items(self, value):
+        keys = [(item['product'], item.get('variant')) for item in value]
+        if len(set(keys)) != len(keys):
+            raise serializers.ValidationError("Hay ítems repetidos en el ajuste.")
+        return value
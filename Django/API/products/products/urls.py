@@ -4,18 +4,36 @@ from .views.create import ProductRegisterView
 from .views.attributename import AttributeNameListView, AttributeNameCreateView
 from .views.unidad_medida import UnidadMedidaListView
 from .views.detail import ProductDetailView
+from .views.cache_stats import ProductCacheStatsView
 from .views.update import ProductUpdateView
+from .views.bulk_import import ProductBulkImportView
+from .views.search import ProductSearchView
+from .views.export import ProductExportView
+from .views.stock import ProductStockAtView
+from .views.stock_bulk import StockBulkAdjustView
+from .views.low_stock import LowStockView
+from .views.variant_resolve import VariantResolveView
 
 urlpatterns = [
     path('business/<int:business_id>/', ProductsByBusinessView.as_view(), name='business-products'),
+    path('business/<int:business_id>/export/', ProductExportView.as_view(), name='business-products-export'),
     path('register/', ProductRegisterView.as_view(), name='product-register'),
+    path('import/', ProductBulkImportView.as_view(), name='product-import'),
+    path('search/', ProductSearchView.as_view(), name='product-search'),
+    path('low-stock/', LowStockView.as_view(), name='product-low-stock'),
+    path('variants/resolve/', VariantResolveView.as_view(), name='variant-resolve'),
     path('attribute-names/', AttributeNameListView.as_view(), name='attribute-names-list'),
     path('attribute-names/create/', AttributeNameCreateView.as_view(), name='attribute-names-create'),
     path('unidad-medida/', UnidadMedidaListView.as_view(), name='unidad-medida-list'),
 
     # Detalle de producto
     path('detail/<int:pk>/', ProductDetailView.as_view(), name='product-detail'),
+    path('cache-stats/', ProductCacheStatsView.as_view(), name='product-cache-stats'),
 
     # Actualizar producto
     path('update/<int:pk>/', ProductUpdateView.as_view(), name='product-update'),
+
+    # Existencia histórica según el libro de stock
+    path('stock/<int:pk>/', ProductStockAtView.as_view(), name='product-stock-at'),
+    path('stock/bulk/', StockBulkAdjustView.as_view(), name='product-stock-bulk'),
 ]
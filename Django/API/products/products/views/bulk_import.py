@@ -0,0 +1,50 @@
+import io
+
+from rest_framework import status
+from rest_framework.parsers import MultiPartParser
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from drf_spectacular.utils import extend_schema, OpenApiResponse
+from ...context import BusinessContextMixin
+from ...importer import ProductImporter, READERS
+
+
+@extend_schema(
+    request={
+        "multipart/form-data": {
+            "type": "object",
+            "properties": {
+                "file": {"type": "string", "format": "binary", "description": "Archivo CSV o NDJSON"},
+                "format": {"type": "string", "enum": sorted(READERS)},
+            },
+            "required": ["file"]
+        }
+    },
+    responses={
+        200: OpenApiResponse(description="Resumen de la importación: productos creados y errores por fila."),
+        400: OpenApiResponse(description="Archivo o formato inválido."),
+        403: OpenApiResponse(description="Usuario sin negocio."),
+    },
+    description="Importa productos en lote desde un archivo CSV o NDJSON. Requiere autenticación."
+)
+class ProductBulkImportView(BusinessContextMixin, APIView):
+    permission_classes = [IsAuthenticated]
+    parser_classes = [MultiPartParser]
+
+    def post(self, request):
+        business = request.business
+        if business is None:
+            return Response({"error": "Usuario sin negocio."}, status=403)
+
+        upload = request.FILES.get('file')
+        if upload is None:
+            return Response({"error": "Archivo requerido."}, status=400)
+
+        fmt = request.data.get('format') or ('csv' if upload.name.endswith('.csv') else 'ndjson')
+        if fmt not in READERS:
+            return Response({"error": f"Formato no soportado: {fmt}."}, status=400)
+
+        stream = io.TextIOWrapper(upload.file, encoding='utf-8', newline='')
+        report = ProductImporter(business).run(stream, fmt=fmt)
+        return Response(report, status=status.HTTP_200_OK)
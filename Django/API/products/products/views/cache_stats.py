@@ -0,0 +1,17 @@
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from drf_spectacular.utils import extend_schema, OpenApiTypes
+from ...cache import cache_stats
+
+
+@extend_schema(
+    responses={200: OpenApiTypes.OBJECT},
+    description="Aciertos, fallos, respuestas 304 e invalidaciones de la caché de detalle de productos. Solo staff."
+)
+class ProductCacheStatsView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(cache_stats(), status=status.HTTP_200_OK)
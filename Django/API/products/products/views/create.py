@@ -4,7 +4,7 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView
 from drf_spectacular.utils import extend_schema, OpenApiResponse
-from ...models import Business, AttributeName
+from ...context import BusinessContextMixin
 from ..serializers.serializers_create import ProductCreateSerializer
 from ...services import ProductService
 
@@ -16,13 +16,12 @@ from ...services import ProductService
     },
     description="Registra un nuevo producto en el sistema. Requiere autenticación."
 )
-class ProductRegisterView(APIView):
+class ProductRegisterView(BusinessContextMixin, APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
-        try:
-            business = Business.objects.get(user=request.user)
-        except Business.DoesNotExist:
+        business = request.business
+        if business is None:
             return Response({"error": "Usuario sin negocio."}, status=403)
 
         serializer = ProductCreateSerializer(data=request.data)
@@ -5,9 +5,12 @@ from rest_framework import status
 from drf_spectacular.utils import extend_schema, OpenApiResponse
 from ...models import Product
 from ..serializers.serializer_view import ProductDetailSerializer
+from ...catalog import build_catalog_queryset
+from ...cache import product_version, get_cached_detail, set_cached_detail, record
+from django.utils.http import parse_etags
 
 from rest_framework.permissions import IsAuthenticated
-from ...models import Business
+from ...context import BusinessContextMixin
 
 @extend_schema(
 	responses={
@@ -17,23 +20,37 @@ from ...models import Business
 	},
 	description="Obtiene el detalle de un producto por ID. Requiere autenticación."
 )
-class ProductDetailView(APIView):
+class ProductDetailView(BusinessContextMixin, APIView):
 	permission_classes = [IsAuthenticated]
 
 	def get(self, request, pk, *args, **kwargs):
-		try:
-			product = Product.objects.get(pk=pk)
-		except Product.DoesNotExist:
+		business_id = Product.objects.filter(pk=pk).values_list('business_id', flat=True).first()
+		if business_id is None:
 			return Response({"error": "Producto no encontrado."}, status=status.HTTP_404_NOT_FOUND)
 
 		# Validar que el producto pertenezca al negocio del usuario
-		try:
-			business_obj = Business.objects.get(user=request.user)
-		except Business.DoesNotExist:
+		if request.business is None:
 			return Response({"error": "El usuario no tiene un negocio asociado."}, status=status.HTTP_403_FORBIDDEN)
 
-		if product.business_id != business_obj.id:
+		if business_id not in request.business_ids:
 			return Response({"error": "No autorizado para ver este producto."}, status=status.HTTP_403_FORBIDDEN)
 
-		serializer = ProductDetailSerializer(product, context={'request': request})
-		return Response(serializer.data, status=status.HTTP_200_OK)
+		# Payload cacheado bajo la versión actual del producto
+		version = product_version(pk)
+		host = request.get_host()
+		entry = get_cached_detail(pk, version, host)
+		if entry is not None:
+			etag, data = entry
+			cache_status = 'HIT'
+		else:
+			product = build_catalog_queryset(ProductDetailSerializer).get(pk=pk)
+			data = ProductDetailSerializer(product, context={'request': request}).data
+			etag = set_cached_detail(pk, version, host, data)
+			cache_status = 'MISS'
+
+		headers = {'ETag': etag, 'X-Cache': cache_status}
+		if etag in parse_etags(request.headers.get('If-None-Match', '')):
+			record('not_modified')
+			return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+		return Response(data, status=status.HTTP_200_OK, headers=headers)
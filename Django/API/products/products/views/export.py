@@ -0,0 +1,36 @@
+from django.http import StreamingHttpResponse
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
+from ...context import BusinessContextMixin
+from ...export import EXPORTERS
+
+
+@extend_schema(
+    parameters=[
+        OpenApiParameter('fmt', str, enum=sorted(EXPORTERS), description="Formato de salida (por defecto ndjson)."),
+    ],
+    responses={
+        200: OpenApiResponse(description="Catálogo completo en streaming (NDJSON o CSV)."),
+        400: OpenApiResponse(description="Formato no soportado."),
+        404: OpenApiResponse(description="Negocio no encontrado."),
+    },
+    description="Exporta el catálogo del negocio (productos, variantes e inventario) con memoria constante. Requiere autenticación."
+)
+class ProductExportView(BusinessContextMixin, APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, business_id):
+        if business_id not in request.business_ids:
+            return Response({"error": "Negocio no encontrado."}, status=404)
+
+        fmt = request.query_params.get('fmt', 'ndjson')
+        if fmt not in EXPORTERS:
+            return Response({"error": f"Formato no soportado: {fmt}."}, status=400)
+
+        rows, content_type = EXPORTERS[fmt]
+        response = StreamingHttpResponse(rows(business_id), content_type=content_type)
+        extension = 'csv' if fmt == 'csv' else 'ndjson'
+        response['Content-Disposition'] = f'attachment; filename="catalogo-{business_id}.{extension}"'
+        return response
@@ -1,14 +1,45 @@
 from rest_framework import generics
 from rest_framework.permissions import IsAuthenticated
-from ...models import Product, Business
+from ...models import Product
+from ...context import BusinessContextMixin
 from ..serializers.serializers import ProductSerializer
+from ...catalog import build_catalog_queryset
+from ...facets import FacetIndex, parse_facet_filters
+from API.pagination import ProductCursorPagination
 
-class ProductsByBusinessView(generics.ListAPIView):
+class ProductsByBusinessView(BusinessContextMixin, generics.ListAPIView):
     serializer_class = ProductSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = ProductCursorPagination
 
     def get_queryset(self):
         # Filtra los productos por la empresa del usuario autenticado
         business_id = self.kwargs.get('business_id')
-        # Opcional: solo permitir ver productos de empresas que pertenecen al usuario
-        return Product.objects.filter(business__id=business_id, business__user=self.request.user)
\ No newline at end of file
+        # Solo empresas que pertenecen al usuario (propiedad ya resuelta: sin JOIN con business)
+        self.facet_ids = None
+        if business_id not in self.request.business_ids:
+            return Product.objects.none()
+        queryset = Product.objects.filter(business_id=business_id)
+
+        # Filtros por atributo (?attr=Color:Rojo&attr=Talla:M) resueltos con el índice de facetas
+        self.facet_ids = FacetIndex.filter_ids(business_id, parse_facet_filters(self.request.query_params.getlist('attr')))
+        if self.facet_ids is not None:
+            queryset = queryset.filter(id__in=self.facet_ids)
+
+        # Número fijo de consultas sin importar cuántos productos tenga el negocio
+        return build_catalog_queryset(ProductSerializer, queryset)
+
+    def wants_facets(self, request):
+        # Los conteos recorren todo el índice del negocio: solo en la primera página
+        # (sin cursor) o si se piden explícitamente con ?facets=1
+        cursor_param = self.paginator.cursor_query_param
+        return cursor_param not in request.query_params or request.query_params.get('facets') == '1'
+
+    def list(self, request, *args, **kwargs):
+        response = super().list(request, *args, **kwargs)
+        if self.wants_facets(request):
+            # Conteos por (atributo, valor) sobre el conjunto filtrado
+            business_id = self.kwargs.get('business_id')
+            owned = business_id in request.business_ids
+            response.data['facets'] = FacetIndex.counts(business_id, self.facet_ids) if owned else []
+        return response
@@ -0,0 +1,43 @@
+from rest_framework import generics
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+from ...models import Inventory, InventoryVariant, LOW_STOCK
+from ..serializers.serializers_low_stock import LowStockInventorySerializer, LowStockVariantSerializer
+from ...context import BusinessContextMixin
+from API.pagination import ProductCursorPagination
+
+KINDS = ('product', 'variant')
+
+
+@extend_schema(
+    parameters=[
+        OpenApiParameter('kind', str, enum=KINDS, description="product (inventario del producto, por defecto) o variant."),
+    ],
+    responses={200: LowStockInventorySerializer(many=True)},
+    description="Inventarios del negocio del usuario con cantidad por debajo de stock_minimo, paginados por cursor. Requiere autenticación."
+)
+class LowStockView(BusinessContextMixin, generics.ListAPIView):
+    permission_classes = [IsAuthenticated]
+    pagination_class = ProductCursorPagination
+
+    def kind(self):
+        kind = self.request.query_params.get('kind', 'product')
+        if kind not in KINDS:
+            raise ValidationError({"error": "kind debe ser product o variant."})
+        return kind
+
+    def get_serializer_class(self):
+        return LowStockVariantSerializer if self.kind() == 'variant' else LowStockInventorySerializer
+
+    def get_queryset(self):
+        # El predicado LOW_STOCK coincide con el de los índices parciales
+        if self.kind() == 'variant':
+            return (
+                InventoryVariant.objects.filter(LOW_STOCK, variant__product__business_id__in=self.request.business_ids)
+                .select_related('variant__product')
+            )
+        return (
+            Inventory.objects.filter(LOW_STOCK, product__business_id__in=self.request.business_ids)
+            .select_related('product')
+        )
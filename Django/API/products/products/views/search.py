@@ -0,0 +1,53 @@
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
+from ...models import Product
+from ...context import BusinessContextMixin
+from ...catalog import build_catalog_queryset
+from ...search import search_products
+from ..serializers.serializers import ProductSerializer
+
+MAX_LIMIT = 100
+
+
+@extend_schema(
+    parameters=[
+        OpenApiParameter('q', str, description="Texto a buscar en nombre, descripción y valores de atributos."),
+        OpenApiParameter('limit', int, description=f"Máximo de resultados (por defecto 20, máximo {MAX_LIMIT})."),
+    ],
+    responses={
+        200: ProductSerializer(many=True),
+        400: OpenApiResponse(description="Parámetro q requerido o limit inválido."),
+        403: OpenApiResponse(description="Usuario sin negocio."),
+    },
+    description="Busca productos del negocio del usuario ordenados por relevancia. Requiere autenticación."
+)
+class ProductSearchView(BusinessContextMixin, APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        business = request.business
+        if business is None:
+            return Response({"error": "Usuario sin negocio."}, status=403)
+
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            return Response({"error": "Parámetro q requerido."}, status=400)
+        try:
+            limit = min(int(request.query_params.get('limit', 20)), MAX_LIMIT)
+        except ValueError:
+            return Response({"error": "limit debe ser un entero."}, status=400)
+        if limit < 1:
+            return Response({"error": "limit debe ser mayor que 0."}, status=400)
+
+        ranked = search_products(business.id, query, limit)
+        ranks = dict(ranked)
+        products = build_catalog_queryset(ProductSerializer, Product.objects.filter(id__in=ranks))
+        products = sorted(products, key=lambda p: (-ranks[p.id], p.id))
+
+        data = ProductSerializer(products, many=True, context={'request': request}).data
+        for item in data:
+            item['rank'] = ranks[item['id']]
+        return Response(data, status=status.HTTP_200_OK)
@@ -0,0 +1,49 @@
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
+from ...models import Product
+from ...ledger import StockLedger
+from ...context import BusinessContextMixin
+
+
+@extend_schema(
+    parameters=[
+        OpenApiParameter('at', str, description="Instante ISO 8601 (por defecto, ahora)."),
+        OpenApiParameter('variant', int, description="Id de la variante; sin él, el inventario del producto."),
+    ],
+    responses={
+        200: OpenApiResponse(description="{product, variant, at, cantidad}"),
+        400: OpenApiResponse(description="Parámetros inválidos."),
+        404: OpenApiResponse(description="Producto no encontrado."),
+    },
+    description="Existencia de un producto o variante en un instante dado, según el libro de stock. Requiere autenticación."
+)
+class ProductStockAtView(BusinessContextMixin, APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, pk):
+        if not Product.objects.filter(pk=pk, business_id__in=request.business_ids).exists():
+            return Response({"error": "Producto no encontrado."}, status=status.HTTP_404_NOT_FOUND)
+
+        at = timezone.now()
+        if request.query_params.get('at'):
+            at = parse_datetime(request.query_params['at'])
+            if at is None:
+                return Response({"error": "at debe ser una fecha ISO 8601."}, status=status.HTTP_400_BAD_REQUEST)
+            if timezone.is_naive(at):
+                at = timezone.make_aware(at)
+        try:
+            variant_id = int(request.query_params['variant']) if request.query_params.get('variant') else None
+        except ValueError:
+            return Response({"error": "variant debe ser un entero."}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({
+            'product': pk,
+            'variant': variant_id,
+            'at': at,
+            'cantidad': StockLedger.stock_at(pk, at, variant_id),
+        }, status=status.HTTP_200_OK)
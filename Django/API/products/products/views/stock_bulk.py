@@ -0,0 +1,39 @@
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from drf_spectacular.utils import extend_schema, OpenApiResponse
+from ...context import BusinessContextMixin
+from ...ledger import StockLedger, StockAdjustmentError
+from ..serializers.serializers_stock import StockAdjustmentSerializer
+
+
+@extend_schema(
+    request=StockAdjustmentSerializer,
+    responses={
+        200: OpenApiResponse(description="{updated: n}"),
+        400: OpenApiResponse(description="Errores de validación o ítems ajenos al negocio."),
+        403: OpenApiResponse(description="Usuario sin negocio."),
+    },
+    description="Ajuste masivo de existencias (conteo físico) de productos y variantes. Requiere autenticación."
+)
+class StockBulkAdjustView(BusinessContextMixin, APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        business = request.business
+        if business is None:
+            return Response({"error": "Usuario sin negocio."}, status=403)
+
+        serializer = StockAdjustmentSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=400)
+
+        try:
+            updated = StockLedger.bulk_adjust(
+                business.id, serializer.validated_data['items'], serializer.validated_data['reference'],
+            )
+        except StockAdjustmentError as e:
+            missing = [{kind: pk} for kind, pk in e.missing]
+            return Response({"error": str(e), "missing": missing}, status=400)
+        return Response({"updated": updated}, status=status.HTTP_200_OK)
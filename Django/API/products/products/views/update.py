@@ -4,10 +4,12 @@ from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from drf_spectacular.utils import extend_schema, OpenApiResponse
-from ...models import Product, AttributeName
+from ...models import Product
+from ...registry import attribute_names
+from ...services import ProductService
 from ..serializers.serializers_create import ProductCreateSerializer
 
-from ...models import Business
+from ...context import BusinessContextMixin
 
 @extend_schema(
 	request=ProductCreateSerializer,
@@ -19,7 +21,7 @@ from ...models import Business
 	},
 	description="Edita un producto existente por ID. Requiere autenticación."
 )
-class ProductUpdateView(APIView):
+class ProductUpdateView(BusinessContextMixin, APIView):
 	permission_classes = [IsAuthenticated]
 
 	def put(self, request, pk, *args, **kwargs):
@@ -29,27 +31,24 @@ class ProductUpdateView(APIView):
 			return Response({"error": "Producto no encontrado."}, status=status.HTTP_404_NOT_FOUND)
 
 		# Validar que el producto pertenezca al negocio del usuario
-		try:
-			business_obj = Business.objects.get(user=request.user)
-		except Business.DoesNotExist:
+		if request.business is None:
 			return Response({"error": "El usuario no tiene un negocio asociado."}, status=status.HTTP_403_FORBIDDEN)
 
-		if product.business_id != business_obj.id:
+		if product.business_id not in request.business_ids:
 			return Response({"error": "No autorizado para editar este producto."}, status=status.HTTP_403_FORBIDDEN)
 
-		data = request.data.copy()
-		# Convertir 'name' de cada atributo a su id
+		data = request.data
+		# Validar que existan los nombres de atributo (una sola consulta para todos)
 		if 'attributes' in data:
-			for attr in data['attributes']:
-				if isinstance(attr.get('name'), str):
-					try:
-						attr_name_obj = AttributeName.objects.get(name=attr['name'])
-						attr['name'] = attr_name_obj.id
-					except AttributeName.DoesNotExist:
-						return Response({"error": f"El atributo '{attr['name']}' no existe."}, status=status.HTTP_400_BAD_REQUEST)
+			wanted = [attr.get('name') for attr in data['attributes']]
+			names = attribute_names.resolve(wanted, create=False)
+			for name in wanted:
+				if name not in names:
+					return Response({"error": f"El atributo '{name}' no existe."}, status=status.HTTP_400_BAD_REQUEST)
 
 		serializer = ProductCreateSerializer(product, data=data, partial=True)
 		if serializer.is_valid():
-			serializer.save()
+			# Reconciliación: solo se escriben las filas que cambian
+			ProductService.update_product(product, dict(serializer.validated_data))
 			return Response({"success": True, "product_id": product.id}, status=status.HTTP_200_OK)
 		return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
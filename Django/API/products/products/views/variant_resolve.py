@@ -0,0 +1,54 @@
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
+from ...models import ProductVariant
+from ...facets import parse_facet_filters
+from ...registry import attribute_names
+from ...services import variant_signature_hash
+from ...context import BusinessContextMixin
+from ..serializers.serializers import ProductVariantSerializer
+
+
+@extend_schema(
+    parameters=[
+        OpenApiParameter('product', int, required=True, description="Id del producto."),
+        OpenApiParameter('attr', str, many=True, description="Combinación Nombre:Valor (repetible), p. ej. attr=Color:Rojo&attr=Talla:M."),
+    ],
+    responses={
+        200: ProductVariantSerializer,
+        400: OpenApiResponse(description="Parámetros inválidos."),
+        404: OpenApiResponse(description="No existe una variante con esa combinación."),
+    },
+    description="Resuelve la variante de un producto a partir de su combinación de atributos. Requiere autenticación."
+)
+class VariantResolveView(BusinessContextMixin, APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        try:
+            product_id = int(request.query_params.get('product', ''))
+        except ValueError:
+            return Response({"error": "product debe ser un entero."}, status=status.HTTP_400_BAD_REQUEST)
+        pairs = parse_facet_filters(request.query_params.getlist('attr'))
+        if not pairs:
+            return Response({"error": "Indique al menos un attr=Nombre:Valor."}, status=status.HTTP_400_BAD_REQUEST)
+
+        names = attribute_names.resolve({name for name, _ in pairs}, create=False)
+        if len(names) < len({name for name, _ in pairs}):
+            return Response({"error": "Variante no encontrada."}, status=status.HTTP_404_NOT_FOUND)
+
+        # Una sola búsqueda por el índice único (product, signature)
+        variant = (
+            ProductVariant.objects.filter(
+                product_id=product_id,
+                product__business_id__in=request.business_ids,
+                signature=variant_signature_hash((names[name], value) for name, value in pairs),
+            )
+            .select_related('inventario_variante').prefetch_related('variant_attributes')
+            .first()
+        )
+        if variant is None:
+            return Response({"error": "Variante no encontrada."}, status=status.HTTP_404_NOT_FOUND)
+        return Response(ProductVariantSerializer(variant).data, status=status.HTTP_200_OK)
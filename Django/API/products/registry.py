@@ -0,0 +1,74 @@
+# products/registry.py
+import threading
+from collections import OrderedDict
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import AttributeName
+
+
+class AttributeNameRegistry:
+    """
+    Resuelve nombres de atributo ("Color", "Talla", ...) a su id en lote.
+
+    Mantiene un mapa nombre -> id acotado (LRU) por proceso. Los nombres que
+    faltan se buscan en una sola consulta y, si se pide, se crean con un único
+    bulk_create. El mapa se invalida con las señales de AttributeName.
+    """
+
+    def __init__(self, max_size=1024):
+        self.max_size = max_size
+        self._ids = OrderedDict()
+        self._lock = threading.Lock()
+
+    def resolve(self, names, create=True):
+        """Devuelve {nombre: id} para los nombres conocidos (o creados)."""
+        wanted = set(names)
+        resolved = {}
+        with self._lock:
+            for name in wanted:
+                if name in self._ids:
+                    self._ids.move_to_end(name)
+                    resolved[name] = self._ids[name]
+
+        missing = wanted - resolved.keys()
+        if missing:
+            found = dict(AttributeName.objects.filter(name__in=missing).values_list('name', 'id'))
+            missing -= found.keys()
+            if missing and create:
+                AttributeName.objects.bulk_create(
+                    [AttributeName(name=name) for name in missing], ignore_conflicts=True
+                )
+                found.update(AttributeName.objects.filter(name__in=missing).values_list('name', 'id'))
+            resolved.update(found)
+            # Si la transacción se revierte, los ids creados no deben quedar en caché
+            transaction.on_commit(partial(self._store, found))
+
+        return resolved
+
+    def invalidate(self, pk=None):
+        with self._lock:
+            if pk is None:
+                self._ids.clear()
+                return
+            for name in [name for name, id_ in self._ids.items() if id_ == pk]:
+                del self._ids[name]
+
+    def _store(self, mapping):
+        with self._lock:
+            self._ids.update(mapping)
+            while len(self._ids) > self.max_size:
+                self._ids.popitem(last=False)
+
+
+attribute_names = AttributeNameRegistry()
+
+
+@receiver(post_save, sender=AttributeName)
+@receiver(post_delete, sender=AttributeName)
+def invalidate_attribute_name(sender, instance, **kwargs):
+    # Un renombrado deja la clave vieja apuntando al mismo id: se invalida por id
+    attribute_names.invalidate(instance.pk)
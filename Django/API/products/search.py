@@ -0,0 +1,140 @@
+# products/search.py
+import re
+
+from django.db import connections, router
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from .models import Product, ProductSearch, Attribute, VariantAttribute
+
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+class PostgresSearchBackend:
+    """
+    tsvector ponderado (nombre A, descripción B, valores de atributos C) en el
+    modelo ProductSearch, con índice GIN.
+    """
+
+    table = ProductSearch._meta.db_table
+
+    def write(self, cursor, rows):
+        cursor.executemany(f"""
+            INSERT INTO {self.table} (product_id, business_id, document)
+            VALUES (%s, %s,
+                setweight(to_tsvector('spanish', %s), 'A') ||
+                setweight(to_tsvector('spanish', %s), 'B') ||
+                setweight(to_tsvector('spanish', %s), 'C'))
+            ON CONFLICT (product_id) DO UPDATE
+            SET business_id = EXCLUDED.business_id, document = EXCLUDED.document
+        """, rows)
+
+    def delete(self, cursor, product_ids):
+        cursor.execute(f"DELETE FROM {self.table} WHERE product_id = ANY(%s)", [list(product_ids)])
+
+    def search(self, cursor, business_id, query, limit):
+        tokens = TOKEN_RE.findall(query)
+        if not tokens:
+            return []
+        # Prefijos: "cam" encuentra "camisa"
+        tsquery = ' & '.join(f'{token}:*' for token in tokens)
+        cursor.execute(f"""
+            SELECT product_id, ts_rank(document, q) AS rank
+            FROM {self.table}, to_tsquery('spanish', %s) q
+            WHERE business_id = %s AND document @@ q
+            ORDER BY rank DESC, product_id
+            LIMIT %s
+        """, [tsquery, business_id, limit])
+        return cursor.fetchall()
+
+
+class SQLiteSearchBackend:
+    """Tabla virtual FTS5 (rowid = id del producto) ordenada por bm25; la crea la migración 0003_search."""
+
+    table = 'products_search_fts'
+
+    def write(self, cursor, rows):
+        cursor.executemany(
+            f"INSERT OR REPLACE INTO {self.table} (rowid, business_id, name, descripcion, attributes) "
+            "VALUES (%s, %s, %s, %s, %s)",
+            rows,
+        )
+
+    def delete(self, cursor, product_ids):
+        product_ids = list(product_ids)
+        if product_ids:
+            placeholders = ', '.join(['%s'] * len(product_ids))
+            cursor.execute(f"DELETE FROM {self.table} WHERE rowid IN ({placeholders})", product_ids)
+
+    def search(self, cursor, business_id, query, limit):
+        tokens = TOKEN_RE.findall(query)
+        if not tokens:
+            return []
+        match = ' '.join(f'"{token}"*' for token in tokens)
+        # Mismas ponderaciones que en Postgres: nombre > descripción > atributos
+        cursor.execute(f"""
+            SELECT rowid, bm25({self.table}, 0, 10.0, 4.0, 2.0) AS rank
+            FROM {self.table}
+            WHERE {self.table} MATCH %s AND business_id = %s
+            ORDER BY rank, rowid
+            LIMIT %s
+        """, [match, business_id, limit])
+        # bm25 es "menor es mejor": se invierte para exponer un rank creciente
+        return [(product_id, -rank) for product_id, rank in cursor.fetchall()]
+
+
+BACKENDS = {
+    'postgresql': PostgresSearchBackend(),
+    'sqlite': SQLiteSearchBackend(),
+}
+
+
+def _backend(using):
+    return BACKENDS[connections[using].vendor]
+
+
+def _using():
+    return router.db_for_write(Product)
+
+
+def index_products(product_ids):
+    """
+    Recalcula los documentos de búsqueda de los productos indicados
+    (nombre, descripción y valores de atributos de producto y de variante).
+    """
+    product_ids = set(product_ids)
+    if not product_ids:
+        return
+    values = {product_id: [] for product_id in product_ids}
+    for product_id, value in Attribute.objects.filter(product_id__in=product_ids).values_list('product_id', 'value'):
+        values[product_id].append(value)
+    variant_values = VariantAttribute.objects.filter(variant__product_id__in=product_ids)
+    for product_id, value in variant_values.values_list('variant__product_id', 'value'):
+        values[product_id].append(value)
+
+    rows = [
+        (product_id, business_id, name, descripcion, ' '.join(dict.fromkeys(values[product_id])))
+        for product_id, business_id, name, descripcion in Product.objects.filter(id__in=product_ids)
+        .values_list('id', 'business_id', 'name', 'descripcion')
+    ]
+    using = _using()
+    with connections[using].cursor() as cursor:
+        _backend(using).write(cursor, rows)
+
+
+def remove_products(product_ids):
+    using = _using()
+    with connections[using].cursor() as cursor:
+        _backend(using).delete(cursor, product_ids)
+
+
+def search_products(business_id, query, limit=50):
+    """Devuelve [(product_id, rank)] ordenado de mayor a menor relevancia."""
+    using = router.db_for_read(Product)
+    with connections[using].cursor() as cursor:
+        return _backend(using).search(cursor, business_id, query, limit)
+
+
+@receiver(post_delete, sender=Product)
+def _remove_deleted_product(sender, instance, **kwargs):
+    remove_products([instance.pk])
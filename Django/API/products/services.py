@@ -1,6 +1,14 @@
 # products/services.py
+import hashlib
+import json
+
 from django.db import transaction
-from .models import Product, Attribute, Inventory, AttributeName, ProductVariant, InventoryVariant, Category
+from .models import Product, Attribute, Inventory, ProductVariant, VariantAttribute, InventoryVariant, Category
+from .registry import attribute_names
+from .cache import invalidate_product
+from .search import index_products
+from .facets import FacetIndex
+from .ledger import StockLedger
 
 class ProductService:
     @staticmethod
@@ -17,65 +25,202 @@ class ProductService:
 
         # 2. Categorías
         if category_ids:
-            product.productos.set(Category.objects.filter(id__in=category_ids, business=business))
+            product.category_set.set(Category.objects.filter(id__in=category_ids, business=business))
 
-        # 3. Inventario
+        # 3. Inventario (con su movimiento inicial en el libro de stock)
         if inventario_data:
-            Inventory.objects.create(product=product, **inventario_data)
+            inventory = Inventory.objects.create(product=product, **inventario_data)
+            StockLedger.append([StockLedger.movement(product.id, inventory.cantidad)])
 
-        # 4. Atributos
-        for attr in attributes_data:
-            attr_name_obj, _ = AttributeName.objects.get_or_create(name=attr['name'])
-            Attribute.objects.create(product=product, name=attr_name_obj, value=attr['value'])
+        # 4. Atributos (todos los nombres se resuelven en una sola consulta)
+        names = attribute_names.resolve(ProductService._attribute_names(attributes_data, variants_data))
+        Attribute.objects.bulk_create([
+            Attribute(product=product, name_id=names[attr['name']], value=attr['value'])
+            for attr in attributes_data
+        ])
 
         # 5. Variantes
-        for var_data in variants_data:
-            ProductService._create_variant(product, var_data)
+        ProductService._create_variants(product, variants_data, names)
+
+        # 6. Índices de búsqueda y de facetas
+        index_products([product.id])
+        FacetIndex.apply(business.id, {}, FacetIndex.pairs_for([product.id]))
 
         return product
 
     @staticmethod
     @transaction.atomic
     def update_product(product, data):
-        """Mueve aquí la lógica que estaba en el update del serializer."""
+        """
+        Actualiza el producto reconciliando atributos y variantes con lo que
+        ya existe: solo se insertan, actualizan o borran las filas que cambian.
+        Las variantes sin cambios conservan su id (SaleItem.variant apunta a él).
+        """
         attributes_data = data.pop('attributes', None)
         inventario_data = data.pop('inventario', None)
         variants_data = data.pop('variants', None)
-        
+        category_ids = data.pop('category_ids', None)
+
         # Actualizar campos básicos
         for attr, value in data.items():
             setattr(product, attr, value)
         product.save()
 
-        # Actualizar Inventario
+        # Actualizar Inventario (el cambio de cantidad queda como ajuste en el libro)
         if inventario_data:
-            Inventory.objects.update_or_create(product=product, defaults=inventario_data)
+            previous = Inventory.objects.filter(product=product).values_list('cantidad', flat=True).first()
+            inventory, _ = Inventory.objects.update_or_create(product=product, defaults=inventario_data)
+            StockLedger.append([StockLedger.movement(product.id, inventory.cantidad - (previous or 0))])
+
+        if category_ids is not None:
+            product.category_set.set(Category.objects.filter(id__in=category_ids, business=product.business_id))
+
+        names = attribute_names.resolve(
+            ProductService._attribute_names(attributes_data or [], variants_data or [])
+        )
+
+        facets_before = FacetIndex.pairs_for([product.id])
 
-        # Actualizar Atributos (Borrar y crear es lo más seguro para sincronizar)
         if attributes_data is not None:
-            product.attributes.all().delete()
-            for attr in attributes_data:
-                name_obj, _ = AttributeName.objects.get_or_create(name=attr['name'])
-                Attribute.objects.create(product=product, name=name_obj, value=attr['value'])
+            ProductService._sync_attributes(product, attributes_data, names)
 
-        # Actualizar Variantes
         if variants_data is not None:
-            product.variants.all().delete()
-            for var_data in variants_data:
-                ProductService._create_variant(product, var_data)
+            ProductService._sync_variants(product, variants_data, names)
 
+        # bulk_create/bulk_update no emiten señales: se invalida explícitamente
+        invalidate_product(product.id)
+        index_products([product.id])
+        FacetIndex.apply(product.business_id, facets_before, FacetIndex.pairs_for([product.id]))
         return product
 
     @staticmethod
-    def _create_variant(product, variant_data):
-        attrs = variant_data.pop('attributes', [])
-        cantidad = variant_data.pop('cantidad', 0)
-        stock_minimo = variant_data.pop('stock_minimo', 5)
-        
-        variant = ProductVariant.objects.create(product=product)
-        for attr in attrs:
-            name_obj, _ = AttributeName.objects.get_or_create(name=attr['name'])
-            from .models import VariantAttribute
-            VariantAttribute.objects.create(variant=variant, name=name_obj, value=attr['value'])
-            
-        InventoryVariant.objects.create(variant=variant, cantidad=cantidad, stock_minimo=stock_minimo)
\ No newline at end of file
+    def _sync_attributes(product, attributes_data, names):
+        """Diff por nombre de atributo contra las filas actuales."""
+        current = {}
+        for attr in product.attributes.all():
+            current.setdefault(attr.name_id, []).append(attr)
+
+        to_create, to_update = [], []
+        for attr_data in attributes_data:
+            name_id = names[attr_data['name']]
+            existing = current.get(name_id)
+            if existing:
+                attr = existing.pop(0)
+                if attr.value != attr_data['value']:
+                    attr.value = attr_data['value']
+                    to_update.append(attr)
+            else:
+                to_create.append(Attribute(product=product, name_id=name_id, value=attr_data['value']))
+
+        stale = [attr.id for rows in current.values() for attr in rows]
+        if stale:
+            Attribute.objects.filter(id__in=stale).delete()
+        Attribute.objects.bulk_update(to_update, ['value'])
+        Attribute.objects.bulk_create(to_create)
+
+    @staticmethod
+    def _sync_variants(product, variants_data, names):
+        """Diff por firma de atributos de variante contra las variantes actuales."""
+        current = {}
+        variants = product.variants.select_related('inventario_variante').prefetch_related('variant_attributes')
+        for variant in variants:
+            signature = variant_signature((a.name_id, a.value) for a in variant.variant_attributes.all())
+            current.setdefault(signature, []).append(variant)
+
+        to_create, inventories_to_create, inventories_to_update, movements = [], [], [], []
+        signatures_to_update = []
+        for var_data in variants_data:
+            signature = variant_signature(
+                (names[a['name']], a['value']) for a in var_data.get('attributes', [])
+            )
+            matches = current.get(signature)
+            if not matches:
+                to_create.append(var_data)
+                continue
+
+            variant = matches.pop(0)
+            # Variantes anteriores a la firma indexada: se completa al pasar por aquí
+            if variant.signature != signature_hash(signature):
+                variant.signature = signature_hash(signature)
+                signatures_to_update.append(variant)
+            cantidad = var_data.get('cantidad', 0)
+            stock_minimo = var_data.get('stock_minimo', 5)
+            try:
+                inventory = variant.inventario_variante
+            except InventoryVariant.DoesNotExist:
+                inventories_to_create.append(
+                    InventoryVariant(variant=variant, cantidad=cantidad, stock_minimo=stock_minimo)
+                )
+                movements.append(StockLedger.movement(product.id, cantidad, variant.id))
+                continue
+            if (inventory.cantidad, inventory.stock_minimo) != (cantidad, stock_minimo):
+                movements.append(StockLedger.movement(product.id, cantidad - inventory.cantidad, variant.id))
+                inventory.cantidad = cantidad
+                inventory.stock_minimo = stock_minimo
+                inventories_to_update.append(inventory)
+
+        stale = [variant.id for rows in current.values() for variant in rows]
+        if stale:
+            ProductVariant.objects.filter(id__in=stale).delete()
+        ProductVariant.objects.bulk_update(signatures_to_update, ['signature'])
+        InventoryVariant.objects.bulk_update(inventories_to_update, ['cantidad', 'stock_minimo'])
+        InventoryVariant.objects.bulk_create(inventories_to_create)
+        StockLedger.append(movements)
+        ProductService._create_variants(product, to_create, names)
+
+    @staticmethod
+    def _attribute_names(attributes_data, variants_data):
+        names = {attr['name'] for attr in attributes_data}
+        for var_data in variants_data:
+            names.update(attr['name'] for attr in var_data.get('attributes', []))
+        return names
+
+    @staticmethod
+    def _create_variant(product, variant_data, names=None):
+        return ProductService._create_variants(product, [variant_data], names)[0]
+
+    @staticmethod
+    def _create_variants(product, variants_data, names=None):
+        """Crea variantes con sus atributos e inventario en un bulk_create por modelo."""
+        if names is None:
+            names = attribute_names.resolve(ProductService._attribute_names([], variants_data))
+
+        variants = ProductVariant.objects.bulk_create([
+            ProductVariant(product=product, signature=variant_signature_hash(
+                (names[attr['name']], attr['value']) for attr in var_data.get('attributes', [])
+            ))
+            for var_data in variants_data
+        ])
+        VariantAttribute.objects.bulk_create([
+            VariantAttribute(variant=variant, name_id=names[attr['name']], value=attr['value'])
+            for variant, var_data in zip(variants, variants_data)
+            for attr in var_data.get('attributes', [])
+        ])
+        InventoryVariant.objects.bulk_create([
+            InventoryVariant(
+                variant=variant,
+                cantidad=var_data.get('cantidad', 0),
+                stock_minimo=var_data.get('stock_minimo', 5),
+            )
+            for variant, var_data in zip(variants, variants_data)
+        ])
+        StockLedger.append(
+            StockLedger.movement(product.id, var_data.get('cantidad', 0), variant.id)
+            for variant, var_data in zip(variants, variants_data)
+        )
+        return variants
+
+
+def variant_signature(pairs):
+    """Firma canónica de una variante: pares (AttributeName id, valor) ordenados."""
+    return tuple(sorted(pairs))
+
+
+def signature_hash(signature):
+    """sha256 de una firma canónica; es el valor indexado en ProductVariant.signature."""
+    canonical = json.dumps(signature, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def variant_signature_hash(pairs):
+    return signature_hash(variant_signature(pairs))
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import PaymentMethod, Sale, SaleItem
+from .models import PaymentMethod, Sale, SaleItem, DailySales, DailyProductSales, DailyPaymentSales, WhatsAppOutbox
 
 @admin.register(PaymentMethod)
 class PaymentMethodAdmin(admin.ModelAdmin):
@@ -18,3 +18,25 @@ class SaleItemAdmin(admin.ModelAdmin):
 	list_display = ('id', 'sale', 'product', 'variant', 'quantity', 'unit_price', 'subtotal')
 	search_fields = ('sale__id', 'product__name', 'variant__id')
 	list_filter = ('product',)
+
+
+@admin.register(DailySales)
+class DailySalesAdmin(admin.ModelAdmin):
+	list_display = ('business', 'day', 'sales_count', 'revenue')
+	list_filter = ('business', 'day')
+
+@admin.register(DailyProductSales)
+class DailyProductSalesAdmin(admin.ModelAdmin):
+	list_display = ('business', 'day', 'product', 'variant', 'quantity', 'revenue')
+	list_filter = ('business', 'day')
+
+@admin.register(DailyPaymentSales)
+class DailyPaymentSalesAdmin(admin.ModelAdmin):
+	list_display = ('business', 'day', 'payment_method', 'sales_count', 'revenue')
+	list_filter = ('business', 'day', 'payment_method')
+
+@admin.register(WhatsAppOutbox)
+class WhatsAppOutboxAdmin(admin.ModelAdmin):
+	list_display = ('id', 'sale', 'number', 'status', 'attempts', 'next_attempt_at', 'sent_at')
+	search_fields = ('number', 'sale__id')
+	list_filter = ('status',)
@@ -0,0 +1,110 @@
+# sale/analytics.py
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, F, Q, Sum, Window
+from django.db.models.functions import ExtractHour, Rank
+from django.utils import timezone
+
+from API.cache_utils import bump_version
+from .models import Sale, DailySales, DailyProductSales
+from .rollups import day_start
+
+def analytics_ttl():
+    # Corto: con una caché por proceso, la invalidación no llega a los demás workers
+    return getattr(settings, 'ANALYTICS_CACHE_TTL', 60)
+
+
+def _version_key(business_id):
+    return f'sales:{business_id}:version'
+
+
+def analytics_version(business_id):
+    return cache.get(_version_key(business_id), 0)
+
+
+def invalidate_analytics(business_id):
+    """Sube la versión de analítica del negocio cuando la transacción confirma."""
+    bump_version(_version_key(business_id))
+
+
+def cached(business_id, name, start, end, compute, **params):
+    """Resultado cacheado por (negocio, reporte, rango, parámetros) bajo la versión actual."""
+    extra = ':'.join(f'{key}={value}' for key, value in sorted(params.items()))
+    key = f'sales:{business_id}:{analytics_version(business_id)}:{name}:{start}:{end}:{extra}'
+    result = cache.get(key)
+    if result is None:
+        result = compute(business_id, start, end, **params)
+        cache.set(key, result, timeout=analytics_ttl())
+    return result
+
+
+def top_products(business_id, start, end, limit=10):
+    """Top-N por ingresos desde los acumulados diarios, con el rango calculado por la base de datos."""
+    rows = (
+        DailyProductSales.objects.filter(business_id=business_id, day__gte=start, day__lte=end)
+        .values('product_id', product_name=F('product__name'))
+        # rank va primero: así Sum('revenue') se refiere a la columna y no a la anotación
+        .annotate(rank=Window(Rank(), order_by=Sum('revenue').desc()))
+        .annotate(quantity=Sum('quantity'), revenue=Sum('revenue'))
+        .order_by('rank', 'product_id')[:limit]
+    )
+    return list(rows)
+
+
+def revenue_by_hour(business_id, start, end):
+    since, until = day_start(start), day_start(end + timedelta(days=1))
+    return list(
+        Sale.objects.filter(business_id=business_id, sale_date__gte=since, sale_date__lt=until)
+        .annotate(hour=ExtractHour('sale_date', tzinfo=timezone.get_current_timezone()))
+        .values('hour')
+        .annotate(sales_count=Count('id'), revenue=Sum('total_amount'))
+        .order_by('hour')
+    )
+
+
+def summary(business_id, start, end):
+    """
+    Ventas, ingresos y ticket promedio del rango y del periodo anterior de
+    igual duración, en una sola agregación sobre los acumulados diarios.
+    """
+    previous_start = start - (end - start) - timedelta(days=1)
+    current, previous = Q(day__gte=start), Q(day__lt=start)
+    totals = DailySales.objects.filter(
+        business_id=business_id, day__gte=previous_start, day__lte=end,
+    ).aggregate(
+        current_count=Sum('sales_count', filter=current, default=0),
+        current_revenue=Sum('revenue', filter=current, default=0),
+        previous_count=Sum('sales_count', filter=previous, default=0),
+        previous_revenue=Sum('revenue', filter=previous, default=0),
+    )
+
+    def ticket(revenue, count):
+        return round(revenue / count, 2) if count else 0
+
+    def change(now, before):
+        return round((now - before) / before * 100, 2) if before else None
+
+    return {
+        'from': start,
+        'to': end,
+        'sales_count': totals['current_count'],
+        'revenue': totals['current_revenue'],
+        'average_ticket': ticket(totals['current_revenue'], totals['current_count']),
+        'previous': {
+            'from': previous_start,
+            'to': start - timedelta(days=1),
+            'sales_count': totals['previous_count'],
+            'revenue': totals['previous_revenue'],
+            'average_ticket': ticket(totals['previous_revenue'], totals['previous_count']),
+        },
+        'revenue_change_pct': change(totals['current_revenue'], totals['previous_revenue']),
+    }
+
+
+REPORTS = {
+    'top-products': top_products,
+    'by-hour': revenue_by_hour,
+    'summary': summary,
+}
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class SaleConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'API.sale'
+
+    def ready(self):
+        # Receptor que conserva los acumulados de variantes eliminadas
+        from . import rollups  # noqa: F401
@@ -0,0 +1,85 @@
+# sale/export.py
+from django.db.models import Prefetch
+from django.utils import timezone
+
+from API.streaming import csv_lines, ndjson_lines
+from .models import Sale, SaleItem
+
+EXPORT_CHUNK_SIZE = 500
+
+CSV_COLUMNS = [
+    'sale_id', 'sale_date', 'seller', 'payment_method', 'total_amount', 'notes',
+    'item_id', 'product_id', 'product_name', 'variant_id', 'quantity', 'unit_price', 'subtotal',
+]
+
+
+def export_queryset(business_id, since=None, until=None):
+    """
+    Ventas del negocio en orden (sale_date, id). iterator(chunk_size) usa un
+    cursor del lado del servidor en Postgres y precarga los ítems por bloque.
+    """
+    sales = Sale.objects.filter(business_id=business_id)
+    if since:
+        sales = sales.filter(sale_date__gte=since)
+    if until:
+        sales = sales.filter(sale_date__lt=until)
+    return (
+        sales.select_related('payment_method', 'seller')
+        .prefetch_related(Prefetch('items', queryset=SaleItem.objects.select_related('product').order_by('id')))
+        .order_by('sale_date', 'id')
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+
+
+def sale_record(sale):
+    return {
+        'id': sale.id,
+        'sale_date': timezone.localtime(sale.sale_date),
+        'seller': sale.seller.username,
+        'payment_method': sale.payment_method.name,
+        'total_amount': sale.total_amount,
+        'notes': sale.notes or '',
+        'items': [item_record(item) for item in sale.items.all()],
+    }
+
+
+def item_record(item):
+    return {
+        'id': item.id,
+        'product_id': item.product_id,
+        'product_name': item.product.name,
+        'variant_id': item.variant_id,
+        'quantity': item.quantity,
+        'unit_price': item.unit_price,
+        'subtotal': item.subtotal,
+    }
+
+
+def iter_ndjson(sales):
+    """Una línea JSON por venta, con sus ítems anidados."""
+    return ndjson_lines(sale_record(sale) for sale in sales)
+
+
+def _csv_rows(sales):
+    for sale in sales:
+        record = sale_record(sale)
+        base = [
+            record['id'], record['sale_date'].isoformat(), record['seller'], record['payment_method'],
+            record['total_amount'], record['notes'],
+        ]
+        for item in record['items']:
+            yield base + [
+                item['id'], item['product_id'], item['product_name'], item['variant_id'] or '',
+                item['quantity'], item['unit_price'], item['subtotal'],
+            ]
+
+
+def iter_csv(sales):
+    """Una fila por ítem de venta, con los datos de la venta repetidos."""
+    return csv_lines(CSV_COLUMNS, _csv_rows(sales))
+
+
+EXPORTERS = {
+    'ndjson': (iter_ndjson, 'application/x-ndjson'),
+    'csv': (iter_csv, 'text/csv; charset=utf-8'),
+}
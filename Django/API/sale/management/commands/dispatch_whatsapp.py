@@ -0,0 +1,13 @@
+from API.outbox import DispatchCommand
+from API.sale.notifications import dispatch
+
+
+class Command(DispatchCommand):
+    help = "Envía los mensajes de WhatsApp pendientes del outbox."
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument('--concurrency', type=int, default=4, help="Envíos simultáneos.")
+
+    def dispatch(self, options):
+        return dispatch(options['batch_size'], options['concurrency'])
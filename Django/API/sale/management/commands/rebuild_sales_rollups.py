@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from API.products.models import Business
+from API.sale.analytics import invalidate_analytics
+from API.sale.rollups import SalesRollup
+
+
+class Command(BaseCommand):
+    help = "Reconstruye los acumulados diarios de ventas a partir de Sale y SaleItem."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--business', type=int, default=None, help="Solo este negocio.")
+        parser.add_argument('--since', default=None, help="Primer día a recalcular (YYYY-MM-DD).")
+
+    def handle(self, *args, **options):
+        since = None
+        if options['since']:
+            since = parse_date(options['since'])
+            if since is None:
+                raise CommandError("--since debe tener el formato YYYY-MM-DD.")
+
+        businesses = Business.objects.order_by('id').values_list('id', flat=True)
+        if options['business']:
+            businesses = businesses.filter(id=options['business'])
+
+        for business_id in businesses:
+            SalesRollup.rebuild(business_id, since)
+            invalidate_analytics(business_id)
+            self.stdout.write(f"Negocio {business_id}: acumulados de ventas reconstruidos.")
@@ -0,0 +1,123 @@
+# Generated by Django 5.1.4 on 2026-10-18 17:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('products', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PaymentMethod',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True)),
+                ('description', models.TextField(blank=True, null=True)),
+                ('is_active', models.BooleanField(default=True)),
+            ],
+            options={
+                'verbose_name': 'Método de Pago',
+                'verbose_name_plural': 'Métodos de Pago',
+            },
+        ),
+        migrations.CreateModel(
+            name='SaleItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('quantity', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('unit_price', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('subtotal', models.DecimalField(decimal_places=2, max_digits=10)),
+            ],
+            options={
+                'verbose_name': 'Ítem de Venta',
+                'verbose_name_plural': 'Ítems de Venta',
+            },
+        ),
+        migrations.CreateModel(
+            name='WhatsAppOutbox',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('number', models.CharField(max_length=20)),
+                ('message', models.TextField()),
+                ('status', models.CharField(choices=[('pending', 'Pendiente'), ('sent', 'Enviado'), ('dead', 'Descartado')], default='pending', max_length=10)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('next_attempt_at', models.DateTimeField(auto_now_add=True)),
+                ('last_error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('sent_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Mensaje de WhatsApp',
+                'verbose_name_plural': 'Mensajes de WhatsApp',
+            },
+        ),
+        migrations.CreateModel(
+            name='DailyProductSales',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('quantity', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('revenue', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('business', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_product_sales', to='products.business')),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='products.product')),
+                ('variant', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='products.productvariant')),
+            ],
+            options={
+                'verbose_name': 'Venta Diaria por Producto',
+                'verbose_name_plural': 'Ventas Diarias por Producto',
+            },
+        ),
+        migrations.CreateModel(
+            name='DailySales',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('sales_count', models.PositiveIntegerField(default=0)),
+                ('revenue', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('business', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_sales', to='products.business')),
+            ],
+            options={
+                'verbose_name': 'Venta Diaria',
+                'verbose_name_plural': 'Ventas Diarias',
+            },
+        ),
+        migrations.CreateModel(
+            name='DailyPaymentSales',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('sales_count', models.PositiveIntegerField(default=0)),
+                ('revenue', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('business', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_payment_sales', to='products.business')),
+                ('payment_method', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, to='sale.paymentmethod')),
+            ],
+            options={
+                'verbose_name': 'Venta Diaria por Método de Pago',
+                'verbose_name_plural': 'Ventas Diarias por Método de Pago',
+            },
+        ),
+        migrations.CreateModel(
+            name='Sale',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total_amount', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('sale_date', models.DateTimeField(auto_now_add=True)),
+                ('notes', models.TextField(blank=True, null=True)),
+                ('whatsapp_message', models.TextField(blank=True, null=True)),
+                ('whatsapp_number', models.CharField(blank=True, max_length=20, null=True)),
+                ('business', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sales', to='products.business')),
+                ('payment_method', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='sales', to='sale.paymentmethod')),
+            ],
+            options={
+                'verbose_name': 'Venta',
+                'verbose_name_plural': 'Ventas',
+                'ordering': ['-sale_date'],
+            },
+        ),
+    ]
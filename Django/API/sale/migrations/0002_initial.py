@@ -0,0 +1,72 @@
+# Generated by Django 5.1.4 on 2026-10-18 17:41
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('products', '0002_initial'),
+        ('sale', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sale',
+            name='seller',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sales_made', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='saleitem',
+            name='product',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='products.product'),
+        ),
+        migrations.AddField(
+            model_name='saleitem',
+            name='sale',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='items', to='sale.sale'),
+        ),
+        migrations.AddField(
+            model_name='saleitem',
+            name='variant',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='products.productvariant'),
+        ),
+        migrations.AddField(
+            model_name='whatsappoutbox',
+            name='sale',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='whatsapp_messages', to='sale.sale'),
+        ),
+        migrations.AddConstraint(
+            model_name='dailyproductsales',
+            constraint=models.UniqueConstraint(condition=models.Q(('variant__isnull', True)), fields=('business', 'day', 'product'), name='unique_daily_product_sales'),
+        ),
+        migrations.AddConstraint(
+            model_name='dailyproductsales',
+            constraint=models.UniqueConstraint(condition=models.Q(('variant__isnull', False)), fields=('business', 'day', 'product', 'variant'), name='unique_daily_variant_sales'),
+        ),
+        migrations.AddConstraint(
+            model_name='dailysales',
+            constraint=models.UniqueConstraint(fields=('business', 'day'), name='unique_daily_sales'),
+        ),
+        migrations.AddConstraint(
+            model_name='dailypaymentsales',
+            constraint=models.UniqueConstraint(fields=('business', 'day', 'payment_method'), name='unique_daily_payment_sales'),
+        ),
+        migrations.AddIndex(
+            model_name='sale',
+            index=models.Index(fields=['business', '-sale_date'], name='sale_business_date'),
+        ),
+        migrations.AddIndex(
+            model_name='sale',
+            index=models.Index(fields=['business', '-id'], name='sale_business_id'),
+        ),
+        migrations.AddIndex(
+            model_name='whatsappoutbox',
+            index=models.Index(fields=['status', 'next_attempt_at'], name='whatsapp_outbox_due'),
+        ),
+    ]
@@ -28,7 +28,7 @@ class Sale(models.Model):
     whatsapp_number = models.CharField(max_length=20, blank=True, null=True)
 
     def clean(self):
-        if self.business.user != self.seller:
+        if self.business.user_id != self.seller_id:
             raise ValidationError("El vendedor debe ser el propietario del negocio.")
     def save(self, *args, **kwargs):
         self.clean()
@@ -38,6 +38,12 @@ class Sale(models.Model):
         ordering = ['-sale_date']
         verbose_name = "Venta"
         verbose_name_plural = "Ventas"
+        indexes = [
+            # Listado y filtros por rango de fechas dentro de un negocio
+            models.Index(fields=['business', '-sale_date'], name='sale_business_date'),
+            # Clave del cursor del listado (SaleCursorPagination)
+            models.Index(fields=['business', '-id'], name='sale_business_id'),
+        ]
 
 class SaleItem(models.Model):
     sale = models.ForeignKey(Sale, on_delete=models.CASCADE, related_name='items')
@@ -49,4 +55,89 @@ class SaleItem(models.Model):
     
     class Meta:
         verbose_name = "Ítem de Venta"
-        verbose_name_plural = "Ítems de Venta"
\ No newline at end of file
+        verbose_name_plural = "Ítems de Venta"
+
+# Acumulados diarios: se actualizan en la misma transacción que cada venta
+# (SalesRollup.record) y se reconstruyen con el comando rebuild_sales_rollups
+class DailySales(models.Model):
+    business = models.ForeignKey(Business, on_delete=models.CASCADE, related_name='daily_sales')
+    day = models.DateField()
+    sales_count = models.PositiveIntegerField(default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+    class Meta:
+        verbose_name = "Venta Diaria"
+        verbose_name_plural = "Ventas Diarias"
+        constraints = [
+            models.UniqueConstraint(fields=['business', 'day'], name='unique_daily_sales'),
+        ]
+
+class DailyProductSales(models.Model):
+    business = models.ForeignKey(Business, on_delete=models.CASCADE, related_name='daily_product_sales')
+    day = models.DateField()
+    product = models.ForeignKey(Product, on_delete=models.CASCADE)
+    # Como SaleItem.variant; antes de borrar la variante, sus filas se suman a las del producto
+    # (API.sale.rollups), así que SET_NULL nunca choca con unique_daily_product_sales
+    variant = models.ForeignKey(ProductVariant, on_delete=models.SET_NULL, null=True, blank=True)
+    quantity = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+    class Meta:
+        verbose_name = "Venta Diaria por Producto"
+        verbose_name_plural = "Ventas Diarias por Producto"
+        constraints = [
+            # NULL no es comparable en un índice único: una restricción por caso
+            models.UniqueConstraint(
+                fields=['business', 'day', 'product'], condition=models.Q(variant__isnull=True),
+                name='unique_daily_product_sales',
+            ),
+            models.UniqueConstraint(
+                fields=['business', 'day', 'product', 'variant'], condition=models.Q(variant__isnull=False),
+                name='unique_daily_variant_sales',
+            ),
+        ]
+
+class DailyPaymentSales(models.Model):
+    business = models.ForeignKey(Business, on_delete=models.CASCADE, related_name='daily_payment_sales')
+    day = models.DateField()
+    payment_method = models.ForeignKey(PaymentMethod, on_delete=models.PROTECT)
+    sales_count = models.PositiveIntegerField(default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+    class Meta:
+        verbose_name = "Venta Diaria por Método de Pago"
+        verbose_name_plural = "Ventas Diarias por Método de Pago"
+        constraints = [
+            models.UniqueConstraint(fields=['business', 'day', 'payment_method'], name='unique_daily_payment_sales'),
+        ]
+
+class WhatsAppOutbox(models.Model):
+    """
+    Outbox transaccional: el mensaje se inserta en la misma transacción que
+    la venta y lo envía después el comando dispatch_whatsapp.
+    """
+    STATUS_CHOICES = [
+        ('pending', 'Pendiente'),
+        ('sent', 'Enviado'),
+        ('dead', 'Descartado'),
+    ]
+    sale = models.ForeignKey(Sale, on_delete=models.CASCADE, related_name='whatsapp_messages')
+    number = models.CharField(max_length=20)
+    message = models.TextField()
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveIntegerField(default=0)
+    # Próximo intento; al reclamar un mensaje se adelanta (lease) para que otro despachador no lo tome
+    next_attempt_at = models.DateTimeField(auto_now_add=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"WhatsApp {self.number} ({self.get_status_display()})"
+
+    class Meta:
+        verbose_name = "Mensaje de WhatsApp"
+        verbose_name_plural = "Mensajes de WhatsApp"
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at'], name='whatsapp_outbox_due'),
+        ]
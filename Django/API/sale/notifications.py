@@ -0,0 +1,85 @@
+# sale/notifications.py
+import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+
+from API import outbox
+from .models import WhatsAppOutbox
+
+logger = logging.getLogger(__name__)
+
+
+class TransportError(Exception):
+    """Fallo al entregar un mensaje; el despachador lo reintenta con backoff."""
+
+
+class BaseTransport:
+    """Proveedor de mensajería: `send` debe lanzar TransportError si no entrega."""
+
+    def send(self, number, message):
+        raise NotImplementedError
+
+
+class LocalTransport(BaseTransport):
+    """Sustituto para tests: guarda los mensajes en memoria (nunca en producción)."""
+
+    sent = []
+
+    def send(self, number, message):
+        LocalTransport.sent.append((number, message))
+
+
+def get_transport():
+    # Sin valor por defecto: un despliegue sin proveedor no debe marcar mensajes como enviados
+    path = getattr(settings, 'WHATSAPP_TRANSPORT', None)
+    if not path:
+        raise ImproperlyConfigured("WHATSAPP_TRANSPORT no está configurado.")
+    return import_string(path)()
+
+
+def _max_attempts():
+    return getattr(settings, 'WHATSAPP_MAX_ATTEMPTS', 5)
+
+
+def enqueue(sale):
+    """Encola el mensaje de la venta, si tiene. Llamar dentro de la transacción de la venta."""
+    if sale.whatsapp_number and sale.whatsapp_message:
+        return WhatsAppOutbox.objects.create(
+            sale=sale, number=sale.whatsapp_number, message=sale.whatsapp_message,
+        )
+
+
+def claim(batch_size):
+    """Reclama mensajes vencidos con lease (ver API.outbox.claim)."""
+    return outbox.claim(WhatsAppOutbox.objects.all(), batch_size)
+
+
+def _deliver(transport, message):
+    try:
+        transport.send(message.number, message.message)
+        return None
+    except TransportError as e:
+        return str(e)
+    except Exception as e:
+        logger.exception("Error inesperado enviando el mensaje %s", message.pk)
+        return repr(e)
+
+
+def dispatch(batch_size=100, concurrency=4, transport=None):
+    """
+    Envía un bloque de mensajes con a lo sumo `concurrency` envíos simultáneos.
+    Los resultados se guardan desde este hilo con un solo bulk_update.
+    """
+    transport = transport or get_transport()
+    messages = claim(batch_size)
+    if not messages:
+        return Counter()
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        errors = list(pool.map(lambda message: _deliver(transport, message), messages))
+
+    return outbox.settle(messages, errors, _max_attempts())
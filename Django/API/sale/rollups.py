@@ -0,0 +1,114 @@
+# sale/rollups.py
+from collections import defaultdict
+from datetime import datetime, time
+from decimal import Decimal
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from API.products.models import ProductVariant
+from .models import Sale, SaleItem, DailySales, DailyProductSales, DailyPaymentSales
+
+
+def sale_day(sale):
+    """Día de la venta en la zona horaria del proyecto (TIME_ZONE)."""
+    return timezone.localdate(sale.sale_date)
+
+
+def day_start(day):
+    """Primer instante del día en TIME_ZONE: los filtros por día son rangos sobre sale_date."""
+    return timezone.make_aware(datetime.combine(day, time.min), timezone.get_current_timezone())
+
+
+def _bump(model, keys, **deltas):
+    """
+    Suma `deltas` a la fila `keys`, creándola si no existe. Si dos ventas
+    concurrentes crean la misma fila, la perdedora reintenta como UPDATE.
+    """
+    increments = {field: F(field) + value for field, value in deltas.items()}
+    if model.objects.filter(**keys).update(**increments):
+        return
+    try:
+        with transaction.atomic():
+            model.objects.create(**keys, **deltas)
+    except IntegrityError:
+        model.objects.filter(**keys).update(**increments)
+
+
+class SalesRollup:
+    """Acumulados diarios por negocio, producto/variante y método de pago."""
+
+    @staticmethod
+    def record(sale, items):
+        """Suma una venta recién creada a los acumulados. Llamar dentro de su transacción."""
+        day = sale_day(sale)
+        _bump(DailySales, {'business_id': sale.business_id, 'day': day},
+              sales_count=1, revenue=sale.total_amount)
+        _bump(DailyPaymentSales,
+              {'business_id': sale.business_id, 'day': day, 'payment_method_id': sale.payment_method_id},
+              sales_count=1, revenue=sale.total_amount)
+
+        # Varias líneas del mismo ítem suman en una sola fila; orden fijo contra interbloqueos
+        totals = defaultdict(lambda: [Decimal('0'), Decimal('0')])
+        for item in items:
+            totals[(item.product_id, item.variant_id)][0] += item.quantity
+            totals[(item.product_id, item.variant_id)][1] += item.subtotal
+        for (product_id, variant_id), (quantity, revenue) in sorted(totals.items(), key=lambda kv: (kv[0][0], kv[0][1] or 0)):
+            _bump(DailyProductSales,
+                  {'business_id': sale.business_id, 'day': day, 'product_id': product_id, 'variant_id': variant_id},
+                  quantity=quantity, revenue=revenue)
+
+    @staticmethod
+    def fold_variant(variant_id):
+        """
+        Pasa los acumulados de una variante a la fila del producto, como
+        quedarían al reconstruir (SaleItem.variant pasa a NULL).
+        """
+        rows = DailyProductSales.objects.filter(variant_id=variant_id)
+        for row in rows.order_by('day'):
+            _bump(DailyProductSales,
+                  {'business_id': row.business_id, 'day': row.day, 'product_id': row.product_id, 'variant_id': None},
+                  quantity=row.quantity, revenue=row.revenue)
+        rows.delete()
+
+    @staticmethod
+    @transaction.atomic
+    def rebuild(business_id, since=None):
+        """Recalcula los acumulados del negocio (desde el día `since`, inclusive) a partir de las ventas."""
+        tz = timezone.get_current_timezone()
+        sales = Sale.objects.filter(business_id=business_id)
+        items = SaleItem.objects.filter(sale__business_id=business_id)
+        rollups = [DailySales, DailyProductSales, DailyPaymentSales]
+        if since:
+            start = day_start(since)
+            sales = sales.filter(sale_date__gte=start)
+            items = items.filter(sale__sale_date__gte=start)
+        for model in rollups:
+            queryset = model.objects.filter(business_id=business_id)
+            (queryset.filter(day__gte=since) if since else queryset).delete()
+
+        sales = sales.order_by().annotate(day=TruncDate('sale_date', tzinfo=tz))
+        DailySales.objects.bulk_create(
+            DailySales(business_id=business_id, **row)
+            for row in sales.values('day').annotate(sales_count=Count('id'), revenue=Sum('total_amount'))
+        )
+        DailyPaymentSales.objects.bulk_create(
+            DailyPaymentSales(business_id=business_id, **row)
+            for row in sales.values('day', 'payment_method_id')
+            .annotate(sales_count=Count('id'), revenue=Sum('total_amount'))
+        )
+        DailyProductSales.objects.bulk_create(
+            DailyProductSales(business_id=business_id, **row)
+            for row in items.order_by().annotate(day=TruncDate('sale__sale_date', tzinfo=tz))
+            .values('day', 'product_id', 'variant_id').annotate(quantity=Sum('quantity'), revenue=Sum('subtotal'))
+        )
+
+
+@receiver(pre_delete, sender=ProductVariant)
+def _variant_deleted(sender, instance, **kwargs):
+    # Corre dentro de la transacción del borrado
+    SalesRollup.fold_variant(instance.pk)
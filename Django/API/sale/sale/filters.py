@@ -0,0 +1,30 @@
+from datetime import timedelta
+
+from django_filters import rest_framework as filters
+from ..models import Sale
+from ..rollups import day_start
+
+
+class SaleFilter(filters.FilterSet):
+    """
+    ?from=YYYY-MM-DD&to=YYYY-MM-DD (inclusivos, en TIME_ZONE), payment_method y seller.
+    Los días se traducen a un rango sobre sale_date para aprovechar el índice
+    (business, -sale_date) en lugar de comparar sale_date::date.
+    """
+    payment_method = filters.NumberFilter(field_name='payment_method_id')
+    seller = filters.NumberFilter(field_name='seller_id')
+
+    class Meta:
+        model = Sale
+        fields = ['payment_method', 'seller']
+
+    def filter_from(self, queryset, name, value):
+        return queryset.filter(sale_date__gte=day_start(value))
+
+    def filter_to(self, queryset, name, value):
+        return queryset.filter(sale_date__lt=day_start(value + timedelta(days=1)))
+
+
+# "from" es palabra reservada: no puede declararse como atributo de la clase
+SaleFilter.base_filters['from'] = filters.DateFilter(method='filter_from')
+SaleFilter.base_filters['to'] = filters.DateFilter(method='filter_to')
@@ -0,0 +1,19 @@
+from decimal import Decimal
+
+from rest_framework import serializers
+from ...models import PaymentMethod
+
+
+class CheckoutItemSerializer(serializers.Serializer):
+    product = serializers.IntegerField()
+    variant = serializers.IntegerField(required=False, allow_null=True)
+    quantity = serializers.DecimalField(max_digits=10, decimal_places=2, min_value=Decimal('0.01'))
+
+
+class CheckoutSerializer(serializers.Serializer):
+    business = serializers.IntegerField()
+    payment_method = serializers.PrimaryKeyRelatedField(queryset=PaymentMethod.objects.filter(is_active=True))
+    items = CheckoutItemSerializer(many=True, allow_empty=False)
+    notes = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+    whatsapp_message = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+    whatsapp_number = serializers.CharField(required=False, allow_blank=True, allow_null=True, max_length=20)
@@ -6,12 +6,16 @@ class PaymentMethodSerializer(serializers.ModelSerializer):
         model = PaymentMethod
         fields = '__all__'
 
-class SaleSerializer(serializers.ModelSerializer):
+class SaleItemSerializer(serializers.ModelSerializer):
     class Meta:
-        model = Sale
+        model = SaleItem
         fields = '__all__'
 
-class SaleItemSerializer(serializers.ModelSerializer):
+class SaleSerializer(serializers.ModelSerializer):
+    items = SaleItemSerializer(many=True, read_only=True)
+    payment_method_name = serializers.CharField(source='payment_method.name', read_only=True)
+    seller_username = serializers.CharField(source='seller.username', read_only=True)
+
     class Meta:
-        model = SaleItem
-        fields = '__all__'
\ No newline at end of file
+        model = Sale
+        fields = '__all__'
@@ -1,6 +1,14 @@
 from django.urls import path
 from .views.sale import *
+from .views.checkout import CheckoutView
+from .views.reports import SalesReportView
+from .views.analytics import SalesAnalyticsView
+from .views.export import SaleExportView
 
 urlpatterns = [
     path('', SaleListView.as_view(), name='sale-list'),
-]
\ No newline at end of file
+    path('checkout/', CheckoutView.as_view(), name='sale-checkout'),
+    path('export/', SaleExportView.as_view(), name='sale-export'),
+    path('reports/<slug:dimension>/', SalesReportView.as_view(), name='sale-report'),
+    path('analytics/<slug:report>/', SalesAnalyticsView.as_view(), name='sale-analytics'),
+]
@@ -0,0 +1,59 @@
+from datetime import timedelta
+
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
+from API.products.context import BusinessContextMixin
+from ...analytics import REPORTS, cached
+from .reports import parse_day_range
+
+DEFAULT_DAYS = 30
+MAX_LIMIT = 100
+
+
+@extend_schema(
+    parameters=[
+        OpenApiParameter('from', str, description=f"Primer día (YYYY-MM-DD); por defecto, {DEFAULT_DAYS} días antes de to."),
+        OpenApiParameter('to', str, description="Último día (YYYY-MM-DD); por defecto, hoy."),
+        OpenApiParameter('limit', int, description=f"Solo top-products: cantidad de productos (por defecto 10, máximo {MAX_LIMIT})."),
+    ],
+    responses={
+        200: OpenApiResponse(description="Resultado del reporte."),
+        400: OpenApiResponse(description="Parámetros inválidos."),
+        403: OpenApiResponse(description="Usuario sin negocio."),
+        404: OpenApiResponse(description="Reporte desconocido."),
+    },
+    description="Analítica de ventas (top-products, by-hour, summary) agregada en la base de datos y cacheada por negocio y rango. Requiere autenticación."
+)
+class SalesAnalyticsView(BusinessContextMixin, APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, report):
+        if report not in REPORTS:
+            return Response({"error": "Reporte desconocido."}, status=status.HTTP_404_NOT_FOUND)
+        business = request.business
+        if business is None:
+            return Response({"error": "Usuario sin negocio."}, status=status.HTTP_403_FORBIDDEN)
+
+        try:
+            start, end = parse_day_range(request.query_params)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        end = end or timezone.localdate()
+        start = start or end - timedelta(days=DEFAULT_DAYS - 1)
+        if start > end:
+            return Response({"error": "from debe ser anterior o igual a to."}, status=status.HTTP_400_BAD_REQUEST)
+
+        params = {}
+        if report == 'top-products':
+            try:
+                params['limit'] = min(int(request.query_params.get('limit', 10)), MAX_LIMIT)
+            except ValueError:
+                return Response({"error": "limit debe ser un entero."}, status=status.HTTP_400_BAD_REQUEST)
+            if params['limit'] < 1:
+                return Response({"error": "limit debe ser mayor que 0."}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(cached(business.id, report, start, end, REPORTS[report], **params), status=status.HTTP_200_OK)
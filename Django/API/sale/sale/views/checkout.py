@@ -0,0 +1,45 @@
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from drf_spectacular.utils import extend_schema, OpenApiResponse
+from API.products.context import BusinessContextMixin
+from ...services import SaleService, CheckoutError
+from ..serializers.serializer_checkout import CheckoutSerializer
+from ..serializers.serializer_sale import SaleSerializer
+
+
+@extend_schema(
+    request=CheckoutSerializer,
+    responses={
+        201: SaleSerializer,
+        400: OpenApiResponse(description="Errores de validación o stock insuficiente."),
+        403: OpenApiResponse(description="El negocio no pertenece al usuario."),
+    },
+    description="Registra una venta: calcula subtotales y total en el servidor y descuenta el stock de forma atómica. Requiere autenticación."
+)
+class CheckoutView(BusinessContextMixin, APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        serializer = CheckoutSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        data = dict(serializer.validated_data)
+        business = self.get_owned_business(data.pop('business'))
+        if business is None:
+            return Response({"error": "El negocio no pertenece al usuario."}, status=status.HTTP_403_FORBIDDEN)
+
+        try:
+            sale = SaleService.checkout(
+                business=business,
+                seller=request.user,
+                payment_method=data.pop('payment_method'),
+                items=data.pop('items'),
+                **data,
+            )
+        except CheckoutError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(SaleSerializer(sale).data, status=status.HTTP_201_CREATED)
@@ -0,0 +1,60 @@
+from datetime import timedelta
+
+from django.http import StreamingHttpResponse
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
+from API.products.context import BusinessContextMixin
+from API.streaming import gzip_stream
+from ...export import EXPORTERS, export_queryset
+from ...rollups import day_start
+from .reports import parse_day_range
+
+
+@extend_schema(
+    parameters=[
+        OpenApiParameter('fmt', str, enum=sorted(EXPORTERS), description="Formato de salida (por defecto csv)."),
+        OpenApiParameter('from', str, description="Primer día (YYYY-MM-DD), inclusive."),
+        OpenApiParameter('to', str, description="Último día (YYYY-MM-DD), inclusive."),
+        OpenApiParameter('compress', str, enum=['gzip', 'none'], description="Compresión del archivo (por defecto gzip)."),
+    ],
+    responses={
+        200: OpenApiResponse(description="Ventas con sus ítems en streaming (CSV o NDJSON, opcionalmente gzip)."),
+        400: OpenApiResponse(description="Parámetros inválidos."),
+        403: OpenApiResponse(description="Usuario sin negocio."),
+    },
+    description="Exporta las ventas del negocio para contabilidad con memoria constante. Requiere autenticación."
+)
+class SaleExportView(BusinessContextMixin, APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        business = request.business
+        if business is None:
+            return Response({"error": "Usuario sin negocio."}, status=403)
+
+        fmt = request.query_params.get('fmt', 'csv')
+        if fmt not in EXPORTERS:
+            return Response({"error": f"Formato no soportado: {fmt}."}, status=400)
+        compress = request.query_params.get('compress', 'gzip')
+        if compress not in ('gzip', 'none'):
+            return Response({"error": "compress debe ser gzip o none."}, status=400)
+        try:
+            start, end = parse_day_range(request.query_params)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=400)
+
+        rows, content_type = EXPORTERS[fmt]
+        content = rows(export_queryset(
+            business.id,
+            since=day_start(start) if start else None,
+            until=day_start(end + timedelta(days=1)) if end else None,
+        ))
+        filename = f"ventas-{business.id}.{fmt}"
+        if compress == 'gzip':
+            content, content_type, filename = gzip_stream(content), 'application/gzip', filename + '.gz'
+
+        response = StreamingHttpResponse(content, content_type=content_type)
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
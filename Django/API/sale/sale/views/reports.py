@@ -0,0 +1,93 @@
+from django.db.models import Sum, F
+from django.utils.dateparse import parse_date
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
+from API.products.context import BusinessContextMixin
+from ...models import DailySales, DailyProductSales, DailyPaymentSales
+
+
+def parse_day_range(params):
+    """?from=YYYY-MM-DD&to=YYYY-MM-DD -> (inicio, fin); None si falta. ValueError si es inválido."""
+    days = []
+    for param in ('from', 'to'):
+        day = None
+        if params.get(param):
+            try:
+                day = parse_date(params[param])
+            except ValueError:
+                pass
+            if day is None:
+                raise ValueError(f"{param} debe tener el formato YYYY-MM-DD.")
+        days.append(day)
+    if all(days) and days[0] > days[1]:
+        raise ValueError("from debe ser anterior o igual a to.")
+    return tuple(days)
+
+
+def daily_report(rows):
+    return list(rows.order_by('day').values('day', 'sales_count', 'revenue'))
+
+
+def products_report(rows):
+    return list(
+        rows.values('product_id', 'variant_id', product_name=F('product__name'))
+        .annotate(quantity=Sum('quantity'), revenue=Sum('revenue'))
+        .order_by('-revenue', 'product_id')
+    )
+
+
+def payment_methods_report(rows):
+    return list(
+        rows.values('payment_method_id', payment_method_name=F('payment_method__name'))
+        .annotate(sales_count=Sum('sales_count'), revenue=Sum('revenue'))
+        .order_by('-revenue')
+    )
+
+
+# dimensión -> (modelo de acumulados, agregación)
+REPORTS = {
+    'daily': (DailySales, daily_report),
+    'products': (DailyProductSales, products_report),
+    'payment-methods': (DailyPaymentSales, payment_methods_report),
+}
+
+
+@extend_schema(
+    parameters=[
+        OpenApiParameter('from', str, description="Primer día (YYYY-MM-DD), inclusive."),
+        OpenApiParameter('to', str, description="Último día (YYYY-MM-DD), inclusive."),
+    ],
+    responses={
+        200: OpenApiResponse(description="Filas del reporte."),
+        400: OpenApiResponse(description="Fechas inválidas."),
+        403: OpenApiResponse(description="Usuario sin negocio."),
+        404: OpenApiResponse(description="Reporte desconocido."),
+    },
+    description="Reportes de ventas (daily, products, payment-methods) leídos solo de los acumulados diarios. Requiere autenticación."
+)
+class SalesReportView(BusinessContextMixin, APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, dimension):
+        if dimension not in REPORTS:
+            return Response({"error": "Reporte desconocido."}, status=status.HTTP_404_NOT_FOUND)
+        business = request.business
+        if business is None:
+            return Response({"error": "Usuario sin negocio."}, status=status.HTTP_403_FORBIDDEN)
+
+        try:
+            start, end = parse_day_range(request.query_params)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        model, report = REPORTS[dimension]
+        rows = model.objects.filter(business=business)
+        if start:
+            rows = rows.filter(day__gte=start)
+        if end:
+            rows = rows.filter(day__lte=end)
+
+        return Response(report(rows), status=status.HTTP_200_OK)
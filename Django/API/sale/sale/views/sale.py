@@ -1,14 +1,25 @@
+from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import generics
 from rest_framework.permissions import IsAuthenticated
-from ...models import Sale, Business
+from ...models import Sale
 from ..serializers.serializer_sale import SaleSerializer
+from ..filters import SaleFilter
+from API.products.context import BusinessContextMixin
+from API.pagination import SaleCursorPagination
 
 # list de las ventas
-class SaleListView(generics.ListAPIView):
+class SaleListView(BusinessContextMixin, generics.ListAPIView):
     queryset = Sale.objects.all()
     serializer_class = SaleSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = SaleCursorPagination
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = SaleFilter
 
     def get_queryset(self):
-        business_id = self.kwargs.get('business_id')
-        return Sale.objects.filter(business__id=business_id)
\ No newline at end of file
+        # Ventas de los negocios del usuario; el rango de fechas lo aplica SaleFilter
+        return (
+            Sale.objects.filter(business_id__in=self.request.business_ids)
+            .select_related('payment_method', 'seller')
+            .prefetch_related('items')
+        )
@@ -0,0 +1,103 @@
+# sale/services.py
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import F
+
+from API.products.models import Product, ProductVariant, Inventory, InventoryVariant
+from API.products.ledger import StockLedger
+from .models import Sale, SaleItem
+from .rollups import SalesRollup
+from .analytics import invalidate_analytics
+from .notifications import enqueue as enqueue_whatsapp
+
+
+class CheckoutError(Exception):
+    """Error de negocio en el checkout (stock insuficiente, producto ajeno, etc.)."""
+
+
+class SaleService:
+    @staticmethod
+    @transaction.atomic
+    def checkout(business, seller, payment_method, items, **extra):
+        """
+        Registra una venta y descuenta stock en una sola transacción.
+
+        Los precios se calculan en el servidor a partir de Product.price_base.
+        El stock se descuenta con UPDATE condicionales (cantidad >= qty), en
+        orden de id para no provocar interbloqueos; si alguno no afecta filas,
+        la transacción completa se revierte.
+
+        items: [{'product': id, 'variant': id | None, 'quantity': Decimal}]
+        """
+        if not items:
+            raise CheckoutError("La venta no tiene ítems.")
+
+        product_ids = {item['product'] for item in items}
+        prices = dict(
+            Product.objects.filter(id__in=product_ids, business=business).values_list('id', 'price_base')
+        )
+        if len(prices) != len(product_ids):
+            raise CheckoutError("Algún producto no existe o no pertenece al negocio.")
+
+        variant_ids = {item['variant'] for item in items if item.get('variant')}
+        variant_products = dict(
+            ProductVariant.objects.filter(id__in=variant_ids).values_list('id', 'product_id')
+        )
+        for item in items:
+            if item.get('variant') and variant_products.get(item['variant']) != item['product']:
+                raise CheckoutError(f"La variante {item['variant']} no pertenece al producto {item['product']}.")
+
+        # Cantidades agregadas por fila de inventario
+        product_qty, variant_qty = defaultdict(Decimal), defaultdict(Decimal)
+        for item in items:
+            if item.get('variant'):
+                variant_qty[item['variant']] += item['quantity']
+            else:
+                product_qty[item['product']] += item['quantity']
+
+        for product_id in sorted(product_qty):
+            SaleService._decrement(Inventory.objects.filter(product_id=product_id), product_qty[product_id],
+                                   f"producto {product_id}")
+        for variant_id in sorted(variant_qty):
+            SaleService._decrement(InventoryVariant.objects.filter(variant_id=variant_id), variant_qty[variant_id],
+                                   f"variante {variant_id}")
+
+        sale_items = []
+        for item in items:
+            unit_price = prices[item['product']]
+            sale_items.append(SaleItem(
+                product_id=item['product'],
+                variant_id=item.get('variant'),
+                quantity=item['quantity'],
+                unit_price=unit_price,
+                subtotal=(unit_price * item['quantity']).quantize(Decimal('0.01')),
+            ))
+
+        sale = Sale.objects.create(
+            business=business,
+            seller=seller,
+            payment_method=payment_method,
+            total_amount=sum(item.subtotal for item in sale_items),
+            **extra,
+        )
+        for item in sale_items:
+            item.sale = sale
+        SaleItem.objects.bulk_create(sale_items)
+        StockLedger.append(
+            StockLedger.movement(item.product_id, -item.quantity, item.variant_id, kind='sale', reference=f'sale:{sale.id}')
+            for item in sale_items
+        )
+        SalesRollup.record(sale, sale_items)
+        invalidate_analytics(business.id)
+        # Solo se encola: el envío lo hace dispatch_whatsapp fuera de la petición
+        enqueue_whatsapp(sale)
+        return sale
+
+    @staticmethod
+    def _decrement(queryset, quantity, label):
+        qty = float(quantity)
+        updated = queryset.filter(cantidad__gte=qty).update(cantidad=F('cantidad') - qty)
+        if not updated:
+            raise CheckoutError(f"Stock insuficiente para {label}.")
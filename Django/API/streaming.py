@@ -0,0 +1,39 @@
+# API/streaming.py
+import csv
+import json
+import zlib
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+
+class _Echo:
+    """Pseudo-buffer para csv.writer: devuelve la línea en lugar de guardarla."""
+    def write(self, value):
+        return value
+
+
+def ndjson_lines(records):
+    """Una línea JSON por registro."""
+    for record in records:
+        yield json.dumps(record, cls=DjangoJSONEncoder, ensure_ascii=False) + '\n'
+
+
+def csv_lines(columns, rows):
+    """Encabezado y una línea CSV por fila, sin acumular el archivo en memoria."""
+    writer = csv.writer(_Echo())
+    yield writer.writerow(columns)
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def gzip_stream(lines, level=6):
+    """
+    Comprime el flujo de líneas a gzip sobre la marcha. zlib acumula hasta
+    tener un bloque completo, así que solo se emiten fragmentos no vacíos.
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for line in lines:
+        chunk = compressor.compress(line.encode('utf-8'))
+        if chunk:
+            yield chunk
+    yield compressor.flush()
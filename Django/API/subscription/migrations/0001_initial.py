@@ -0,0 +1,41 @@
+# Generated by Django 5.1.4 on 2026-10-18 17:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Membership',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('is_active', models.BooleanField(default=True)),
+                ('start_date', models.DateField()),
+                ('end_date', models.DateField()),
+            ],
+            options={
+                'verbose_name': 'Membresía',
+                'verbose_name_plural': 'Membresías',
+            },
+        ),
+        migrations.CreateModel(
+            name='Plan',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('price', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('description', models.TextField(blank=True, null=True)),
+                ('features', models.JSONField(default=list)),
+            ],
+            options={
+                'verbose_name': 'Plan',
+                'verbose_name_plural': 'Planes',
+            },
+        ),
+    ]
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import User
+from .models import User, OutgoingMail
 
 
 # Register your models here.
@@ -9,3 +9,9 @@ class UserAdmin(admin.ModelAdmin):
     list_display = ('username', 'email', 'role', 'cedula', 'telefono', 'fecha_nacimiento')
     search_fields = ('username', 'email', 'cedula', 'telefono')
     list_filter = ('role',)
+
+@admin.register(OutgoingMail)
+class OutgoingMailAdmin(admin.ModelAdmin):
+    list_display = ('id', 'subject', 'to', 'status', 'attempts', 'next_attempt_at', 'sent_at')
+    search_fields = ('to', 'subject')
+    list_filter = ('status',)
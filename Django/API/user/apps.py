@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class UserapiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'API.user'
+
+    def ready(self):
+        # Receptores de la caché de usuarios autenticados y del filtro de la lista negra
+        from . import auth_cache, blacklist  # noqa: F401
@@ -0,0 +1,42 @@
+# user/auth_cache.py
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from API.cache_utils import bump_version
+
+User = get_user_model()
+
+
+def _version_key(user_id):
+    return f'auth:user:{user_id}:version'
+
+
+def _user_key(user_id, version, jti):
+    return f'auth:user:{user_id}:{version}:{jti}'
+
+
+def get_cached_user(user_id, jti):
+    """Devuelve (versión, usuario o None) para el par (usuario, jti del token)."""
+    version = cache.get(_version_key(user_id), 0)
+    return version, cache.get(_user_key(user_id, version, jti))
+
+
+def cache_user(user_id, jti, version, user, timeout):
+    cache.set(_user_key(user_id, version, jti), user, timeout=timeout)
+
+
+def invalidate_user(user_id):
+    """
+    Sube la versión del usuario al confirmar la transacción: todas sus
+    entradas (una por token) quedan huérfanas y expiran solas.
+    """
+    bump_version(_version_key(user_id))
+
+
+# save() cubre cambios de perfil, desactivación (is_active) y set_password + save
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def _user_changed(sender, instance, **kwargs):
+    invalidate_user(instance.pk)
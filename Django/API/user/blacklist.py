@@ -0,0 +1,140 @@
+# user/blacklist.py
+import hashlib
+import math
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+from API.cache_utils import bump_version
+
+VERSION_KEY = 'auth:blacklist:version'
+# blacklisted_at se fija antes del commit: la ventana incremental se solapa con
+# la anterior para incluir filas que confirmaron tarde
+SYNC_MARGIN = timedelta(minutes=1)
+
+
+class BloomFilter:
+    """Filtro de Bloom sobre un bytearray; k posiciones derivadas de un solo blake2b."""
+
+    def __init__(self, capacity, error_rate=0.001):
+        self.capacity = max(capacity, 1)
+        self.bits = max(8, int(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.bits / self.capacity * math.log(2)))
+        self.array = bytearray((self.bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item):
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1, h2 = int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little')
+        return ((h1 + i * h2) % self.bits for i in range(self.hashes))
+
+    def add(self, item):
+        # Las ventanas solapadas repiten filas: no cuentan dos veces para la capacidad
+        if item in self:
+            return
+        for position in self._positions(item):
+            self.array[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item):
+        return all(self.array[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class BlacklistFilter:
+    """
+    Filtro de jti en lista negra, uno por proceso. Un "no" es definitivo y
+    evita la consulta; un "quizás" se confirma en la base de datos.
+
+    Cuando otro proceso avisa por la caché compartida se sincroniza de forma
+    incremental por blacklisted_at (no por id: en Postgres un id menor puede
+    confirmar después de uno mayor). Como respaldo, cada `max_staleness`
+    segundos se reconstruye completo.
+    """
+
+    def __init__(self, error_rate=0.001):
+        self.error_rate = error_rate
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.bloom = None
+            self.since = None
+            self.version = None
+            self.synced_at = 0.0
+
+    def _max_staleness(self):
+        return getattr(settings, 'TOKEN_BLACKLIST_FILTER_STALENESS', 30)
+
+    def _rebuild(self):
+        """Carga completa: solo tokens aún vigentes, con holgura para crecer."""
+        jtis = list(
+            BlacklistedToken.objects.filter(token__expires_at__gt=timezone.now())
+            .values_list('token__jti', flat=True)
+        )
+        self.bloom = BloomFilter(max(1024, len(jtis) * 2), self.error_rate)
+        for jti in jtis:
+            self.bloom.add(jti)
+
+    def _sync(self):
+        version = cache.get(VERSION_KEY, 0)
+        stale = time.monotonic() - self.synced_at > self._max_staleness()
+        if self.bloom is not None and version == self.version and not stale:
+            return
+        with self._lock:
+            # La ventana siguiente empieza antes de leer: no se pierde lo que confirme durante la consulta
+            started = timezone.now()
+            if self.bloom is None or stale or self.bloom.count >= self.bloom.capacity:
+                self._rebuild()
+            else:
+                for jti in (
+                    BlacklistedToken.objects.filter(blacklisted_at__gte=self.since)
+                    .values_list('token__jti', flat=True)
+                ):
+                    self.bloom.add(jti)
+            self.since = started - SYNC_MARGIN
+            self.version = version
+            self.synced_at = time.monotonic()
+
+    def might_contain(self, jti):
+        self._sync()
+        return jti in self.bloom
+
+    def add(self, jti):
+        with self._lock:
+            if self.bloom is not None:
+                self.bloom.add(jti)
+
+
+blacklist_filter = BlacklistFilter()
+
+
+class FilteredRefreshToken(RefreshToken):
+    """RefreshToken que consulta la lista negra en la DB solo si el filtro lo marca."""
+
+    def check_blacklist(self):
+        if blacklist_filter.might_contain(self.payload[api_settings.JTI_CLAIM]):
+            super().check_blacklist()
+
+    def blacklist(self):
+        blacklisted = super().blacklist()
+        blacklist_filter.add(self.payload[api_settings.JTI_CLAIM])
+        return blacklisted
+
+
+@receiver(post_save, sender=BlacklistedToken)
+def _token_blacklisted(sender, instance, created, **kwargs):
+    """Avisa al resto de procesos que sincronicen su filtro."""
+    if not created:
+        return
+
+    bump_version(VERSION_KEY)
@@ -0,0 +1,86 @@
+# user/mail.py
+import logging
+from collections import Counter
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+
+from API import outbox
+from .models import OutgoingMail
+
+logger = logging.getLogger(__name__)
+
+
+def _max_attempts():
+    return getattr(settings, 'MAIL_QUEUE_MAX_ATTEMPTS', 5)
+
+
+def enqueue_mail(subject, body, to, from_email=None, expires_at=None):
+    """
+    Encola un correo; si hay transacción abierta, se confirma junto con ella.
+    Con `expires_at`, no se envía ni se reintenta después de ese instante.
+    """
+    return OutgoingMail.objects.create(
+        subject=subject, body=body, to=to, from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+        expires_at=expires_at,
+    )
+
+
+def _expired(mail, now):
+    return mail.expires_at is not None and mail.expires_at <= now
+
+
+def claim(batch_size):
+    """Reclama correos vencidos (ver API.outbox.claim); los caducados se descartan sin enviarse."""
+    return outbox.claim(OutgoingMail.objects.all(), batch_size, expired=_expired)
+
+
+def _send_all(connection, mails):
+    """
+    Envía los correos por la conexión ya abierta; devuelve el error de cada
+    uno (o None). Si no se puede reconectar, solo los restantes quedan con error.
+    """
+    errors = []
+    for index, mail in enumerate(mails):
+        message = EmailMessage(mail.subject, mail.body, mail.from_email, [mail.to], connection=connection)
+        try:
+            connection.send_messages([message])
+            errors.append(None)
+            continue
+        except Exception as e:
+            logger.warning("No se pudo enviar el correo %s: %r", mail.pk, e)
+            errors.append(repr(e))
+        # La conexión puede haber quedado inutilizable: se reabre para el resto del lote
+        try:
+            connection.close()
+            connection.open()
+        except Exception as e:
+            logger.warning("No se pudo reabrir la conexión de correo: %r", e)
+            errors.extend([repr(e)] * (len(mails) - index - 1))
+            break
+    return errors
+
+
+def dispatch(batch_size=100, connection=None):
+    """
+    Envía un bloque de correos sobre una sola conexión (un solo handshake
+    SMTP/TLS por lote). Los resultados se guardan con un bulk_update.
+    """
+    mails = claim(batch_size)
+    if not mails:
+        return Counter()
+
+    connection = connection or get_connection(fail_silently=False)
+    try:
+        connection.open()
+    except Exception as e:
+        # Sin conexión no se envía nada: todo el lote se reintenta
+        logger.warning("No se pudo abrir la conexión de correo: %r", e)
+        errors = [repr(e)] * len(mails)
+    else:
+        errors = _send_all(connection, mails)
+    finally:
+        connection.close()
+
+    # Sin más intentos, o el siguiente llegaría con el contenido ya caducado
+    return outbox.settle(mails, errors, _max_attempts(), give_up=_expired)
@@ -0,0 +1,9 @@
+from API.outbox import DispatchCommand
+from API.user.mail import dispatch
+
+
+class Command(DispatchCommand):
+    help = "Envía los correos pendientes de la cola sobre una sola conexión por lote."
+
+    def dispatch(self, options):
+        return dispatch(options['batch_size'])
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+
+class Command(BaseCommand):
+    help = "Elimina por bloques los tokens de refresco vencidos (pendientes y en lista negra)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        cutoff = timezone.now()
+        outstanding = blacklisted = 0
+        last_id = 0
+        while True:
+            ids = list(
+                OutstandingToken.objects.filter(id__gt=last_id, expires_at__lte=cutoff)
+                .order_by('id').values_list('id', flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            last_id = ids[-1]
+            # Una transacción corta por bloque: los bloqueos no se acumulan en toda la tabla
+            with transaction.atomic():
+                blacklisted += BlacklistedToken.objects.filter(token_id__in=ids).delete()[0]
+                outstanding += OutstandingToken.objects.filter(id__in=ids).delete()[0]
+
+        self.stdout.write(
+            f"Tokens vencidos eliminados: {outstanding} pendientes, {blacklisted} en lista negra."
+        )
@@ -37,3 +37,37 @@ class User(AbstractUser):
 
     def __str__(self):
         return f"{self.username} - {self.get_role_display()}"
+
+class OutgoingMail(models.Model):
+    """
+    Cola de correos salientes: la petición solo inserta la fila y el comando
+    dispatch_mail los envía por lotes sobre una sola conexión SMTP.
+    """
+    STATUS_CHOICES = [
+        ('pending', 'Pendiente'),
+        ('sent', 'Enviado'),
+        ('dead', 'Descartado'),
+    ]
+    subject = models.CharField(max_length=200)
+    body = models.TextField()
+    from_email = models.CharField(max_length=254)
+    to = models.EmailField()
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveIntegerField(default=0)
+    # Próximo intento; al reclamar un correo se adelanta (lease) para que otro despachador no lo tome
+    next_attempt_at = models.DateTimeField(auto_now_add=True)
+    last_error = models.TextField(blank=True)
+    # Pasado este instante el contenido ya no sirve (p. ej. un código vencido): no se reintenta
+    expires_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.subject} -> {self.to} ({self.get_status_display()})"
+
+    class Meta:
+        verbose_name = "Correo Saliente"
+        verbose_name_plural = "Correos Salientes"
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at'], name='outgoing_mail_due'),
+        ]
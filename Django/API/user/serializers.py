@@ -1,5 +1,7 @@
 from rest_framework import serializers
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
 from .models import User
+from .blacklist import FilteredRefreshToken
 from django.contrib.auth import authenticate
 
 class UserSerializer(serializers.ModelSerializer):
@@ -50,3 +52,8 @@ class LoginSerializer(serializers.Serializer):
             raise serializers.ValidationError('Usuario inactivo')
         data['user'] = user
         return data
+
+
+class FilteredTokenRefreshSerializer(TokenRefreshSerializer):
+    # La lista negra se consulta en la DB solo si el filtro de Bloom marca el jti
+    token_class = FilteredRefreshToken
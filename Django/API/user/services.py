@@ -1,11 +1,14 @@
 import random
 
 from django.conf import settings
-from django.core.mail import send_mail
+from django.db import transaction
 from django.utils.timezone import now, timedelta
 
+from .mail import enqueue_mail
 from .models import User
 
+RESET_CODE_LIFETIME = timedelta(minutes=10)
+
 def set_auth_cookies(response, access_token, refresh_token):
     """
     Inyecta las cookies de acceso y refresco en la respuesta
@@ -50,8 +53,9 @@ def clear_auth_cookies(response):
 
 class UserAuthService:
     @staticmethod
+    @transaction.atomic
     def send_password_reset_code(email):
-        """Genera un código, lo guarda y envía el email."""
+        """Genera un código, lo guarda y encola el email (lo envía el comando dispatch_mail)."""
         try:
             user = User.objects.get(email=email)
             reset_code = random.randint(100000, 999999)
@@ -59,11 +63,11 @@ class UserAuthService:
             user.reset_code_created_at = now()
             user.save()
 
-            send_mail(
+            enqueue_mail(
                 'Código de restablecimiento',
                 f'Tu código es: {reset_code}',
-                settings.DEFAULT_FROM_EMAIL,
-                [email],
+                email,
+                expires_at=user.reset_code_created_at + RESET_CODE_LIFETIME,
             )
             return True, "Código enviado al email"
         except User.DoesNotExist:
@@ -79,7 +83,7 @@ class UserAuthService:
             if str(user.reset_code) != str(reset_code):
                 return False, "Código incorrecto"
             
-            if now() > user.reset_code_created_at + timedelta(minutes=10):
+            if now() > user.reset_code_created_at + RESET_CODE_LIFETIME:
                 return False, "Código expirado"
             
             # Ejecución del cambio
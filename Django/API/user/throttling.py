@@ -0,0 +1,117 @@
+# user/throttling.py
+import logging
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.throttling import BaseThrottle
+
+from API.cache_utils import incr
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RATES = {
+    'login': '10/min',
+    'reset_send': '5/hour',
+    'reset_validate': '10/hour',
+}
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+SHED_PREFIX = 'throttle:shed'
+
+
+def parse_rate(rate):
+    """'10/min' -> (10, 60), igual que los rates de DRF."""
+    num, period = rate.split('/')
+    return int(num), PERIODS[period[0]]
+
+
+def shed_counts():
+    """Intentos rechazados por ámbito y clave: {'login': {'ip': 3, 'username': 1}, ...}."""
+    keys = {
+        f'{SHED_PREFIX}:{scope}:{kind}': (scope, kind)
+        for scope in DEFAULT_RATES | getattr(settings, 'AUTH_THROTTLE_RATES', {})
+        for kind in ('ip', 'username', 'email')
+    }
+    counts = {}
+    for key, value in cache.get_many(keys).items():
+        scope, kind = keys[key]
+        counts.setdefault(scope, {})[kind] = value
+    return counts
+
+
+class SlidingWindowThrottle(BaseThrottle):
+    """
+    Ventana deslizante aproximada con dos contadores fijos: el de la ventana
+    actual y el de la anterior, ponderado por la parte que aún se solapa.
+
+    Solo usa la caché (un incr por clave), así que corre en initial(), antes
+    de que la vista lea la DB o calcule el hash de la contraseña. El intento
+    se cuenta antes de comparar: dos workers no pueden colarse a la vez.
+    """
+    scope = None
+    # None: por IP; si no, campo del cuerpo que identifica la cuenta
+    field = None
+    timer = time.time
+
+    def get_rate(self):
+        rates = DEFAULT_RATES | getattr(settings, 'AUTH_THROTTLE_RATES', {})
+        return parse_rate(rates[self.scope])
+
+    def get_ident_value(self, request):
+        if self.field is None:
+            # Respeta REST_FRAMEWORK['NUM_PROXIES']: X-Forwarded-For solo cuenta tras proxies de confianza
+            return self.get_ident(request)
+        value = request.data.get(self.field) if hasattr(request.data, 'get') else None
+        return str(value).strip().lower() if value else None
+
+    def allow_request(self, request, view):
+        value = self.get_ident_value(request)
+        if not value:
+            return True
+
+        self.num_requests, self.duration = self.get_rate()
+        now = self.timer()
+        window = int(now // self.duration)
+        prefix = f'throttle:{self.scope}:{self.field or "ip"}:{value}'
+
+        current = incr(f'{prefix}:{window}', self.duration * 2)
+        previous = cache.get(f'{prefix}:{window - 1}', 0)
+        overlap = 1 - (now % self.duration) / self.duration
+        self.estimate = previous * overlap + current
+        if self.estimate <= self.num_requests:
+            return True
+
+        self.wait_seconds = self.duration - now % self.duration
+        incr(f'{SHED_PREFIX}:{self.scope}:{self.field or "ip"}')
+        logger.info("Intento rechazado por límite (%s, %s)", self.scope, self.field or 'ip')
+        return False
+
+    def wait(self):
+        return getattr(self, 'wait_seconds', None)
+
+
+class LoginIPThrottle(SlidingWindowThrottle):
+    scope = 'login'
+
+
+class LoginUsernameThrottle(SlidingWindowThrottle):
+    scope = 'login'
+    field = 'username'
+
+
+class ResetSendIPThrottle(SlidingWindowThrottle):
+    scope = 'reset_send'
+
+
+class ResetSendEmailThrottle(SlidingWindowThrottle):
+    scope = 'reset_send'
+    field = 'email'
+
+
+class ResetValidateIPThrottle(SlidingWindowThrottle):
+    scope = 'reset_validate'
+
+
+class ResetValidateEmailThrottle(SlidingWindowThrottle):
+    scope = 'reset_validate'
+    field = 'email'
@@ -1,6 +1,6 @@
 from django.urls import path
 from rest_framework_simplejwt.views import TokenRefreshView
-from .views import LoginView, UserDetailView, SendResetCodeView, ValidateResetCodeView, RegisterClientView, CustomTokenRefreshView, LogoutCookieView
+from .views import LoginView, UserDetailView, SendResetCodeView, ValidateResetCodeView, RegisterClientView, CustomTokenRefreshView, LogoutCookieView, ThrottleStatsView
 
 urlpatterns = [
     path('login/', LoginView.as_view(), name='user_login'),
@@ -11,4 +11,5 @@ urlpatterns = [
     path('send-reset-code/', SendResetCodeView.as_view(), name='user_send_reset_code'),
     path('validate-reset-code/', ValidateResetCodeView.as_view(), name='user_validate_reset_code'),
     path('register/', RegisterClientView.as_view(), name='user_register'),
+    path('throttle-stats/', ThrottleStatsView.as_view(), name='user_throttle_stats'),
 ]
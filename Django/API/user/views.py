@@ -5,17 +5,21 @@ from django.utils.timezone import now, timedelta
 from drf_spectacular.utils import extend_schema, OpenApiExample, OpenApiTypes, OpenApiResponse
 
 from rest_framework import generics, status
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from rest_framework_simplejwt.exceptions import TokenError
-from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
 from .models import User
 from .serializers import LoginSerializer, RegisterClientSerializer, UserSerializer
 from .services import clear_auth_cookies, set_auth_cookies, UserAuthService
+from .blacklist import FilteredRefreshToken
+from .throttling import (
+    LoginIPThrottle, LoginUsernameThrottle, ResetSendIPThrottle, ResetSendEmailThrottle,
+    ResetValidateIPThrottle, ResetValidateEmailThrottle, shed_counts,
+)
 
 @extend_schema(
     request=LoginSerializer,
@@ -30,6 +34,9 @@ from .services import clear_auth_cookies, set_auth_cookies, UserAuthService
     description="Autenticación de usuario. Devuelve access y refresh token JWT. Funcional para web y movil"
 )
 class LoginView(TokenObtainPairView):
+    # Se evalúan en initial(): un intento rechazado no llega al hash de la contraseña
+    throttle_classes = [LoginIPThrottle, LoginUsernameThrottle]
+
     def post(self, request, *args, **kwargs):
             try:
                 response = super().post(request, *args, **kwargs)
@@ -63,7 +70,7 @@ class LogoutCookieView(APIView):
         if refresh_token:
             # 2. Invalidación en el Servidor (Blacklist)
             try:
-                token = RefreshToken(refresh_token)
+                token = FilteredRefreshToken(refresh_token)
                 token.blacklist() # Esto marca el token como "muerto" en la DB
             except TokenError:
                 # Si el token ya expiró o es inválido, no importa, 
@@ -139,6 +146,9 @@ class UserDetailView(generics.RetrieveAPIView):
 )
 class SendResetCodeView(APIView):
     permission_classes = [AllowAny]
+    # Sin autenticación: el límite se aplica antes de cualquier consulta a la DB
+    authentication_classes = []
+    throttle_classes = [ResetSendIPThrottle, ResetSendEmailThrottle]
     def post(self, request):
         email = request.data.get('email')
         if not email:
@@ -166,6 +176,8 @@ class SendResetCodeView(APIView):
 )
 class ValidateResetCodeView(APIView):
     permission_classes = [AllowAny]
+    authentication_classes = []
+    throttle_classes = [ResetValidateIPThrottle, ResetValidateEmailThrottle]
     def post(self, request):
         data = request.data
         email = data.get('email')
@@ -193,4 +205,14 @@ class RegisterClientView(generics.CreateAPIView):
 
     def perform_create(self, serializer):
         # Usamos el servicio para crear el usuario
-        UserAuthService.register_user(serializer)
\ No newline at end of file
+        UserAuthService.register_user(serializer)
+
+@extend_schema(
+    responses={200: OpenApiTypes.OBJECT},
+    description="Intentos de login y recuperación rechazados por límite, por ámbito y clave (IP, usuario o email). Solo staff."
+)
+class ThrottleStatsView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response({'shed': shed_counts()})
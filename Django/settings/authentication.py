@@ -1,6 +1,47 @@
+import time
+
 from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+
+from django.conf import settings
+from API.user.auth_cache import get_cached_user, cache_user
+
+
+class CachedUserMixin:
+    """
+    Resuelve el usuario del token desde la caché, con clave (user_id, jti).
+    El TTL nunca supera el tiempo de vida restante del token ni
+    ACCESS_TOKEN_LIFETIME; los cambios del usuario invalidan sus entradas.
+    """
+
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        jti = validated_token.get(api_settings.JTI_CLAIM)
+        if user_id is None or jti is None:
+            return super().get_user(validated_token)
+
+        version, user = get_cached_user(user_id, jti)
+        if user is None:
+            user = super().get_user(validated_token)
+            timeout = self.cache_timeout(validated_token)
+            if timeout > 0:
+                cache_user(user_id, jti, version, user, timeout)
+        return user
+
+    def cache_timeout(self, validated_token):
+        remaining = validated_token.get('exp', 0) - time.time()
+        return int(min(
+            getattr(settings, 'AUTH_USER_CACHE_TTL', 60),
+            remaining,
+            api_settings.ACCESS_TOKEN_LIFETIME.total_seconds(),
+        ))
+
+
+class CachedJWTAuthentication(CachedUserMixin, JWTAuthentication):
+    """JWTAuthentication (cabecera Authorization) con caché de usuario."""
+
 
-class CookiesJWTAuthentication(JWTAuthentication):
+class CookiesJWTAuthentication(CachedUserMixin, JWTAuthentication):
     def authenticate(self, request):
         access_token = request.COOKIES.get('access_token')
         if not access_token:
@@ -12,4 +53,4 @@ class CookiesJWTAuthentication(JWTAuthentication):
         except:
             return None
         
-        return (user, validated_token)
\ No newline at end of file
+        return (user, validated_token)
@@ -32,6 +32,7 @@ INSTALLED_APPS = [
     'rest_framework_simplejwt',
     'rest_framework_simplejwt.token_blacklist',
     'drf_spectacular',
+    'django_filters',
 
     'API.user',
     'API.subscription',
@@ -169,9 +170,12 @@ CORS_ALLOW_METHODS = [
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
         'settings.authentication.CookiesJWTAuthentication',
-        'rest_framework_simplejwt.authentication.JWTAuthentication', 
+        'settings.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+    # Proxies de confianza delante de la app. Con 0 los throttles usan REMOTE_ADDR e ignoran
+    # X-Forwarded-For, que controla el cliente; detrás de N proxies, poner NUM_PROXIES=N
+    'NUM_PROXIES': int(os.getenv('NUM_PROXIES', 0)),
 }
 
 
@@ -188,8 +192,16 @@ SIMPLE_JWT = {
     'USER_ID_CLAIM': 'user_id',
     'AUTH_TOKEN_CLASSES': ('rest_framework_simplejwt.tokens.AccessToken',),
     'TOKEN_TYPE_CLAIM': 'token_type',
+    'TOKEN_REFRESH_SERIALIZER': 'API.user.serializers.FilteredTokenRefreshSerializer',
 }
 
+# Segundos máximos que el filtro de la lista negra de un worker puede ir por detrás de la DB
+# si la caché no es compartida entre procesos
+TOKEN_BLACKLIST_FILTER_STALENESS = int(os.getenv('TOKEN_BLACKLIST_FILTER_STALENESS', 30))
+
+# Segundos que se cachea el usuario autenticado por (user_id, jti); nunca más que el token
+AUTH_USER_CACHE_TTL = int(os.getenv('AUTH_USER_CACHE_TTL', 60))
+
 # Configuración de Cookies JWT
 JWT_AUTH_COOKIE = 'access_token'
 JWT_REFRESH_COOKIE = 'refresh_token'
@@ -207,4 +219,38 @@ SPECTACULAR_SETTINGS = {
     'COMPONENT_SPLIT_REQUEST': True,
 }
 
-AUTH_USER_MODEL = 'user.User'
\ No newline at end of file
+AUTH_USER_MODEL = 'user.User'
+# Caché (detalle de productos, nombres de atributo, etc.)
+# En producción usar un backend compartido entre workers (p.ej. Redis o Memcached)
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('CACHE_LOCATION', ''),
+    }
+}
+
+# Segundos que vive el detalle de producto cacheado; acota lo desactualizado que puede
+# estar un worker cuando la caché no es compartida
+PRODUCT_DETAIL_CACHE_TTL = int(os.getenv('PRODUCT_DETAIL_CACHE_TTL', 300))
+
+# Segundos que viven los reportes de analítica de ventas cacheados (mismo motivo)
+ANALYTICS_CACHE_TTL = int(os.getenv('ANALYTICS_CACHE_TTL', 60))
+
+# Segundos que se cachean los negocios de cada usuario. Se usan para autorizar, así que es
+# corto: sin caché compartida, un cambio de dueño tarda hasta este tiempo en llegar a otros workers
+BUSINESS_CACHE_TTL = int(os.getenv('BUSINESS_CACHE_TTL', 30))
+
+# Proveedor de WhatsApp para el outbox de ventas (ver API/sale/notifications.py).
+# Obligatorio para dispatch_whatsapp: sin él, el despachador falla en lugar de descartar mensajes
+WHATSAPP_TRANSPORT = os.getenv('WHATSAPP_TRANSPORT')
+WHATSAPP_MAX_ATTEMPTS = int(os.getenv('WHATSAPP_MAX_ATTEMPTS', 5))
+
+# Intentos de envío de la cola de correos (ver API/user/mail.py)
+MAIL_QUEUE_MAX_ATTEMPTS = int(os.getenv('MAIL_QUEUE_MAX_ATTEMPTS', 5))
+
+# Límites de ventana deslizante para login y recuperación de contraseña (ver API/user/throttling.py)
+AUTH_THROTTLE_RATES = {
+    'login': os.getenv('LOGIN_THROTTLE_RATE', '10/min'),
+    'reset_send': os.getenv('RESET_SEND_THROTTLE_RATE', '5/hour'),
+    'reset_validate': os.getenv('RESET_VALIDATE_THROTTLE_RATE', '10/hour'),
+}
@@ -1,6 +1,71 @@
 import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from rest_framework.test import APIClient
 
+from API.products.models import Business
+from API.products.services import ProductService
+from API.sale.models import PaymentMethod
+from API.user.blacklist import blacklist_filter
+
+User = get_user_model()
+
 @pytest.fixture
 def api_client():
-    return APIClient()
\ No newline at end of file
+    return APIClient()
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    # La caché (locmem) y el filtro de la lista negra sobreviven entre tests aunque la DB se revierta
+    cache.clear()
+    blacklist_filter.reset()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def owner(db):
+    return User.objects.create_user(
+        username='owner',
+        email='owner@test.com',
+        password='testpassword123'
+    )
+
+
+@pytest.fixture
+def business(owner):
+    return Business.objects.create(user=owner, name='Tienda')
+
+
+@pytest.fixture
+def auth_client(api_client, owner):
+    api_client.force_authenticate(user=owner)
+    return api_client
+
+
+@pytest.fixture
+def payment_method(db):
+    return PaymentMethod.objects.create(name='Efectivo')
+
+
+@pytest.fixture
+def make_product(business):
+    """Crea un producto completo (atributos, inventario y variantes) vía el servicio."""
+    def _make(name='Camisa', price='10.00', attributes=None, variants=None):
+        data = {
+            'name': name,
+            'price_base': price,
+            'descripcion': f'Descripción de {name}',
+            'attributes': attributes if attributes is not None else [
+                {'name': 'Marca', 'value': 'Acme'},
+            ],
+            'inventario': {'unidad_medida': 'unidad', 'cantidad': 10, 'stock_minimo': 2},
+            'variants': variants if variants is not None else [
+                {'attributes': [{'name': 'Color', 'value': 'Rojo'}, {'name': 'Talla', 'value': 'M'}],
+                 'cantidad': 3, 'stock_minimo': 1},
+                {'attributes': [{'name': 'Color', 'value': 'Azul'}, {'name': 'Talla', 'value': 'S'}],
+                 'cantidad': 4, 'stock_minimo': 1},
+            ],
+        }
+        return ProductService.create_product_with_details(business=business, data=data)
+    return _make
@@ -0,0 +1,61 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework import status
+
+from API.products.context import user_businesses
+from API.products.models import Business
+
+
+@pytest.mark.django_db
+class TestBusinessContext:
+
+    def test_business_is_resolved_once_and_cached(self, auth_client, owner, business, django_assert_num_queries):
+        auth_client.get('/api/business/products/search/', {'q': 'x'})
+        # Petición caliente: solo la búsqueda, sin consultar Business
+        with django_assert_num_queries(1):
+            response = auth_client.get('/api/business/products/search/', {'q': 'x'})
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_cache_is_invalidated_when_business_changes(self, owner, django_capture_on_commit_callbacks):
+        assert user_businesses(owner) == []
+        with django_capture_on_commit_callbacks(execute=True):
+            created = Business.objects.create(user=owner, name='Nueva')
+        assert user_businesses(owner) == [created]
+
+    def test_reassignment_invalidates_previous_owner(self, owner, business, django_capture_on_commit_callbacks):
+        new_owner = get_user_model().objects.create_user(username='nuevo', email='nuevo@test.com', password='x')
+        assert user_businesses(owner) == [business]
+        assert user_businesses(new_owner) == []
+
+        with django_capture_on_commit_callbacks(execute=True):
+            business.user = new_owner
+            business.save()
+        assert user_businesses(owner) == []
+        assert user_businesses(new_owner) == [business]
+
+    def test_cached_businesses_expire(self, owner, business, settings, monkeypatch):
+        settings.BUSINESS_CACHE_TTL = 5
+        timeouts = {}
+        original = cache.set
+
+        def record(key, value, timeout=None, **kwargs):
+            timeouts[key] = timeout
+            return original(key, value, timeout=timeout, **kwargs)
+        monkeypatch.setattr(cache, 'set', record)
+
+        user_businesses(owner)
+        assert timeouts == {f'business:user:{owner.pk}': 5}
+
+    def test_user_without_business_is_forbidden(self, api_client):
+        user = get_user_model().objects.create_user(username='sin', email='sin@test.com', password='x')
+        api_client.force_authenticate(user=user)
+        response = api_client.get('/api/business/products/search/', {'q': 'x'})
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_foreign_business_catalog_is_empty(self, api_client, business, make_product):
+        make_product()
+        user = get_user_model().objects.create_user(username='otro', email='otro@test.com', password='x')
+        api_client.force_authenticate(user=user)
+        response = api_client.get(f'/api/business/products/business/{business.id}/')
+        assert response.data['results'] == [] and response.data['facets'] == []
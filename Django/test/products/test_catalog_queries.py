@@ -0,0 +1,57 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
+
+@pytest.mark.django_db
+class TestCatalogQueries:
+
+    def _count_list_queries(self, client, business):
+        url = f'/api/business/products/business/{business.id}/'
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        return len(ctx.captured_queries), response
+
+    def test_list_query_count_is_constant(self, auth_client, business, make_product):
+        """
+        El listado debe ejecutar el mismo número de consultas con 2 o con 20 productos.
+        Si este test falla, alguna relación del serializer volvió a ser N+1.
+        """
+        for i in range(2):
+            make_product(name=f'Producto {i}')
+        # La primera petición carga los negocios del usuario en la caché
+        self._count_list_queries(auth_client, business)
+        few, _ = self._count_list_queries(auth_client, business)
+
+        for i in range(2, 20):
+            make_product(name=f'Producto {i}')
+        many, response = self._count_list_queries(auth_client, business)
+
+        assert len(response.data['results']) == 20
+        assert many == few
+        # productos(+inventario), atributos, imágenes, variantes(+inventario), atributos de variante
+        # y facetas; la propiedad del negocio sale de la caché por usuario
+        assert many <= 6
+
+    def test_list_payload_keeps_nested_data(self, auth_client, business, make_product):
+        make_product()
+        _, response = self._count_list_queries(auth_client, business)
+
+        product = response.data['results'][0]
+        assert product['inventario']['cantidad'] == 10
+        assert len(product['attributes']) == 1
+        assert len(product['variants']) == 2
+        assert product['variants'][0]['inventario_variante']['cantidad'] == 3
+
+    def test_detail_query_count_is_constant(self, auth_client, business, make_product):
+        product = make_product()
+        url = f'/api/business/products/detail/{product.id}/'
+        with CaptureQueriesContext(connection) as ctx:
+            response = auth_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['variants'][0]['variant_attributes'][0]['name'] == 'Color'
+        # propietario, negocio, producto(+inventario), atributos(+nombre), categorías,
+        # imágenes, variantes(+inventario), atributos de variante(+nombre)
+        assert len(ctx.captured_queries) <= 8
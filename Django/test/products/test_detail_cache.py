@@ -0,0 +1,86 @@
+import pytest
+from rest_framework import status
+
+from django.core.cache import cache
+
+from API.products.cache import cache_stats
+
+
+@pytest.mark.django_db
+class TestProductDetailCache:
+
+    def _url(self, product):
+        return f'/api/business/products/detail/{product.id}/'
+
+    def test_second_request_is_served_from_cache(self, auth_client, make_product):
+        product = make_product()
+        first = auth_client.get(self._url(product))
+        second = auth_client.get(self._url(product))
+
+        assert first['X-Cache'] == 'MISS'
+        assert second['X-Cache'] == 'HIT'
+        assert first['ETag'] == second['ETag']
+        assert first.data == second.data
+
+    def test_if_none_match_returns_304(self, auth_client, make_product):
+        product = make_product()
+        etag = auth_client.get(self._url(product))['ETag']
+
+        response = auth_client.get(self._url(product), HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response['ETag'] == etag
+        assert cache_stats()['not_modified'] == 1
+
+    def test_write_bumps_version(self, auth_client, make_product, django_capture_on_commit_callbacks):
+        """Una actualización vía servicio invalida el payload y cambia el ETag."""
+        product = make_product()
+        etag = auth_client.get(self._url(product))['ETag']
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = auth_client.put(self._url(product).replace('detail', 'update'),
+                                       {'price_base': '99.00'}, format='json')
+        assert response.status_code == status.HTTP_200_OK
+
+        response = auth_client.get(self._url(product), HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response['X-Cache'] == 'MISS'
+        assert response['ETag'] != etag
+        assert response.data['price_base'] == '99.00'
+
+    def test_related_model_signal_bumps_version(self, auth_client, make_product, django_capture_on_commit_callbacks):
+        product = make_product()
+        auth_client.get(self._url(product))
+
+        inventory = product.variants.first().inventario_variante
+        with django_capture_on_commit_callbacks(execute=True):
+            inventory.cantidad = 0
+            inventory.save()
+
+        assert auth_client.get(self._url(product))['X-Cache'] == 'MISS'
+
+    def test_entries_expire(self, auth_client, make_product, settings, monkeypatch):
+        """Sin caché compartida, el TTL acota cuánto sirve un worker un payload viejo."""
+        settings.PRODUCT_DETAIL_CACHE_TTL = 30
+        timeouts = {}
+        original = cache.set
+
+        def record(key, value, timeout=None, **kwargs):
+            timeouts[key] = timeout
+            return original(key, value, timeout=timeout, **kwargs)
+        monkeypatch.setattr(cache, 'set', record)
+
+        auth_client.get(self._url(make_product()))
+        assert [t for key, t in timeouts.items() if ':detail:' in key] == [30]
+
+    def test_stats_are_exposed_to_staff(self, auth_client, api_client, make_product, django_user_model):
+        product = make_product()
+        auth_client.get(self._url(product))
+        auth_client.get(self._url(product))
+
+        assert auth_client.get('/api/business/products/cache-stats/').status_code == status.HTTP_403_FORBIDDEN
+        staff = django_user_model.objects.create_user(username='staff', email='staff@test.com', password='x', is_staff=True)
+        api_client.force_authenticate(staff)
+        response = api_client.get('/api/business/products/cache-stats/')
+        assert response.status_code == status.HTTP_200_OK
+        assert (response.data['hits'], response.data['misses']) == (1, 1)
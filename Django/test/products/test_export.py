@@ -0,0 +1,59 @@
+import csv
+import io
+import json
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
+from API.products import export
+
+
+@pytest.mark.django_db
+class TestCatalogExport:
+
+    def _get(self, client, business, fmt):
+        url = f'/api/business/products/business/{business.id}/export/'
+        response = client.get(url, {'fmt': fmt})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        return b''.join(response.streaming_content).decode('utf-8')
+
+    def test_ndjson_one_line_per_product(self, auth_client, business, make_product):
+        make_product(name='A')
+        make_product(name='B', variants=[])
+
+        lines = [json.loads(line) for line in self._get(auth_client, business, 'ndjson').splitlines()]
+
+        assert [line['name'] for line in lines] == ['A', 'B']
+        assert lines[0]['variants'][0]['attributes'] == {'Color': 'Rojo', 'Talla': 'M'}
+        assert lines[0]['inventario']['cantidad'] == 10
+        assert lines[1]['variants'] == []
+
+    def test_csv_one_row_per_variant(self, auth_client, business, make_product):
+        make_product(name='A')
+        make_product(name='B', variants=[])
+
+        rows = list(csv.DictReader(io.StringIO(self._get(auth_client, business, 'csv'))))
+
+        assert [row['name'] for row in rows] == ['A', 'A', 'B']
+        assert rows[1]['variant_attributes'] == 'Color=Azul;Talla=S'
+        assert rows[2]['variant_id'] == ''
+
+    def test_queries_grow_per_chunk_not_per_product(self, business, make_product, monkeypatch):
+        monkeypatch.setattr(export, 'EXPORT_CHUNK_SIZE', 5)
+        for i in range(10):
+            make_product(name=f'P{i}')
+
+        with CaptureQueriesContext(connection) as ctx:
+            assert len(list(export.iter_ndjson(business.id))) == 10
+        # 2 bloques x (productos, atributos, variantes, atributos de variante)
+        assert len(ctx.captured_queries) <= 8
+
+    def test_other_business_is_not_exported(self, api_client, business):
+        intruder = get_user_model().objects.create_user(username='x', email='x@test.com', password='x')
+        api_client.force_authenticate(user=intruder)
+        url = f'/api/business/products/business/{business.id}/export/'
+        assert api_client.get(url).status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,69 @@
+import pytest
+from rest_framework import status
+
+from API.products.models import ProductFacet
+
+
+@pytest.mark.django_db
+class TestFacetIndex:
+
+    def _list(self, client, business, *filters):
+        url = f'/api/business/products/business/{business.id}/'
+        return client.get(url, {'attr': list(filters)})
+
+    def test_filter_intersects_attribute_sets(self, auth_client, business, make_product):
+        rojo_m = make_product(name='A', variants=[
+            {'attributes': [{'name': 'Color', 'value': 'Rojo'}, {'name': 'Talla', 'value': 'M'}],
+             'cantidad': 1, 'stock_minimo': 1},
+        ])
+        make_product(name='B', variants=[
+            {'attributes': [{'name': 'Color', 'value': 'Rojo'}, {'name': 'Talla', 'value': 'S'}],
+             'cantidad': 1, 'stock_minimo': 1},
+        ])
+
+        response = self._list(auth_client, business, 'Color:Rojo', 'Talla:M')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [p['id'] for p in response.data['results']] == [rojo_m.id]
+        counts = {(f['name'], f['value']): f['count'] for f in response.data['facets']}
+        assert counts == {('Color', 'Rojo'): 1, ('Talla', 'M'): 1, ('Marca', 'Acme'): 1}
+
+    def test_unfiltered_list_returns_global_counts(self, auth_client, business, make_product):
+        make_product(name='A')
+        make_product(name='B')
+
+        response = self._list(auth_client, business)
+
+        counts = {(f['name'], f['value']): f['count'] for f in response.data['facets']}
+        assert counts[('Color', 'Rojo')] == 2
+        assert counts[('Marca', 'Acme')] == 2
+
+    def test_counts_only_on_first_page_or_on_request(self, auth_client, business, make_product):
+        for name in 'ABC':
+            make_product(name=name)
+        url = f'/api/business/products/business/{business.id}/'
+
+        first = auth_client.get(url, {'page_size': 1})
+        assert 'facets' in first.data
+
+        next_url = first.data['next']
+        assert 'facets' not in auth_client.get(next_url).data
+        assert 'facets' in auth_client.get(next_url + '&facets=1').data
+
+    def test_index_is_maintained_on_update_and_delete(self, auth_client, business, make_product):
+        product = make_product(name='A')
+        response = auth_client.put(
+            f'/api/business/products/update/{product.id}/',
+            {'attributes': [{'name': 'Marca', 'value': 'Acme'}], 'variants': []},
+            format='json',
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert set(ProductFacet.objects.values_list('value', flat=True)) == {'Acme'}
+
+        product.delete()
+        assert not ProductFacet.objects.exists()
+
+    def test_unknown_value_returns_nothing(self, auth_client, business, make_product):
+        make_product()
+        response = self._list(auth_client, business, 'Color:Violeta')
+        assert response.data['results'] == []
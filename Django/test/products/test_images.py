@@ -0,0 +1,62 @@
+import io
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from PIL import Image
+
+from API.products.imaging import render_derivatives
+from API.products.models import ProductImage
+
+
+def png_bytes(width=1200, height=800):
+    buffer = io.BytesIO()
+    Image.new('RGB', (width, height), (200, 30, 30)).save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def media(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+    settings.PRODUCT_IMAGE_WIDTHS = (320, 640, 2000)
+    settings.PRODUCT_IMAGE_WORKERS = 0
+    return tmp_path
+
+
+@pytest.mark.django_db
+class TestImagePipeline:
+
+    def test_render_never_upscales(self):
+        rendered = render_derivatives(png_bytes(), (320, 640, 2000))
+        assert set(rendered) == {('webp', 320), ('jpeg', 320), ('webp', 640), ('jpeg', 640)}
+        with Image.open(io.BytesIO(rendered[('webp', 320)])) as image:
+            assert image.size == (320, 213)
+            assert image.format == 'WEBP'
+
+    def test_upload_generates_derivatives_next_to_original(
+        self, media, auth_client, make_product, django_capture_on_commit_callbacks
+    ):
+        product = make_product()
+        with django_capture_on_commit_callbacks(execute=True):
+            image = ProductImage.objects.create(
+                product=product, imagen=SimpleUploadedFile('foto.png', png_bytes())
+            )
+
+        image.refresh_from_db()
+        assert image.derivatives['webp']['320'] == 'productos/foto_w320.webp'
+        assert (media / 'productos' / 'foto_w640.jpg').exists()
+
+        data = auth_client.get(f'/api/business/products/detail/{product.id}/').data
+        srcset = data['images'][0]['srcset']
+        assert srcset.endswith('/media/productos/foto_w640.webp 640w')
+        assert 'foto_w320.webp 320w' in srcset
+
+    def test_backfill_command_processes_missing_images(self, media, make_product):
+        product = make_product()
+        image = ProductImage.objects.create(product=product, imagen=SimpleUploadedFile('old.png', png_bytes()))
+        assert image.derivatives == {}
+
+        call_command('backfill_image_derivatives', workers=1, stdout=io.StringIO(), stderr=io.StringIO())
+
+        image.refresh_from_db()
+        assert set(image.derivatives['jpeg']) == {'320', '640'}
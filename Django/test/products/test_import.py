@@ -0,0 +1,72 @@
+import io
+import json
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from rest_framework import status
+
+from API.products.importer import ProductImporter
+from API.products.models import Product, Category, ProductVariant
+
+
+def ndjson(rows):
+    return '\n'.join(r if isinstance(r, str) else json.dumps(r) for r in rows)
+
+
+ROW = {
+    'name': 'Camisa',
+    'price_base': '12.50',
+    'attributes': [{'name': 'Marca', 'value': 'Acme'}],
+    'inventario': {'unidad_medida': 'unidad', 'cantidad': 5, 'stock_minimo': 1},
+    'variants': [
+        {'attributes': [{'name': 'Color', 'value': 'Rojo'}], 'cantidad': 2, 'stock_minimo': 1},
+    ],
+}
+
+
+@pytest.mark.django_db
+class TestProductImporter:
+
+    def test_ndjson_import_reports_bad_rows_without_aborting(self, business):
+        """
+        Las filas válidas se insertan aunque haya filas inválidas en el medio;
+        cada error se reporta con su número de fila.
+        """
+        rows = [ROW, '{json roto', {**ROW, 'price_base': 'no-es-numero'}, {**ROW, 'name': 'Pantalón'}]
+        report = ProductImporter(business, chunk_size=2).run(io.StringIO(ndjson(rows)))
+
+        assert report['created'] == 2
+        assert [e['row'] for e in report['errors']] == [2, 3]
+        assert set(Product.objects.values_list('name', flat=True)) == {'Camisa', 'Pantalón'}
+        variant = ProductVariant.objects.first()
+        assert variant.inventario_variante.cantidad == 2
+        assert variant.variant_attributes.get().value == 'Rojo'
+
+    def test_csv_import_assigns_only_own_categories(self, business):
+        category = Category.objects.create(business=business, nombre='Ropa')
+        csv_data = (
+            'name,price_base,descripcion,unidad_medida,cantidad,stock_minimo,attributes,category_ids\n'
+            f'Gorra,5.00,,unidad,3,1,Color=Azul;Talla=M,{category.id};99999\n'
+        )
+        report = ProductImporter(business).run(io.StringIO(csv_data), fmt='csv')
+
+        assert report == {'created': 1, 'errors': []}
+        product = Product.objects.get(name='Gorra')
+        assert list(product.category_set.all()) == [category]
+        assert product.inventario.cantidad == 3
+        assert sorted(product.attributes.values_list('name__name', flat=True)) == ['Color', 'Talla']
+
+    def test_import_endpoint(self, auth_client, business):
+        upload = SimpleUploadedFile('productos.ndjson', ndjson([ROW, ROW]).encode('utf-8'))
+        response = auth_client.post('/api/business/products/import/', {'file': upload}, format='multipart')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['created'] == 2
+        assert business.products.count() == 2
+
+    def test_import_command(self, business, tmp_path):
+        path = tmp_path / 'productos.ndjson'
+        path.write_text(ndjson([ROW]), encoding='utf-8')
+        call_command('import_products', business.id, str(path), stdout=io.StringIO(), stderr=io.StringIO())
+        assert business.products.count() == 1
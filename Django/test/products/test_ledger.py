@@ -0,0 +1,100 @@
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework import status
+
+from API.products.ledger import StockLedger
+from API.products.models import Inventory, StockMovement, StockSnapshot
+from API.products.services import ProductService
+from API.sale.models import PaymentMethod
+from API.sale.services import SaleService
+
+
+def backdate(minutes):
+    """Envejece los movimientos existentes para que entren en el corte de snapshots."""
+    StockMovement.objects.update(created_at=timezone.now() - timedelta(minutes=minutes))
+
+
+@pytest.mark.django_db
+class TestStockLedger:
+
+    def test_writes_record_movements(self, business, owner, make_product):
+        product = make_product()
+        variant = product.variants.first()
+        assert StockLedger.stock_at(product.id, timezone.now()) == 10
+        assert StockLedger.stock_at(product.id, timezone.now(), variant.id) == 3
+
+        ProductService.update_product(product, {'inventario': {'unidad_medida': 'unidad', 'cantidad': 7}})
+        method = PaymentMethod.objects.create(name='Efectivo')
+        sale = SaleService.checkout(business, owner, method, [
+            {'product': product.id, 'variant': variant.id, 'quantity': Decimal('2')},
+        ])
+
+        assert StockLedger.stock_at(product.id, timezone.now()) == 7
+        assert StockLedger.stock_at(product.id, timezone.now(), variant.id) == 1
+        assert StockMovement.objects.filter(kind='sale', reference=f'sale:{sale.id}').count() == 1
+
+    def test_adjust_updates_inventory_and_ledger(self, make_product):
+        product = make_product()
+        assert StockLedger.adjust(product.id, -4, reference='merma')
+        assert Inventory.objects.get(product=product).cantidad == 6
+        assert StockLedger.stock_at(product.id, timezone.now()) == 6
+
+    def test_stock_at_uses_snapshot_plus_later_movements(self, make_product):
+        product = make_product()
+        backdate(10)
+        call_command('snapshot_stock')
+        StockLedger.adjust(product.id, 5)
+
+        snapshot = StockSnapshot.objects.get(product=product, variant=None)
+        assert snapshot.cantidad == 10
+        assert StockLedger.stock_at(product.id, timezone.now()) == 15
+        # Antes del ajuste, solo el snapshot cuenta
+        assert StockLedger.stock_at(product.id, snapshot.taken_at) == 10
+
+        # La siguiente corrida parte del snapshot anterior
+        backdate(5)
+        StockLedger.take_snapshots()
+        assert StockSnapshot.objects.filter(product=product, variant=None).latest('taken_at').cantidad == 15
+
+    def test_opening_balances_for_pre_ledger_inventory(self, make_product):
+        product = make_product()
+        StockMovement.objects.all().delete()
+
+        StockLedger.take_snapshots()
+        assert StockMovement.objects.filter(product=product, reference='apertura').count() == 3
+        assert StockLedger.stock_at(product.id, timezone.now()) == 10
+
+    def test_stock_at_endpoint(self, auth_client, make_product):
+        product = make_product()
+        before = (timezone.now() - timedelta(hours=1)).isoformat()
+
+        response = auth_client.get(f'/api/business/products/stock/{product.id}/')
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['cantidad'] == 10
+
+        response = auth_client.get(f'/api/business/products/stock/{product.id}/', {'at': before})
+        assert response.data['cantidad'] == 0
+
+        response = auth_client.get(f'/api/business/products/stock/{product.id}/', {'at': 'ayer'})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_deleting_a_variant_keeps_its_history(self, make_product):
+        product = make_product()
+        variant = product.variants.first()
+        backdate(10)
+        StockLedger.take_snapshots()
+
+        variant.delete()
+
+        history = StockMovement.objects.filter(variant_ref=variant.id)
+        assert history.exists() and not history.filter(variant__isnull=False).exists()
+        assert StockSnapshot.objects.filter(variant_ref=variant.id).exists()
+        # No se mezcla con la existencia a nivel de producto
+        assert StockLedger.stock_at(product.id, timezone.now()) == 10
+        backdate(5)
+        StockLedger.take_snapshots()
+        assert StockSnapshot.objects.filter(product=product, variant_ref=None).latest('taken_at').cantidad == 10
@@ -0,0 +1,46 @@
+import pytest
+from django.db import connection
+from rest_framework import status
+
+from API.products.ledger import StockLedger
+
+URL = '/api/business/products/low-stock/'
+
+
+@pytest.mark.django_db
+class TestLowStock:
+
+    def test_lists_only_items_below_minimum(self, auth_client, make_product):
+        low, ok = make_product(name='Baja'), make_product(name='Normal')
+        StockLedger.adjust(low.id, -9)
+        variant = low.variants.first()
+        StockLedger.adjust(low.id, -3, variant.id)
+
+        response = auth_client.get(URL)
+        assert response.status_code == status.HTTP_200_OK
+        assert [item['product'] for item in response.data['results']] == [low.id]
+        assert response.data['results'][0]['cantidad'] == 1
+
+        response = auth_client.get(URL, {'kind': 'variant'})
+        assert [item['variant'] for item in response.data['results']] == [variant.id]
+        assert response.data['results'][0]['product_name'] == 'Baja'
+
+    def test_is_paginated_and_scoped_to_owner(self, auth_client, api_client, make_product, django_user_model):
+        for i in range(3):
+            StockLedger.adjust(make_product(name=f'P{i}').id, -10)
+
+        response = auth_client.get(URL, {'page_size': 2})
+        assert len(response.data['results']) == 2
+        assert len(auth_client.get(response.data['next']).data['results']) == 1
+
+        other = django_user_model.objects.create_user(username='other', password='x')
+        api_client.force_authenticate(user=other)
+        assert api_client.get(URL).data['results'] == []
+
+    def test_invalid_kind(self, auth_client, business):
+        assert auth_client.get(URL, {'kind': 'x'}).status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_partial_indexes_exist(self, db):
+        with connection.cursor() as cursor:
+            indexes = connection.introspection.get_constraints(cursor, 'products_inventory')
+        assert 'inventory_low_stock' in indexes
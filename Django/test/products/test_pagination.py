@@ -0,0 +1,35 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
+
+@pytest.mark.django_db
+class TestProductCursorPagination:
+
+    def test_cursor_walks_all_products_without_count(self, auth_client, business, make_product):
+        """
+        Recorre el catálogo página a página siguiendo `next`:
+        sin duplicados, en orden de id y sin ejecutar COUNT(*).
+        """
+        ids = [make_product(name=f'Producto {i}', variants=[]).id for i in range(5)]
+
+        url = f'/api/business/products/business/{business.id}/?page_size=2'
+        seen = []
+        with CaptureQueriesContext(connection) as ctx:
+            while url:
+                response = auth_client.get(url)
+                assert response.status_code == status.HTTP_200_OK
+                assert len(response.data['results']) <= 2
+                seen.extend(p['id'] for p in response.data['results'])
+                url = response.data['next']
+
+        assert seen == ids
+        assert not any('COUNT(' in q['sql'].upper() for q in ctx.captured_queries)
+
+    def test_response_has_cursor_and_no_count(self, auth_client, business, make_product):
+        make_product(variants=[])
+        url = f'/api/business/products/business/{business.id}/?page_size=100000'
+        response = auth_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert 'next' in response.data and 'count' not in response.data
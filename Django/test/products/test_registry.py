@@ -0,0 +1,52 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from API.products.models import AttributeName
+from API.products.registry import AttributeNameRegistry, attribute_names
+
+
+@pytest.mark.django_db
+class TestAttributeNameRegistry:
+
+    @pytest.fixture
+    def registry(self):
+        return AttributeNameRegistry(max_size=2)
+
+    def test_resolve_creates_missing_names_in_batch(self, registry):
+        AttributeName.objects.create(name='Color')
+        with CaptureQueriesContext(connection) as ctx:
+            names = registry.resolve(['Color', 'Talla', 'Material', 'Talla'])
+
+        assert set(names) == {'Color', 'Talla', 'Material'}
+        assert AttributeName.objects.count() == 3
+        # buscar existentes + bulk_create + releer los creados
+        assert len(ctx.captured_queries) == 3
+
+    def test_resolve_without_create_skips_unknown(self, registry):
+        assert registry.resolve(['Nada'], create=False) == {}
+        assert not AttributeName.objects.exists()
+
+    def test_warm_cache_needs_no_queries(self, registry, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            expected = registry.resolve(['Color', 'Talla'])
+
+        with CaptureQueriesContext(connection) as ctx:
+            assert registry.resolve(['Color', 'Talla']) == expected
+        assert len(ctx.captured_queries) == 0
+
+    def test_cache_is_bounded(self, registry, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            registry.resolve(['A', 'B', 'C'])
+        assert len(registry._ids) == 2
+
+    def test_signals_invalidate_renamed_names(self, django_capture_on_commit_callbacks):
+        attribute_names.invalidate()
+        with django_capture_on_commit_callbacks(execute=True):
+            color_id = attribute_names.resolve(['Color'])['Color']
+
+        name = AttributeName.objects.get(pk=color_id)
+        name.name = 'Colour'
+        name.save()
+
+        assert attribute_names.resolve(['Color'], create=False) == {}
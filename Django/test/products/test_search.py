@@ -0,0 +1,73 @@
+import io
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from rest_framework import status
+
+from API.products.models import Business
+from API.products.search import search_products
+
+
+@pytest.mark.django_db
+class TestProductSearch:
+
+    def _search(self, client, q):
+        return client.get('/api/business/products/search/', {'q': q})
+
+    def test_search_matches_name_description_and_attribute_values(self, auth_client, make_product):
+        camisa = make_product(name='Camisa de lino')
+        pantalon = make_product(name='Pantalón', attributes=[{'name': 'Material', 'value': 'Algodón'}])
+
+        assert [p['id'] for p in self._search(auth_client, 'lino').data] == [camisa.id]
+        # Valores de atributo de producto (sin tildes) y de variante
+        assert [p['id'] for p in self._search(auth_client, 'algodon').data] == [pantalon.id]
+        assert {p['id'] for p in self._search(auth_client, 'rojo').data} == {camisa.id, pantalon.id}
+
+    def test_name_matches_rank_above_attribute_matches(self, auth_client, make_product):
+        by_attribute = make_product(name='Gorra', attributes=[{'name': 'Marca', 'value': 'Azul'}], variants=[])
+        by_name = make_product(name='Azul marino', attributes=[], variants=[])
+
+        results = self._search(auth_client, 'azul').data
+        assert [p['id'] for p in results] == [by_name.id, by_attribute.id]
+        assert results[0]['rank'] > results[1]['rank']
+
+    def test_index_follows_updates_and_deletes(self, auth_client, make_product):
+        product = make_product(name='Camisa')
+        response = auth_client.put(f'/api/business/products/update/{product.id}/',
+                                   {'name': 'Chaqueta', 'descripcion': 'Abrigo'},
+                                   format='json')
+        assert response.status_code == status.HTTP_200_OK
+
+        assert self._search(auth_client, 'camisa').data == []
+        assert len(self._search(auth_client, 'chaqueta').data) == 1
+
+        product.delete()
+        assert self._search(auth_client, 'chaqueta').data == []
+
+    def test_search_is_scoped_to_business(self, owner, make_product):
+        product = make_product(name='Camisa')
+        other = Business.objects.create(user=owner, name='Otra')
+        assert search_products(other.id, 'camisa') == []
+        assert [pid for pid, _ in search_products(product.business_id, 'camisa')] == [product.id]
+
+    def test_rebuild_command(self, business, make_product):
+        make_product(name='Camisa')
+        call_command('rebuild_search_index', stdout=io.StringIO())
+        assert len(search_products(business.id, 'camisa')) == 1
+
+    def test_missing_query_is_rejected(self, auth_client, business):
+        assert self._search(auth_client, '').status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_non_positive_limit_is_rejected(self, auth_client, make_product):
+        make_product()
+        for limit in (0, -1):
+            response = auth_client.get('/api/business/products/search/', {'q': 'camisa', 'limit': limit})
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_index_tables_come_from_the_migration(self):
+        tables = connection.introspection.table_names()
+        assert 'products_search_fts' in tables
+        # ProductSearch solo se crea en Postgres (tsvector + GIN)
+        assert ('products_search' in tables) == (connection.vendor == 'postgresql')
+        assert 'products_search' in connection.introspection.django_table_names()
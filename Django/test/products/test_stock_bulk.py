@@ -0,0 +1,96 @@
+import pytest
+from django.db import connection
+from django.db.models.query import QuerySet
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
+from API.products.models import Business, Product, Inventory, InventoryVariant, StockMovement
+from API.products.services import ProductService
+
+URL = '/api/business/products/stock/bulk/'
+
+
+@pytest.mark.django_db
+class TestStockBulkAdjust:
+
+    def test_absolute_and_delta_adjustments(self, auth_client, make_product):
+        product = make_product()
+        variant = product.variants.first()
+
+        response = auth_client.post(URL, {'reference': 'conteo', 'items': [
+            {'product': product.id, 'cantidad': 25},
+            {'product': product.id, 'variant': variant.id, 'delta': -1},
+        ]}, format='json')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {'updated': 2}
+        assert Inventory.objects.get(product=product).cantidad == 25
+        assert InventoryVariant.objects.get(variant=variant).cantidad == 2
+        assert sorted(StockMovement.objects.filter(reference='conteo').values_list('cantidad', flat=True)) == [-1, 15]
+
+    def test_locks_only_inventory_rows(self, auth_client, make_product, monkeypatch):
+        """Los JOIN de propiedad no deben bloquear productos ni variantes (FOR UPDATE OF)."""
+        product = make_product()
+        variant = product.variants.first()
+        locks = {}
+        original = QuerySet.select_for_update
+
+        def spy(queryset, *args, **kwargs):
+            locked = original(queryset, *args, **kwargs)
+            locks[queryset.model.__name__] = locked.query.select_for_update_of
+            return locked
+        monkeypatch.setattr(QuerySet, 'select_for_update', spy)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = auth_client.post(URL, {'items': [
+                {'product': product.id, 'cantidad': 1},
+                {'product': product.id, 'variant': variant.id, 'cantidad': 1},
+            ]}, format='json')
+        assert response.status_code == status.HTTP_200_OK
+        assert locks == {'Inventory': ('self',), 'InventoryVariant': ('self',)}
+        if connection.features.has_select_for_update_of:
+            locking = [q['sql'] for q in ctx.captured_queries if 'FOR UPDATE' in q['sql']]
+            assert len(locking) == 2 and all('FOR UPDATE OF' in sql for sql in locking)
+
+    def test_foreign_items_reject_the_whole_batch(self, auth_client, make_product, django_user_model):
+        mine = make_product()
+        other_business = Business.objects.create(
+            user=django_user_model.objects.create_user(username='other', password='x'), name='Otra',
+        )
+        theirs = ProductService.create_product_with_details(other_business, {
+            'name': 'Ajeno', 'price_base': '1.00', 'attributes': [],
+            'inventario': {'unidad_medida': 'unidad', 'cantidad': 5, 'stock_minimo': 1},
+        })
+
+        response = auth_client.post(URL, {'items': [
+            {'product': mine.id, 'cantidad': 1},
+            {'product': theirs.id, 'cantidad': 0},
+            # Variante de otro producto
+            {'product': theirs.id, 'variant': mine.variants.first().id, 'cantidad': 0},
+        ]}, format='json')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert {'product': theirs.id} in response.data['missing']
+        assert Inventory.objects.get(product=mine).cantidad == 10
+        assert Inventory.objects.get(product=theirs).cantidad == 5
+
+    def test_validation(self, auth_client, business):
+        for items in ([], [{'product': 1}], [{'product': 1, 'cantidad': 1, 'delta': 1}],
+                      [{'product': 1, 'cantidad': 1}, {'product': 1, 'delta': 2}]):
+            assert auth_client.post(URL, {'items': items}, format='json').status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_large_batch_uses_constant_queries(self, auth_client, business, django_assert_max_num_queries):
+        products = Product.objects.bulk_create([
+            Product(business=business, name=f'P{i}', price_base='1.00') for i in range(2000)
+        ])
+        Inventory.objects.bulk_create([
+            Inventory(product=p, unidad_medida='unidad', cantidad=0) for p in products
+        ])
+
+        # Lecturas + bulk_update y bulk_create por bloques, nunca una consulta por ítem
+        with django_assert_max_num_queries(40):
+            response = auth_client.post(URL, {'items': [
+                {'product': p.id, 'cantidad': i} for i, p in enumerate(products, start=1)
+            ]}, format='json')
+        assert response.status_code == status.HTTP_200_OK
+        assert Inventory.objects.get(product=products[-1]).cantidad == 2000
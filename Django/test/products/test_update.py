@@ -0,0 +1,79 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
+from API.products.models import AttributeName, ProductVariant
+
+
+@pytest.mark.django_db
+class TestProductReconcileUpdate:
+
+    def _payload(self, **overrides):
+        payload = {
+            'name': 'Camisa',
+            'price_base': '10.00',
+            'attributes': [{'name': 'Marca', 'value': 'Acme'}],
+            'inventario': {'unidad_medida': 'unidad', 'cantidad': 10, 'stock_minimo': 2},
+            'variants': [
+                {'attributes': [{'name': 'Talla', 'value': 'M'}, {'name': 'Color', 'value': 'Rojo'}],
+                 'cantidad': 3, 'stock_minimo': 1},
+                {'attributes': [{'name': 'Color', 'value': 'Azul'}, {'name': 'Talla', 'value': 'S'}],
+                 'cantidad': 4, 'stock_minimo': 1},
+            ],
+        }
+        payload.update(overrides)
+        return payload
+
+    def _put(self, client, product, payload):
+        return client.put(f'/api/business/products/update/{product.id}/', payload, format='json')
+
+    def test_price_only_change_keeps_variants_and_issues_no_deletes(self, auth_client, make_product):
+        """
+        Cambiar solo el precio no debe borrar ni recrear atributos o variantes,
+        aunque los atributos de variante lleguen en otro orden.
+        """
+        product = make_product()
+        variant_ids = set(product.variants.values_list('id', flat=True))
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self._put(auth_client, product, self._payload(price_base='15.00'))
+
+        assert response.status_code == status.HTTP_200_OK
+        product.refresh_from_db()
+        assert str(product.price_base) == '15.00'
+        assert set(product.variants.values_list('id', flat=True)) == variant_ids
+        # El índice de búsqueda se reescribe aparte; se excluye del conteo
+        writes = [q['sql'] for q in ctx.captured_queries if 'products_search' not in q['sql']]
+        assert not any(sql.startswith(('DELETE', 'INSERT')) for sql in writes)
+
+    def test_changed_and_removed_variants_are_reconciled(self, auth_client, make_product):
+        product = make_product()
+        AttributeName.objects.create(name='Material')
+        rojo = ProductVariant.objects.get(product=product, variant_attributes__value='Rojo')
+
+        payload = self._payload(
+            attributes=[{'name': 'Marca', 'value': 'Otra'}, {'name': 'Material', 'value': 'Algodón'}],
+            variants=[
+                {'attributes': [{'name': 'Color', 'value': 'Rojo'}, {'name': 'Talla', 'value': 'M'}],
+                 'cantidad': 7, 'stock_minimo': 1},
+                {'attributes': [{'name': 'Color', 'value': 'Verde'}, {'name': 'Talla', 'value': 'L'}],
+                 'cantidad': 1, 'stock_minimo': 1},
+            ],
+        )
+        response = self._put(auth_client, product, payload)
+        assert response.status_code == status.HTTP_200_OK
+
+        rojo.refresh_from_db()
+        assert rojo.inventario_variante.cantidad == 7
+        assert not product.variants.filter(variant_attributes__value='Azul').exists()
+        assert product.variants.filter(variant_attributes__value='Verde').exists()
+        assert dict(product.attributes.values_list('name__name', 'value')) == {
+            'Marca': 'Otra', 'Material': 'Algodón'
+        }
+
+    def test_unknown_attribute_name_is_rejected(self, auth_client, make_product):
+        product = make_product()
+        payload = self._payload(attributes=[{'name': 'Inexistente', 'value': 'x'}])
+        response = self._put(auth_client, product, payload)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,60 @@
+import pytest
+from django.core.management import call_command
+from django.db import IntegrityError, transaction
+from rest_framework import status
+
+from API.products.models import ProductVariant
+from API.products.services import ProductService
+
+URL = '/api/business/products/variants/resolve/'
+
+
+@pytest.mark.django_db
+class TestVariantSignature:
+
+    def test_resolve_is_order_independent(self, auth_client, make_product):
+        product = make_product()
+        rojo = product.variants.get(variant_attributes__value='Rojo')
+
+        response = auth_client.get(URL, {'product': product.id, 'attr': ['Talla:M', 'Color:Rojo']})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['id'] == rojo.id
+
+        for attrs in (['Color:Rojo'], ['Color:Rojo', 'Talla:S'], ['Peso:1kg']):
+            response = auth_client.get(URL, {'product': product.id, 'attr': attrs})
+            assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_resolve_is_scoped_to_owner(self, api_client, make_product, django_user_model):
+        product = make_product()
+        api_client.force_authenticate(user=django_user_model.objects.create_user(username='other', password='x'))
+        response = api_client.get(URL, {'product': product.id, 'attr': ['Color:Rojo', 'Talla:M']})
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_duplicate_combination_is_rejected(self, auth_client, business, make_product):
+        variant = {'attributes': [{'name': 'Color', 'value': 'Rojo'}], 'cantidad': 1, 'stock_minimo': 1}
+        response = auth_client.post('/api/business/products/register/', {
+            'name': 'Gorra', 'price_base': '5.00', 'descripcion': '',
+            'attributes': [], 'inventario': {'unidad_medida': 'unidad', 'cantidad': 1, 'stock_minimo': 1},
+            'variants': [variant, variant],
+        }, format='json')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'variants' in response.data
+
+        product = make_product()
+        with pytest.raises(IntegrityError), transaction.atomic():
+            ProductService._create_variant(product, {
+                'attributes': [{'name': 'Talla', 'value': 'M'}, {'name': 'Color', 'value': 'Rojo'}],
+            })
+
+    def test_update_keeps_and_backfills_signatures(self, make_product):
+        product = make_product()
+        ProductVariant.objects.filter(product=product).update(signature=None)
+        call_command('backfill_variant_signatures')
+        signatures = set(ProductVariant.objects.values_list('signature', flat=True))
+        assert None not in signatures and len(signatures) == 2
+
+        ProductService.update_product(product, {'variants': [
+            {'attributes': [{'name': 'Color', 'value': 'Rojo'}, {'name': 'Talla', 'value': 'M'}], 'cantidad': 3},
+            {'attributes': [{'name': 'Color', 'value': 'Verde'}], 'cantidad': 1},
+        ]})
+        assert ProductVariant.objects.filter(product=product).exclude(signature__in=signatures).count() == 1
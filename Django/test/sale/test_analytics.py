@@ -0,0 +1,88 @@
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework import status
+
+from API.sale.models import Sale
+from API.sale.rollups import SalesRollup
+from API.sale.services import SaleService
+
+URL = '/api/sales/analytics/{}/'
+
+
+@pytest.mark.django_db
+class TestSalesAnalytics:
+
+    def sell(self, business, owner, method, product, quantity):
+        return SaleService.checkout(business, owner, method, [
+            {'product': product.id, 'quantity': Decimal(quantity)},
+        ])
+
+    def test_top_products_and_by_hour(self, auth_client, business, owner, payment_method, make_product):
+        camisa, gorra = make_product(name='Camisa', price='10.00'), make_product(name='Gorra', price='3.00')
+        self.sell(business, owner, payment_method, gorra, '1')
+        self.sell(business, owner, payment_method, camisa, '2')
+
+        response = auth_client.get(URL.format('top-products'), {'limit': 1})
+        assert response.status_code == status.HTTP_200_OK
+        assert [(row['product_name'], row['rank'], row['revenue']) for row in response.data] == [
+            ('Camisa', 1, Decimal('20.00')),
+        ]
+
+        response = auth_client.get(URL.format('by-hour'))
+        hour = timezone.localtime().hour
+        assert response.data == [{'hour': hour, 'sales_count': 2, 'revenue': Decimal('23.00')}]
+
+    def test_summary_compares_with_previous_period(self, auth_client, business, owner, payment_method, make_product):
+        product = make_product(price='10.00')
+        self.sell(business, owner, payment_method, product, '3')
+        self.sell(business, owner, payment_method, product, '1')
+        old = self.sell(business, owner, payment_method, product, '2')
+        Sale.objects.filter(pk=old.pk).update(sale_date=timezone.now() - timedelta(days=7))
+        SalesRollup.rebuild(business.id)
+
+        today = timezone.localdate()
+        response = auth_client.get(URL.format('summary'), {'from': str(today - timedelta(days=6)), 'to': str(today)})
+        data = response.data
+        assert (data['sales_count'], data['revenue'], data['average_ticket']) == (2, Decimal('40.00'), Decimal('20.00'))
+        assert (data['previous']['sales_count'], data['previous']['revenue']) == (1, Decimal('20.00'))
+        assert data['revenue_change_pct'] == Decimal('100.00')
+
+    def test_results_are_cached_until_next_sale(self, auth_client, business, owner, payment_method, make_product,
+                                                django_assert_num_queries, django_capture_on_commit_callbacks):
+        product = make_product(price='10.00')
+        with django_capture_on_commit_callbacks(execute=True):
+            self.sell(business, owner, payment_method, product, '1')
+
+        assert auth_client.get(URL.format('summary')).data['sales_count'] == 1
+        # Negocio y reporte salen de la caché
+        with django_assert_num_queries(0):
+            auth_client.get(URL.format('summary'))
+
+        with django_capture_on_commit_callbacks(execute=True):
+            self.sell(business, owner, payment_method, product, '1')
+        assert auth_client.get(URL.format('summary')).data['sales_count'] == 2
+
+    def test_results_expire_after_ttl(self, auth_client, business, settings, monkeypatch):
+        """Con caché por proceso, el TTL acota cuánto sirve otro worker un reporte viejo."""
+        settings.ANALYTICS_CACHE_TTL = 15
+        timeouts = {}
+        original = cache.set
+
+        def record(key, value, timeout=None, **kwargs):
+            timeouts[key] = timeout
+            return original(key, value, timeout=timeout, **kwargs)
+        monkeypatch.setattr(cache, 'set', record)
+
+        auth_client.get(URL.format('summary'))
+        assert [t for key, t in timeouts.items() if ':summary:' in key] == [15]
+
+    def test_invalid_parameters(self, auth_client, business):
+        assert auth_client.get(URL.format('summary'), {'from': '2024-02-10', 'to': '2024-02-01'}).status_code == 400
+        assert auth_client.get(URL.format('top-products'), {'limit': 'x'}).status_code == 400
+        assert auth_client.get(URL.format('top-products'), {'limit': -1}).status_code == 400
+        assert auth_client.get(URL.format('top-products'), {'limit': 0}).status_code == 400
+        assert auth_client.get(URL.format('funnel')).status_code == 404
@@ -0,0 +1,112 @@
+import threading
+from decimal import Decimal
+
+import pytest
+from django.db import OperationalError, connection
+from rest_framework import status
+
+from API.products.models import Inventory, InventoryVariant
+from API.sale.models import Sale, SaleItem
+from API.sale.services import SaleService, CheckoutError
+
+
+@pytest.mark.django_db
+class TestCheckout:
+
+    def test_checkout_computes_totals_and_decrements_stock(self, auth_client, business, payment_method, make_product):
+        product = make_product(price='12.50')
+        variant = product.variants.first()
+
+        response = auth_client.post('/api/sales/checkout/', {
+            'business': business.id,
+            'payment_method': payment_method.id,
+            'items': [
+                {'product': product.id, 'quantity': '2'},
+                {'product': product.id, 'variant': variant.id, 'quantity': '1'},
+            ],
+            # El total enviado por el cliente se ignora
+            'total_amount': '0.01',
+        }, format='json')
+
+        assert response.status_code == status.HTTP_201_CREATED
+        sale = Sale.objects.get()
+        assert sale.total_amount == Decimal('37.50')
+        assert sorted(SaleItem.objects.values_list('subtotal', flat=True)) == [Decimal('12.50'), Decimal('25.00')]
+        assert Inventory.objects.get(product=product).cantidad == 8
+        assert InventoryVariant.objects.get(variant=variant).cantidad == 2
+
+    def test_insufficient_stock_rolls_back_everything(self, business, owner, payment_method, make_product):
+        product = make_product()
+        variant = product.variants.first()
+
+        with pytest.raises(CheckoutError):
+            SaleService.checkout(business, owner, payment_method, [
+                {'product': product.id, 'quantity': Decimal('1')},
+                {'product': product.id, 'variant': variant.id, 'quantity': Decimal('99')},
+            ])
+
+        assert not Sale.objects.exists()
+        assert Inventory.objects.get(product=product).cantidad == 10
+
+    def test_foreign_variant_is_rejected(self, business, owner, payment_method, make_product):
+        product, other = make_product(name='A'), make_product(name='B')
+        with pytest.raises(CheckoutError):
+            SaleService.checkout(business, owner, payment_method, [
+                {'product': product.id, 'variant': other.variants.first().id, 'quantity': Decimal('1')},
+            ])
+
+    def test_foreign_business_is_forbidden(self, api_client, business, payment_method, make_product, django_user_model):
+        product = make_product()
+        intruder = django_user_model.objects.create_user(username='x', email='x@test.com', password='x')
+        api_client.force_authenticate(user=intruder)
+        response = api_client.post('/api/sales/checkout/', {
+            'business': business.id,
+            'payment_method': payment_method.id,
+            'items': [{'product': product.id, 'quantity': '1'}],
+        }, format='json')
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db(transaction=True)
+class TestCheckoutConcurrency:
+
+    def test_concurrent_checkouts_never_oversell(self, business, owner, payment_method, make_product):
+        """
+        Varios hilos intentan vender la misma variante a la vez: las ventas
+        confirmadas nunca superan el stock inicial y el stock nunca es negativo.
+        """
+        product = make_product(variants=[
+            {'attributes': [{'name': 'Color', 'value': 'Rojo'}], 'cantidad': 5, 'stock_minimo': 0},
+        ])
+        variant = product.variants.get()
+        barrier = threading.Barrier(12)
+        results = []
+
+        def sell():
+            barrier.wait()
+            try:
+                SaleService.checkout(business, owner, payment_method, [
+                    {'product': product.id, 'variant': variant.id, 'quantity': Decimal('1')},
+                ])
+                results.append('ok')
+            except (CheckoutError, OperationalError):
+                # Stock insuficiente o bloqueo de la base de datos: nunca una venta de más
+                results.append('rejected')
+            except Exception as e:
+                # Cualquier otro fallo es un error real, no un rechazo
+                results.append(repr(e))
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=sell) for _ in range(12)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert set(results) <= {'ok', 'rejected'}, results
+        sold = results.count('ok')
+        remaining = InventoryVariant.objects.get(variant=variant).cantidad
+        assert 0 < sold <= 5
+        assert remaining == 5 - sold
+        assert Sale.objects.count() == sold
@@ -0,0 +1,96 @@
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework import status
+
+from API.sale.models import Sale, PaymentMethod, DailySales, DailyProductSales, DailyPaymentSales
+from API.sale.services import SaleService
+
+
+def snapshot():
+    return (
+        sorted(DailySales.objects.values_list('day', 'sales_count', 'revenue')),
+        sorted(DailyProductSales.objects.values_list('day', 'product_id', 'variant_id', 'quantity', 'revenue'),
+               key=lambda row: (row[0], row[1], row[2] or 0)),
+        sorted(DailyPaymentSales.objects.values_list('day', 'payment_method_id', 'sales_count', 'revenue')),
+    )
+
+
+@pytest.mark.django_db
+class TestSalesRollups:
+
+    def sell(self, business, owner, method, product, quantity, variant=None):
+        return SaleService.checkout(business, owner, method, [
+            {'product': product.id, 'variant': variant, 'quantity': Decimal(quantity)},
+        ])
+
+    def test_checkout_updates_rollups(self, business, owner, payment_method, make_product):
+        product = make_product(price='10.00')
+        variant = product.variants.first()
+        card = PaymentMethod.objects.create(name='Tarjeta')
+
+        self.sell(business, owner, payment_method, product, '2')
+        self.sell(business, owner, card, product, '1')
+        self.sell(business, owner, card, product, '1', variant.id)
+
+        today = timezone.localdate()
+        daily = DailySales.objects.get(business=business, day=today)
+        assert (daily.sales_count, daily.revenue) == (3, Decimal('40.00'))
+        by_item = {
+            row.variant_id: (row.quantity, row.revenue)
+            for row in DailyProductSales.objects.filter(business=business, day=today)
+        }
+        assert by_item == {None: (Decimal('3'), Decimal('30.00')), variant.id: (Decimal('1'), Decimal('10.00'))}
+        assert DailyPaymentSales.objects.get(payment_method=card).sales_count == 2
+
+    def test_rebuild_matches_incremental(self, business, owner, payment_method, make_product):
+        product = make_product(price='5.00')
+        self.sell(business, owner, payment_method, product, '1')
+        old = self.sell(business, owner, payment_method, product, '3')
+        Sale.objects.filter(pk=old.pk).update(sale_date=timezone.now() - timedelta(days=3))
+
+        call_command('rebuild_sales_rollups')
+        rebuilt = snapshot()
+        assert len(rebuilt[0]) == 2
+
+        # Reconstruir solo desde hoy no toca los días anteriores
+        call_command('rebuild_sales_rollups', business=business.id, since=str(timezone.localdate()))
+        assert snapshot() == rebuilt
+
+    def test_deleted_variant_folds_into_product_row(self, business, owner, payment_method, make_product):
+        product = make_product(price='10.00')
+        variant = product.variants.first()
+        self.sell(business, owner, payment_method, product, '2')
+        self.sell(business, owner, payment_method, product, '1', variant.id)
+
+        variant.delete()
+
+        row = DailyProductSales.objects.get(business=business, product=product)
+        assert (row.variant_id, row.quantity, row.revenue) == (None, Decimal('3'), Decimal('30.00'))
+        # Sigue cuadrando con DailySales y con una reconstrucción desde SaleItem
+        assert DailySales.objects.get(business=business).revenue == row.revenue
+        before = snapshot()
+        call_command('rebuild_sales_rollups')
+        assert snapshot() == before
+
+    def test_reports_read_rollups(self, auth_client, business, owner, payment_method, make_product):
+        product = make_product(price='10.00')
+        self.sell(business, owner, payment_method, product, '2')
+        today = str(timezone.localdate())
+
+        response = auth_client.get('/api/sales/reports/daily/', {'from': today, 'to': today})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == [{'day': timezone.localdate(), 'sales_count': 1, 'revenue': Decimal('20.00')}]
+
+        response = auth_client.get('/api/sales/reports/products/')
+        assert response.data[0]['product_name'] == product.name
+        assert response.data[0]['quantity'] == Decimal('2')
+
+        response = auth_client.get('/api/sales/reports/payment-methods/')
+        assert response.data[0]['payment_method_name'] == 'Efectivo'
+
+        assert auth_client.get('/api/sales/reports/daily/', {'from': '2024-13-01'}).status_code == 400
+        assert auth_client.get('/api/sales/reports/hourly/').status_code == 404
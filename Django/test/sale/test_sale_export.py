@@ -0,0 +1,68 @@
+import csv
+import gzip
+import io
+import json
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework import status
+
+from API.sale import export
+from API.sale.models import Sale
+from API.sale.services import SaleService
+
+URL = '/api/sales/export/'
+
+
+@pytest.mark.django_db
+class TestSaleExport:
+
+    @pytest.fixture
+    def sales(self, business, owner, payment_method, make_product):
+        product = make_product(price='10.00')
+        variant = product.variants.first()
+        return [
+            SaleService.checkout(business, owner, payment_method, [
+                {'product': product.id, 'quantity': Decimal('1')},
+                {'product': product.id, 'variant': variant.id, 'quantity': Decimal('1')},
+            ])
+            for _ in range(3)
+        ]
+
+    def _get(self, client, **params):
+        response = client.get(URL, params)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        return b''.join(response.streaming_content)
+
+    def test_gzip_csv_one_row_per_item(self, auth_client, sales):
+        body = self._get(auth_client)
+        rows = list(csv.DictReader(io.StringIO(gzip.decompress(body).decode('utf-8'))))
+
+        assert [int(row['sale_id']) for row in rows] == [sale.id for sale in sales for _ in range(2)]
+        assert rows[1]['subtotal'] == '10.00'
+        assert rows[0]['variant_id'] == ''
+
+    def test_plain_ndjson_and_date_range(self, auth_client, sales):
+        Sale.objects.filter(pk=sales[0].pk).update(sale_date=timezone.now() - timedelta(days=40))
+        today = str(timezone.localdate())
+
+        body = self._get(auth_client, fmt='ndjson', compress='none', **{'from': today})
+        lines = [json.loads(line) for line in body.decode('utf-8').splitlines()]
+        assert [line['id'] for line in lines] == [sales[1].id, sales[2].id]
+        assert len(lines[0]['items']) == 2
+
+    def test_queries_grow_per_chunk_not_per_sale(self, business, sales, monkeypatch):
+        monkeypatch.setattr(export, 'EXPORT_CHUNK_SIZE', 2)
+        with CaptureQueriesContext(connection) as ctx:
+            assert len(list(export.iter_ndjson(export.export_queryset(business.id)))) == 3
+        # 2 bloques x (ventas, ítems)
+        assert len(ctx.captured_queries) <= 4
+
+    def test_invalid_parameters(self, auth_client, business):
+        assert auth_client.get(URL, {'fmt': 'xlsx'}).status_code == status.HTTP_400_BAD_REQUEST
+        assert auth_client.get(URL, {'compress': 'zip'}).status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,72 @@
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.utils import timezone
+from rest_framework import status
+
+from API.sale.models import Sale, PaymentMethod
+from API.sale.services import SaleService
+
+URL = '/api/sales/'
+
+
+@pytest.mark.django_db
+class TestSaleList:
+
+    @pytest.fixture
+    def sales(self, business, owner, payment_method, make_product):
+        product = make_product(price='10.00')
+        card = PaymentMethod.objects.create(name='Tarjeta')
+        sales = [
+            SaleService.checkout(business, owner, method, [{'product': product.id, 'quantity': Decimal('1')}])
+            for method in (payment_method, card, card)
+        ]
+        Sale.objects.filter(pk=sales[0].pk).update(sale_date=timezone.now() - timedelta(days=10))
+        return sales
+
+    def test_lists_only_own_sales_with_items(self, auth_client, api_client, sales, django_user_model):
+        response = auth_client.get(URL)
+        assert response.status_code == status.HTTP_200_OK
+        assert [sale['id'] for sale in response.data['results']] == [sales[2].id, sales[1].id, sales[0].id]
+        assert response.data['results'][0]['payment_method_name'] == 'Tarjeta'
+        assert len(response.data['results'][0]['items']) == 1
+
+        api_client.force_authenticate(user=django_user_model.objects.create_user(username='other', password='x'))
+        assert api_client.get(URL).data['results'] == []
+
+    def test_filters(self, auth_client, sales, payment_method):
+        today = timezone.localdate()
+        response = auth_client.get(URL, {'from': str(today), 'to': str(today)})
+        assert {sale['id'] for sale in response.data['results']} == {sales[1].id, sales[2].id}
+
+        response = auth_client.get(URL, {'to': str(today - timedelta(days=1))})
+        assert [sale['id'] for sale in response.data['results']] == [sales[0].id]
+
+        response = auth_client.get(URL, {'payment_method': payment_method.id})
+        assert [sale['id'] for sale in response.data['results']] == [sales[0].id]
+
+        assert auth_client.get(URL, {'from': 'ayer'}).status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_query_count_is_constant(self, auth_client, sales, django_assert_num_queries):
+        auth_client.get(URL)
+        # ventas + ítems (prefetch); método de pago y vendedor vienen en el JOIN,
+        # y el negocio del usuario ya está en caché
+        with django_assert_num_queries(2):
+            auth_client.get(URL)
+
+    def test_cursor_pages_with_shared_sale_date(self, auth_client, business, owner, payment_method, make_product):
+        product = make_product(price='1.00')
+        sales = [
+            SaleService.checkout(business, owner, payment_method, [{'product': product.id, 'quantity': Decimal('1')}])
+            for _ in range(5)
+        ]
+        Sale.objects.update(sale_date=timezone.now())
+
+        seen, response = [], auth_client.get(URL, {'page_size': 2})
+        while True:
+            seen += [sale['id'] for sale in response.data['results']]
+            if not response.data['next']:
+                break
+            response = auth_client.get(response.data['next'])
+        assert seen == [sale.id for sale in reversed(sales)]
@@ -0,0 +1,100 @@
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.utils import timezone
+
+from API.sale.models import WhatsAppOutbox
+from API.sale.notifications import LocalTransport, TransportError, claim, dispatch
+from API.sale.services import SaleService
+
+
+class FailingTransport:
+    def __init__(self, fail_times):
+        self.fail_times = fail_times
+        self.calls = 0
+
+    def send(self, number, message):
+        self.calls += 1
+        if self.calls <= self.fail_times:
+            raise TransportError("proveedor no disponible")
+
+
+@pytest.fixture(autouse=True)
+def local_outbox(settings):
+    settings.WHATSAPP_TRANSPORT = 'API.sale.notifications.LocalTransport'
+    LocalTransport.sent.clear()
+    yield LocalTransport.sent
+    LocalTransport.sent.clear()
+
+
+@pytest.mark.django_db
+class TestWhatsAppOutbox:
+
+    def sell(self, business, owner, method, product, **extra):
+        return SaleService.checkout(business, owner, method, [
+            {'product': product.id, 'quantity': Decimal('1')},
+        ], **extra)
+
+    def make_due(self):
+        WhatsAppOutbox.objects.update(next_attempt_at=timezone.now() - timedelta(seconds=1))
+
+    def test_checkout_only_enqueues(self, business, owner, payment_method, make_product, local_outbox):
+        product = make_product()
+        sale = self.sell(business, owner, payment_method, product,
+                         whatsapp_number='+58412000000', whatsapp_message='Gracias por su compra')
+        self.sell(business, owner, payment_method, product)
+
+        message = WhatsAppOutbox.objects.get()
+        assert (message.sale_id, message.status) == (sale.id, 'pending')
+        assert local_outbox == []
+
+        call_command('dispatch_whatsapp')
+        message.refresh_from_db()
+        assert message.status == 'sent' and message.attempts == 1
+        assert local_outbox == [('+58412000000', 'Gracias por su compra')]
+
+    def test_retries_with_backoff_then_succeeds(self, business, owner, payment_method, make_product):
+        self.sell(business, owner, payment_method, make_product(), whatsapp_number='1', whatsapp_message='hola')
+        transport = FailingTransport(fail_times=1)
+
+        assert dispatch(transport=transport) == {'retry': 1}
+        message = WhatsAppOutbox.objects.get()
+        assert message.status == 'pending' and message.last_error == 'proveedor no disponible'
+        assert message.next_attempt_at > timezone.now() + timedelta(seconds=20)
+        # Aún no vence: no se reintenta
+        assert dispatch(transport=transport) == {}
+
+        self.make_due()
+        assert dispatch(transport=transport) == {'sent': 1}
+
+    def test_dead_letter_after_max_attempts(self, business, owner, payment_method, make_product, settings):
+        settings.WHATSAPP_MAX_ATTEMPTS = 2
+        self.sell(business, owner, payment_method, make_product(), whatsapp_number='1', whatsapp_message='hola')
+        transport = FailingTransport(fail_times=10)
+
+        dispatch(transport=transport)
+        self.make_due()
+        assert dispatch(transport=transport) == {'dead': 1}
+        self.make_due()
+        assert dispatch(transport=transport) == {}
+        assert WhatsAppOutbox.objects.get().status == 'dead'
+
+    def test_claimed_messages_are_leased(self, business, owner, payment_method, make_product):
+        self.sell(business, owner, payment_method, make_product(), whatsapp_number='1', whatsapp_message='hola')
+        assert len(claim(10)) == 1
+        # Un segundo despachador no vuelve a tomarlo mientras dure el lease
+        assert claim(10) == []
+
+    def test_missing_transport_fails_loudly(self, business, owner, payment_method, make_product, settings):
+        settings.WHATSAPP_TRANSPORT = None
+        product = make_product()
+        self.sell(business, owner, payment_method, product,
+                  whatsapp_number='+58412000000', whatsapp_message='Gracias por su compra')
+        self.make_due()
+
+        with pytest.raises(ImproperlyConfigured):
+            dispatch()
+        assert WhatsAppOutbox.objects.get().status == 'pending'
@@ -0,0 +1,60 @@
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken
+
+from API.user.auth_cache import get_cached_user
+
+User = get_user_model()
+
+URL = '/api/auth/me/'
+
+
+@pytest.mark.django_db
+class TestAuthenticatedUserCache:
+
+    @pytest.fixture
+    def user(self):
+        return User.objects.create_user(username='cached', email='cached@test.com', password='testpassword123')
+
+    @pytest.fixture
+    def token(self, user):
+        return AccessToken.for_user(user)
+
+    def test_header_auth_needs_no_queries_when_warm(self, api_client, token, django_assert_num_queries):
+        api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        assert api_client.get(URL).status_code == status.HTTP_200_OK
+
+        with django_assert_num_queries(0):
+            response = api_client.get(URL)
+        assert response.data['username'] == 'cached'
+
+    def test_cookie_auth_needs_no_queries_when_warm(self, api_client, token, django_assert_num_queries):
+        api_client.cookies['access_token'] = str(token)
+        assert api_client.get(URL).status_code == status.HTTP_200_OK
+
+        with django_assert_num_queries(0):
+            assert api_client.get(URL).status_code == status.HTTP_200_OK
+
+    def test_entries_are_per_token(self, api_client, user, token):
+        api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        api_client.get(URL)
+        assert get_cached_user(user.id, token['jti'])[1] == user
+        assert get_cached_user(user.id, AccessToken.for_user(user)['jti'])[1] is None
+
+    def test_deactivation_invalidates(self, api_client, user, token, django_capture_on_commit_callbacks):
+        api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        assert api_client.get(URL).status_code == status.HTTP_200_OK
+
+        with django_capture_on_commit_callbacks(execute=True):
+            user.is_active = False
+            user.save()
+        assert api_client.get(URL).status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_password_change_invalidates(self, api_client, user, token, django_capture_on_commit_callbacks):
+        api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        api_client.get(URL)
+        with django_capture_on_commit_callbacks(execute=True):
+            user.set_password('otra-clave-segura')
+            user.save()
+        assert get_cached_user(user.id, token['jti'])[1] is None
@@ -0,0 +1,92 @@
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework import status
+
+from API.user.throttling import SlidingWindowThrottle, shed_counts
+
+User = get_user_model()
+
+LOGIN_URL = '/api/auth/login/'
+
+
+@pytest.mark.django_db
+class TestLoginThrottle:
+
+    @pytest.fixture(autouse=True)
+    def rates(self, settings):
+        settings.AUTH_THROTTLE_RATES = {'login': '3/min', 'reset_send': '2/hour', 'reset_validate': '2/hour'}
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        now = [6000.0]
+        monkeypatch.setattr(SlidingWindowThrottle, 'timer', lambda self: now[0])
+        return now
+
+    @pytest.fixture
+    def user(self):
+        return User.objects.create_user(username='victima', email='victima@test.com', password='testpassword123')
+
+    def login(self, api_client, password='WRONGpassword', ip='10.0.0.1', username='victima'):
+        return api_client.post(LOGIN_URL, {'username': username, 'password': password}, REMOTE_ADDR=ip)
+
+    def test_rejected_before_db_or_hashing(self, api_client, user, clock, django_assert_num_queries, monkeypatch):
+        for _ in range(3):
+            assert self.login(api_client).status_code == status.HTTP_401_UNAUTHORIZED
+
+        def fail(*args, **kwargs):
+            raise AssertionError("no debe calcular el hash")
+        monkeypatch.setattr('django.contrib.auth.hashers.check_password', fail)
+        monkeypatch.setattr('django.contrib.auth.base_user.check_password', fail)
+
+        with django_assert_num_queries(0):
+            response = self.login(api_client, password='testpassword123')
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert int(response['Retry-After']) <= 60
+
+    def test_username_limit_spans_ips(self, api_client, user, clock):
+        for i in range(3):
+            self.login(api_client, ip=f'10.0.0.{i}')
+        assert self.login(api_client, ip='10.0.0.99').status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        # Otra cuenta desde una IP nueva no se ve afectada
+        assert self.login(api_client, ip='10.0.0.100', username='otro').status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_forwarded_for_header_does_not_reset_ip_limit(self, api_client, user, clock):
+        for i in range(3):
+            response = api_client.post(LOGIN_URL, {'username': f'cuenta{i}', 'password': 'x'},
+                                       REMOTE_ADDR='10.0.0.1', HTTP_X_FORWARDED_FOR=f'203.0.113.{i}')
+            assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+        response = api_client.post(LOGIN_URL, {'username': 'cuenta9', 'password': 'x'},
+                                   REMOTE_ADDR='10.0.0.1', HTTP_X_FORWARDED_FOR='203.0.113.99')
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+    def test_window_slides(self, api_client, user, clock):
+        for _ in range(3):
+            self.login(api_client)
+        clock[0] += 60  # comienzo de la siguiente ventana: la anterior pesa por completo
+        assert self.login(api_client).status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+        clock[0] += 45  # solo se solapa un cuarto de la ventana anterior
+        assert self.login(api_client, password='testpassword123').status_code == status.HTTP_200_OK
+
+    def test_reset_endpoints_keyed_by_email(self, api_client, user, clock):
+        for i in range(2):
+            api_client.post('/api/auth/send-reset-code/', {'email': 'Victima@test.com'}, REMOTE_ADDR=f'10.1.0.{i}')
+        response = api_client.post('/api/auth/send-reset-code/', {'email': 'victima@test.com'}, REMOTE_ADDR='10.1.0.9')
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+        payload = {'email': 'victima@test.com', 'reset_code': '000000', 'new_password': 'nueva-clave-123'}
+        for _ in range(2):
+            assert api_client.post('/api/auth/validate-reset-code/', payload).status_code == status.HTTP_400_BAD_REQUEST
+        assert api_client.post('/api/auth/validate-reset-code/', payload).status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+    def test_shed_counters_exposed_to_staff(self, api_client, user, clock):
+        for _ in range(5):
+            self.login(api_client)
+        assert shed_counts()['login'] == {'ip': 2, 'username': 2}
+
+        assert api_client.get('/api/auth/throttle-stats/').status_code == status.HTTP_401_UNAUTHORIZED
+        staff = User.objects.create_user(username='staff', email='staff@test.com', password='x', is_staff=True)
+        api_client.force_authenticate(staff)
+        response = api_client.get('/api/auth/throttle-stats/')
+        assert response.data['shed']['login'] == {'ip': 2, 'username': 2}
@@ -0,0 +1,132 @@
+from datetime import timedelta
+from io import StringIO
+from smtplib import SMTPRecipientsRefused
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework import status
+
+from API.user.mail import dispatch, enqueue_mail
+from API.user.models import OutgoingMail
+
+User = get_user_model()
+
+
+class CountingBackend(EmailBackend):
+    """locmem que cuenta aperturas y rechaza los destinatarios indicados."""
+
+    def __init__(self, reject=(), **kwargs):
+        super().__init__(**kwargs)
+        self.reject = set(reject)
+        self.opened = 0
+
+    def open(self):
+        self.opened += 1
+        return super().open()
+
+    def send_messages(self, messages):
+        for message in messages:
+            if self.reject & set(message.to):
+                raise SMTPRecipientsRefused({address: (550, b'rechazado') for address in message.to})
+        return super().send_messages(messages)
+
+
+class NoReconnectBackend(CountingBackend):
+    """Solo la primera apertura funciona: simula un servidor que se cae a mitad de lote."""
+
+    def open(self):
+        if self.opened:
+            self.opened += 1
+            raise ConnectionRefusedError("servidor caído")
+        return super().open()
+
+
+@pytest.mark.django_db
+class TestMailQueue:
+
+    def make_due(self):
+        OutgoingMail.objects.update(next_attempt_at=timezone.now() - timedelta(seconds=1))
+
+    def test_reset_view_only_enqueues(self, api_client):
+        User.objects.create_user(username='olvido', email='olvido@test.com', password='testpassword123')
+        response = api_client.post('/api/auth/send-reset-code/', {'email': 'olvido@test.com'})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert mail.outbox == []
+        queued = OutgoingMail.objects.get()
+        assert (queued.to, queued.status) == ('olvido@test.com', 'pending')
+        assert User.objects.get(email='olvido@test.com').reset_code in queued.body
+
+    def test_batch_uses_one_connection(self):
+        for i in range(3):
+            enqueue_mail('Asunto', f'Cuerpo {i}', f'cliente{i}@test.com')
+        backend = CountingBackend()
+
+        assert dispatch(connection=backend) == {'sent': 3}
+        assert backend.opened == 1
+        assert [m.to for m in mail.outbox] == [['cliente0@test.com'], ['cliente1@test.com'], ['cliente2@test.com']]
+        assert set(OutgoingMail.objects.values_list('status', flat=True)) == {'sent'}
+
+    def test_failure_retries_with_backoff_then_dies(self, settings):
+        settings.MAIL_QUEUE_MAX_ATTEMPTS = 2
+        enqueue_mail('Asunto', 'Cuerpo', 'malo@test.com')
+        enqueue_mail('Asunto', 'Cuerpo', 'bueno@test.com')
+
+        before = timezone.now()
+        assert dispatch(connection=CountingBackend(reject={'malo@test.com'})) == {'sent': 1, 'retry': 1}
+        failed = OutgoingMail.objects.get(to='malo@test.com')
+        assert failed.status == 'pending' and 'SMTPRecipientsRefused' in failed.last_error
+        assert failed.next_attempt_at >= before + timedelta(seconds=30)
+
+        # Aún no vence el backoff: no se reclama
+        assert dispatch(connection=CountingBackend()) == {}
+
+        self.make_due()
+        assert dispatch(connection=CountingBackend(reject={'malo@test.com'})) == {'dead': 1}
+        assert OutgoingMail.objects.get(to='malo@test.com').status == 'dead'
+
+    def test_command_drains_queue(self):
+        enqueue_mail('Asunto', 'Cuerpo', 'cliente@test.com')
+        out = StringIO()
+        call_command('dispatch_mail', stdout=out)
+
+        assert 'sent: 1' in out.getvalue()
+        assert len(mail.outbox) == 1
+
+    def test_failed_reconnect_keeps_delivered_results(self):
+        for to in ('primero@test.com', 'malo@test.com', 'ultimo@test.com'):
+            enqueue_mail('Asunto', 'Cuerpo', to)
+
+        assert dispatch(connection=NoReconnectBackend(reject={'malo@test.com'})) == {'sent': 1, 'retry': 2}
+        statuses = dict(OutgoingMail.objects.values_list('to', 'status'))
+        assert statuses == {'primero@test.com': 'sent', 'malo@test.com': 'pending', 'ultimo@test.com': 'pending'}
+        assert 'ConnectionRefusedError' in OutgoingMail.objects.get(to='ultimo@test.com').last_error
+        assert [m.to for m in mail.outbox] == [['primero@test.com']]
+
+    def test_retries_stop_at_expiry(self):
+        enqueue_mail('Asunto', 'Cuerpo', 'malo@test.com', expires_at=timezone.now() + timedelta(seconds=50))
+        reject = {'malo@test.com'}
+
+        # Primer reintento a los 30 s: aún dentro de la vigencia
+        assert dispatch(connection=CountingBackend(reject=reject)) == {'retry': 1}
+        self.make_due()
+        # El siguiente esperaría 60 s: llegaría con el código caducado
+        assert dispatch(connection=CountingBackend(reject=reject)) == {'dead': 1}
+
+    def test_expired_mail_is_never_sent(self):
+        enqueue_mail('Asunto', 'Cuerpo', 'tarde@test.com', expires_at=timezone.now() - timedelta(seconds=1))
+
+        assert dispatch(connection=CountingBackend()) == {}
+        assert OutgoingMail.objects.get().status == 'dead'
+        assert mail.outbox == []
+
+    def test_reset_mail_expires_with_the_code(self, api_client):
+        User.objects.create_user(username='olvido', email='olvido@test.com', password='testpassword123')
+        api_client.post('/api/auth/send-reset-code/', {'email': 'olvido@test.com'})
+
+        user = User.objects.get(email='olvido@test.com')
+        assert OutgoingMail.objects.get().expires_at == user.reset_code_created_at + timedelta(minutes=10)
@@ -0,0 +1,101 @@
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework import status
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from API.user.blacklist import BloomFilter, VERSION_KEY, blacklist_filter
+
+User = get_user_model()
+
+URL = '/api/auth/token/refresh/'
+
+
+@pytest.mark.django_db
+class TestTokenBlacklistFilter:
+
+    @pytest.fixture
+    def user(self):
+        return User.objects.create_user(username='refresher', password='testpassword123')
+
+    def test_bloom_filter_has_no_false_negatives(self):
+        bloom = BloomFilter(500)
+        items = [f'jti-{i}' for i in range(500)]
+        for item in items:
+            bloom.add(item)
+        assert all(item in bloom for item in items)
+        false_positives = sum(f'otro-{i}' in bloom for i in range(5000))
+        assert false_positives < 50
+
+    def test_refresh_skips_blacklist_query_on_miss(self, api_client, user, django_assert_num_queries):
+        refresh = str(RefreshToken.for_user(user))
+        assert api_client.post(URL, {'refresh': refresh}).status_code == status.HTTP_200_OK
+
+        # Solo queda la verificación de usuario activo de simplejwt
+        with django_assert_num_queries(1) as context:
+            response = api_client.post(URL, {'refresh': refresh})
+        assert response.status_code == status.HTTP_200_OK
+        assert 'token_blacklist' not in context.captured_queries[0]['sql']
+
+    def test_logout_rejects_later_refresh(self, api_client, user):
+        login = api_client.post('/api/auth/login/', {'username': 'refresher', 'password': 'testpassword123'})
+        refresh = login.data['refresh']
+        assert api_client.post(URL, {'refresh': refresh}).status_code == status.HTTP_200_OK
+
+        api_client.cookies = login.cookies
+        api_client.post('/api/auth/logout-cookie/')
+        assert api_client.post(URL, {'refresh': refresh}).status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_other_process_blacklist_syncs_on_version_bump(self, api_client, user, django_capture_on_commit_callbacks):
+        refresh = RefreshToken.for_user(user)
+        assert api_client.post(URL, {'refresh': str(refresh)}).status_code == status.HTTP_200_OK
+
+        # Lista negra escrita por otro worker: el filtro local no la conoce todavía
+        outstanding = OutstandingToken.objects.get(jti=refresh['jti'])
+        with django_capture_on_commit_callbacks(execute=True):
+            BlacklistedToken.objects.create(token=outstanding)
+        assert cache.get(VERSION_KEY) == 1
+
+        assert api_client.post(URL, {'refresh': str(refresh)}).status_code == status.HTTP_401_UNAUTHORIZED
+        assert blacklist_filter.version == 1
+
+    def test_late_commit_with_lower_id_is_not_missed(self, api_client, user, django_capture_on_commit_callbacks):
+        """En Postgres el id se asigna antes del commit: una fila con id menor puede llegar después."""
+        first, late = RefreshToken.for_user(user), RefreshToken.for_user(user)
+        assert api_client.post(URL, {'refresh': str(late)}).status_code == status.HTTP_200_OK
+
+        with django_capture_on_commit_callbacks(execute=True):
+            BlacklistedToken.objects.create(id=100, token=OutstandingToken.objects.get(jti=first['jti']))
+        assert api_client.post(URL, {'refresh': str(first)}).status_code == status.HTTP_401_UNAUTHORIZED
+
+        with django_capture_on_commit_callbacks(execute=True):
+            BlacklistedToken.objects.create(id=50, token=OutstandingToken.objects.get(jti=late['jti']))
+        assert api_client.post(URL, {'refresh': str(late)}).status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_staleness_tick_rebuilds_without_version_bump(self, api_client, user, settings):
+        settings.TOKEN_BLACKLIST_FILTER_STALENESS = 0
+        refresh = RefreshToken.for_user(user)
+        assert api_client.post(URL, {'refresh': str(refresh)}).status_code == status.HTTP_200_OK
+
+        # Sin aviso por la caché (p. ej. caché no compartida)
+        BlacklistedToken.objects.create(token=OutstandingToken.objects.get(jti=refresh['jti']))
+        assert api_client.post(URL, {'refresh': str(refresh)}).status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_prune_deletes_only_expired_tokens(self, user):
+        expired = OutstandingToken.objects.create(
+            user=user, jti='vencido', token='x', expires_at=timezone.now() - timedelta(days=1),
+        )
+        BlacklistedToken.objects.create(token=expired)
+        live = RefreshToken.for_user(user)
+        BlacklistedToken.objects.create(token=OutstandingToken.objects.get(jti=live['jti']))
+
+        call_command('prune_tokens', batch_size=1, stdout=StringIO())
+
+        assert list(OutstandingToken.objects.values_list('jti', flat=True)) == [live['jti']]
+        assert BlacklistedToken.objects.count() == 1
@@ -127,12 +127,19 @@ export const registerAPI = async (data: RegisterData): Promise<any> => {
 
 /**
  * Lista los productos de un negocio específico.
+ * El endpoint pagina por cursor; se siguen los enlaces `next` hasta el final.
  * @param business_id - ID del negocio
  * @returns Array de productos
  */
 export const listProducts = async (business_id: number): Promise<any> => {
-    const response = await axiosInstance.get(`${LIST_PRODUCTS_URL}${business_id}`);
-    return response.data;
+    const products: any[] = [];
+    let url: string | null = `${LIST_PRODUCTS_URL}${business_id}/`;
+    while (url) {
+        const response: any = await axiosInstance.get(url);
+        products.push(...response.data.results);
+        url = response.data.next;
+    }
+    return products;
 }
 
 /**